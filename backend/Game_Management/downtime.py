@@ -1,44 +1,39 @@
-import cv2
-import numpy as np
 import pytesseract
-import mss
 import time
+import queue
+import sys
+from pathlib import Path
+
+# Shared detection helpers live in backend/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from downtime_monitor import downtime_monitor
 
 # === SETTINGS ===
 pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
-OCR_REGION = {"top": 450, "left": 2050, "width": 500, "height": 500}
-TARGET_PHRASE = "combat report"
-OCR_CONFIG = "--psm 6"
+# Regions, phrases and OCR settings live in detector_profiles.py (DETECTOR_PROFILES env var)
 
-# === LOGIC STATE ===
-was_visible = False
-last_seen_time = None
+def main():
+    # The shared monitor logs appear/disappear itself; we only wait for events
+    token, events = downtime_monitor.subscribe()
+    downtime_monitor.start()
 
-print("[INFO] Watching for 'combat report'...")
+    print("[INFO] Watching for downtime screens...")
 
-with mss.mss() as sct:
     try:
         while True:
-            # Capture and preprocess screen
-            img = np.array(sct.grab(OCR_REGION))
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            _, thresh = cv2.threshold(gray, 180, 255, cv2.THRESH_BINARY)
-
-            # OCR
-            text = pytesseract.image_to_string(thresh, config=OCR_CONFIG).lower()
-
-            if TARGET_PHRASE in text:
-                if not was_visible:
-                    was_visible = True
-                    last_seen_time = time.time()
-                    print(f"[✅] '{TARGET_PHRASE}' appeared at {time.strftime('%H:%M:%S')}")
-            else:
-                if was_visible:
-                    was_visible = False
-                    duration = time.time() - last_seen_time
-                    print(f"[❎] '{TARGET_PHRASE}' disappeared at {time.strftime('%H:%M:%S')} (Visible for {duration:.2f}s)")
-
-            time.sleep(0.1)
+            try:
+                # Timeout keeps Ctrl+C responsive on Windows
+                event = events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            print(f"[EVENT] {event['type']} ({event['label']}, confidence {event['confidence']:.2f})")
 
     except KeyboardInterrupt:
-        print("\n[EXIT] Stopped.")
+        print(f"\n[EXIT] Stopped. Monitor status: {downtime_monitor.get_status()['pipeline']}")
+    finally:
+        downtime_monitor.unsubscribe(token)
+        downtime_monitor.stop()
+
+# The guard matters: the OCR process pool re-imports this module on Windows
+if __name__ == "__main__":
+    main()
@@ -3,59 +3,189 @@ import numpy as np
 import mss
 import time
 import os
+import sys
+import argparse
+import statistics
+from pathlib import Path
+
+# Make the backend modules importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from downtime_detector import OcrDetector, create_detector, DETECTOR_BACKEND, _load_gray_frames
 
 # === SETTINGS ===
 monitor = {"top": 450, "left": 2050, "width": 500, "height": 500}  # initial region
 step = 5  # pixels moved/resized per key press
+FRAMES_DIR = Path(__file__).parent / "frames"
+SWEEP_SIZES = (1.0, 0.8, 0.6, 0.5, 0.4, 0.3, 0.2)  # fractions of the saved frame size
 
 def draw_info(frame, region):
     text = f"Region: top={region['top']} left={region['left']} width={region['width']} height={region['height']}"
     cv2.putText(frame, text, (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,255,0), 2)
 
-def save_current_frame(frame):
-    os.makedirs("frames", exist_ok=True)
-    timestamp = int(time.time())
-    filename = f"frames/region_{timestamp}.jpg"
-    cv2.imwrite(filename, frame)
+def draw_cost(frame, detector, detected, latency_ms, fps):
+    # Red when the phrase is seen, so the region can be checked while moving it
+    color = (0, 0, 255) if detected else (0, 255, 0)
+    text = f"{detector.name}: {latency_ms:.1f} ms  {fps:.0f} FPS  {'DETECTED' if detected else 'not detected'}"
+    cv2.putText(frame, text, (10, 45), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+
+def timed_detect(detector, gray):
+    """(detected, ms) for one frame; OCR skips the frame-change gate so every frame pays full cost"""
+    start = time.perf_counter()
+    if isinstance(detector, OcrDetector):
+        detected = detector.is_match(detector.engine.image_to_string(detector.preprocess(gray)))
+    else:
+        detected, _ = detector.detect(gray)
+    return bool(detected), 1000 * (time.perf_counter() - start)
+
+def save_current_frame(frame, label=None):
+    # label="positive"/"negative" stores training frames for the downtime classifier
+    folder = FRAMES_DIR / label if label else FRAMES_DIR
+    os.makedirs(folder, exist_ok=True)
+    timestamp = int(time.time() * 1000)
+    filename = folder / f"region_{timestamp}.jpg"
+    cv2.imwrite(str(filename), frame)
     print(f"[💾] Saved region to {filename}")
 
-print("[INFO] Starting region tuner. Use arrow keys and WASD to move/resize. Press S to save. Q to quit.")
+def save_template(frame):
+    # Tune the region tightly around the phrase, then save it as the match template
+    os.makedirs(FRAMES_DIR, exist_ok=True)
+    filename = FRAMES_DIR / "template.png"
+    cv2.imwrite(str(filename), cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY))
+    print(f"[💾] Saved detector template to {filename}")
+
+def run_tuner(backend=DETECTOR_BACKEND):
+    print("[INFO] Starting region tuner. Use arrow keys and WASD to move/resize. Press S to save. Q to quit.")
+    print("[INFO] P/N save labeled positive/negative frames, T saves the region as the match template.")
+
+    detector = create_detector(backend=backend)
+    latency_ms = 0.0
+    fps = 0.0
+    last_frame_at = None
+
+    with mss.mss() as sct:
+        try:
+            while True:
+                frame = np.array(sct.grab(monitor))
+
+                # Cost of the configured detector on exactly this region
+                detected, elapsed_ms = timed_detect(detector, cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY))
+                latency_ms = elapsed_ms if latency_ms == 0.0 else 0.8 * latency_ms + 0.2 * elapsed_ms
+                now = time.perf_counter()
+                if last_frame_at is not None:
+                    fps = 0.8 * fps + 0.2 / max(now - last_frame_at, 1e-6)
+                last_frame_at = now
+
+                display = frame.copy()  # keep the overlay out of saved frames
+                draw_info(display, monitor)
+                draw_cost(display, detector, detected, latency_ms, fps)
+                cv2.imshow("Region Tuner", display)
+
+                key = cv2.waitKey(50) & 0xFF
+
+                if key == ord("q"):
+                    break
+                elif key == ord("s"):
+                    save_current_frame(frame)
+                elif key == ord("p"):
+                    save_current_frame(frame, "positive")
+                elif key == ord("n"):
+                    save_current_frame(frame, "negative")
+                elif key == ord("t"):
+                    save_template(frame)
+
+                # === Move region ===
+                elif key == 81:  # ←
+                    monitor["left"] -= step
+                elif key == 83:  # →
+                    monitor["left"] += step
+                elif key == 82:  # ↑
+                    monitor["top"] -= step
+                elif key == 84:  # ↓
+                    monitor["top"] += step
 
-with mss.mss() as sct:
+                # === Resize region ===
+                elif key == ord("w"):
+                    monitor["height"] -= step
+                elif key == ord("s"):
+                    monitor["height"] += step
+                elif key == ord("a"):
+                    monitor["width"] -= step
+                elif key == ord("d"):
+                    monitor["width"] += step
+
+        except KeyboardInterrupt:
+            print("\n[EXIT] Stopped by user.")
+        finally:
+            detector.close()
+
+    cv2.destroyAllWindows()
+
+def center_crop(frame, fraction, center=None):
+    # Crop fraction of the frame size around center (default: frame center), clamped to the frame
+    h, w = frame.shape[:2]
+    ch, cw = max(1, int(h * fraction)), max(1, int(w * fraction))
+    cy, cx = center if center else (h // 2, w // 2)
+    top = min(max(0, cy - ch // 2), h - ch)
+    left = min(max(0, cx - cw // 2), w - cw)
+    return frame[top:top + ch, left:left + cw]
+
+def sweep(backend=DETECTOR_BACKEND, sizes=SWEEP_SIZES, center=None):
+    """Print detector latency vs. recall for shrinking regions over saved frames (headless)"""
+    positives = _load_gray_frames(FRAMES_DIR / "positive")
+    negatives = _load_gray_frames(FRAMES_DIR / "negative")
+    if not positives:
+        print(f"❌ No frames in {FRAMES_DIR / 'positive'} (save some with P first)")
+        return
+
+    print(f"[INFO] Sweeping {len(positives)} positive / {len(negatives)} negative frames with backend '{backend}'")
+    detector = create_detector(backend=backend)
+    print(f"{'size':>6} {'region':>11} {'p50 ms':>8} {'p95 ms':>8} {'recall':>7} {'false+':>7}")
     try:
-        while True:
-            frame = np.array(sct.grab(monitor))
-            draw_info(frame, monitor)
-            cv2.imshow("Region Tuner", frame)
-
-            key = cv2.waitKey(50) & 0xFF
-
-            if key == ord("q"):
-                break
-            elif key == ord("s"):
-                save_current_frame(frame)
-
-            # === Move region ===
-            elif key == 81:  # ←
-                monitor["left"] -= step
-            elif key == 83:  # →
-                monitor["left"] += step
-            elif key == 82:  # ↑
-                monitor["top"] -= step
-            elif key == 84:  # ↓
-                monitor["top"] += step
-
-            # === Resize region ===
-            elif key == ord("w"):
-                monitor["height"] -= step
-            elif key == ord("s"):
-                monitor["height"] += step
-            elif key == ord("a"):
-                monitor["width"] -= step
-            elif key == ord("d"):
-                monitor["width"] += step
-
-    except KeyboardInterrupt:
-        print("\n[EXIT] Stopped by user.")
-
-cv2.destroyAllWindows()
+        for fraction in sizes:
+            hits, timings = 0, []
+            for frame in positives:
+                detected, elapsed_ms = timed_detect(detector, center_crop(frame, fraction, center))
+                hits += detected
+                timings.append(elapsed_ms)
+            false_hits = sum(timed_detect(detector, center_crop(f, fraction, center))[0] for f in negatives)
+
+            h, w = center_crop(positives[0], fraction, center).shape[:2]
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(f"{fraction:>6.0%} {f'{w}x{h}':>11} {statistics.median(timings):>8.2f} {p95:>8.2f} "
+                  f"{hits / len(positives):>7.0%} {false_hits:>7}")
+    finally:
+        detector.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune the downtime capture region")
+    parser.add_argument("--calibrate", metavar="PROFILE",
+                        help="Tighten PROFILE's OCR region from frames saved with P (no capture window)")
+    parser.add_argument("--padding", type=int, help="Pixels kept around the phrase when calibrating")
+    parser.add_argument("--backend", default=DETECTOR_BACKEND, help="Detector backend to measure (default: DOWNTIME_DETECTOR)")
+    parser.add_argument("--sweep", action="store_true",
+                        help="Headless: print latency vs. recall for shrinking regions over saved frames")
+    parser.add_argument("--center", help="Sweep crop center as x,y in saved-frame pixels (default: frame center)")
+    args = parser.parse_args()
+
+    if args.sweep:
+        center = None
+        if args.center:
+            x, y = (int(v) for v in args.center.split(","))
+            center = (y, x)
+        sweep(args.backend, center=center)
+        return
+
+    if args.calibrate:
+        # Frames in frames/positive must have been saved with the profile's built-in region
+        import region_calibration
+        argv = [args.calibrate, "--frames", str(FRAMES_DIR / "positive"), "--negatives", str(FRAMES_DIR / "negative")]
+        if args.padding is not None:
+            argv += ["--padding", str(args.padding)]
+        sys.exit(region_calibration.main(argv))
+
+    run_tuner(args.backend)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Adaptive sampling rate for the downtime monitor.
+
+Polling at a fixed rate wastes CPU while nothing can change (early in a
+round, right after the combat report appeared) and is no faster when a
+transition is actually due. AdaptiveSampler learns how long rounds
+(combat report hidden) and death screens (combat report visible) usually
+last from the appear/disappear timestamps the monitor logs, polls slowly
+through the stable part of each state and switches to the fast rate once
+the state is old enough that a transition is expected.
+"""
+
+import threading
+import time
+from collections import deque
+
+FAST_INTERVAL = 1 / 30
+SLOW_INTERVAL = 0.25   # never slower than this, so an unexpected death is still caught quickly
+HISTORY_SIZE = 20      # durations remembered per state
+MIN_HISTORY = 3        # samples needed before a state's duration is trusted
+LEAD_FACTOR = 0.8      # go fast once a state reaches 80% of its shortest typical duration
+
+
+class AdaptiveSampler:
+    def __init__(self, fast_interval: float = FAST_INTERVAL, slow_interval: float = SLOW_INTERVAL,
+                 history_size: int = HISTORY_SIZE, lead_factor: float = LEAD_FACTOR):
+        self.fast_interval = fast_interval
+        self.slow_interval = max(slow_interval, fast_interval)
+        self.lead_factor = lead_factor
+
+        # Durations (seconds) of past states: True = combat report visible
+        self.history = {
+            True: deque(maxlen=history_size),
+            False: deque(maxlen=history_size)
+        }
+        self.state = False
+        self.state_since = None  # the state we start in has no known start time
+        self.lock = threading.Lock()
+
+        # Counters
+        self.fast_ticks = 0
+        self.slow_ticks = 0
+
+    def record_transition(self, visible: bool, timestamp: float = None):
+        """
+        Record an appear (visible=True) or disappear (visible=False) event
+
+        Args:
+            visible (bool): New state of the downtime screen
+            timestamp (float): time.time() of the transition (default: now)
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self.lock:
+            if visible == self.state:
+                return
+            if self.state_since is not None:
+                self.history[self.state].append(timestamp - self.state_since)
+            self.state = visible
+            self.state_since = timestamp
+
+    def expected_window_start(self, state: bool):
+        """Elapsed time in `state` after which a transition becomes likely, or None if unknown"""
+        durations = sorted(self.history[state])
+        if len(durations) < MIN_HISTORY:
+            return None
+        # 10th percentile: transitions before this are rare
+        shortest_typical = durations[int(len(durations) * 0.1)]
+        return shortest_typical * self.lead_factor
+
+    def next_interval(self, now: float = None) -> float:
+        """Seconds to wait before the next capture"""
+        now = time.time() if now is None else now
+        with self.lock:
+            window_start = self.expected_window_start(self.state)
+            elapsed = now - self.state_since if self.state_since is not None else 0.0
+
+        if window_start is None or self.state_since is None or elapsed >= window_start:
+            self.fast_ticks += 1
+            return self.fast_interval
+
+        self.slow_ticks += 1
+        # Never sleep past the start of the expected transition window
+        return min(self.slow_interval, max(self.fast_interval, window_start - elapsed))
+
+    def get_stats(self) -> dict:
+        """Learned durations and how often each rate was used"""
+        with self.lock:
+            rounds = list(self.history[False])
+            deaths = list(self.history[True])
+        total = self.fast_ticks + self.slow_ticks
+        return {
+            "avg_round_s": round(sum(rounds) / len(rounds), 2) if rounds else None,
+            "avg_downtime_s": round(sum(deaths) / len(deaths), 2) if deaths else None,
+            "fast_ticks": self.fast_ticks,
+            "slow_ticks": self.slow_ticks,
+            "slow_ratio": round(self.slow_ticks / total, 3) if total > 0 else 0.0
+        }
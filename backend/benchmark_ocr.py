@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-frame OCR latency of the persistent engines vs pytesseract
+
+The baseline is the monitor's original call, pytesseract.image_to_string
+with "--psm 6" and no whitelist. The engines (whitelisted, as the monitor
+uses them) are separate rows, so the whitelist's effect is visible too.
+
+Usage:
+    python benchmark_ocr.py [frames] [image_path]
+
+Without an image, a synthetic 500x500 "COMBAT REPORT" region is used.
+"""
+
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+import pytesseract
+
+from ocr_engine import PytesseractEngine, TesserocrEngine, CApiEngine
+
+class BaselineOcr:
+    """The original per-frame call: a tesseract subprocess, --psm 6, no whitelist"""
+    name = "baseline"
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        return pytesseract.image_to_string(image, config="--psm 6")
+
+    def close(self):
+        pass
+
+ENGINES = [
+    ("baseline", BaselineOcr),
+    ("pytesseract+wl", lambda: PytesseractEngine(psm=6)),
+    ("tesserocr+wl", lambda: TesserocrEngine(psm=6)),
+    ("capi+wl", lambda: CApiEngine(psm=6))
+]
+
+def make_region() -> np.ndarray:
+    """Thresholded 500x500 region with the combat report banner"""
+    region = np.zeros((500, 500), dtype=np.uint8)
+    cv2.putText(region, "COMBAT REPORT", (40, 260), cv2.FONT_HERSHEY_SIMPLEX, 1.4, 255, 3)
+    return region
+
+def bench_engine(engine, image: np.ndarray, frames: int) -> dict:
+    """Time engine.image_to_string over `frames` calls (after one warm-up call)"""
+    text = engine.image_to_string(image)
+    timings = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        engine.image_to_string(image)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "text": text.strip(),
+        "mean": statistics.mean(timings),
+        "p50": timings[len(timings) // 2],
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    }
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    if len(sys.argv) > 2:
+        image = cv2.imread(sys.argv[2], cv2.IMREAD_GRAYSCALE)
+        _, image = cv2.threshold(image, 180, 255, cv2.THRESH_BINARY)
+    else:
+        image = make_region()
+
+    print(f"⏱️ OCR benchmark: {frames} frames, region {image.shape[1]}x{image.shape[0]}")
+    print(f"{'engine':<16} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'speedup':>8}  text")
+
+    baseline = None
+    for label, create in ENGINES:
+        try:
+            engine = create()
+        except Exception as e:
+            print(f"{label:<16} unavailable: {e}")
+            continue
+
+        try:
+            result = bench_engine(engine, image, frames)
+        except Exception as e:
+            print(f"{label:<16} failed: {e}")
+            continue
+        finally:
+            engine.close()
+
+        if label == "baseline":
+            baseline = result["mean"]
+        speedup = f"{baseline / result['mean']:.1f}x" if baseline else "-"
+        print(f"{label:<16} {result['mean']:>9.2f} {result['p50']:>9.2f} {result['p95']:>9.2f} "
+              f"{speedup:>8}  {result['text']!r}")
+
+if __name__ == "__main__":
+    main()
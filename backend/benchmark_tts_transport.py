@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-utterance requests.post vs the pooled TTSTransport session
+over a full lesson, against a local stub of the Eleven Labs endpoint.
+
+The stub can add a delay to every new connection (--connect-delay) to
+model the TCP+TLS handshake round trips to api.elevenlabs.io, and can
+serve HTTPS with a throwaway self-signed certificate (--tls, needs the
+openssl command).
+
+Usage:
+    python benchmark_tts_transport.py [--utterances 40] [--connect-delay 150] [--tls]
+"""
+
+import argparse
+import ssl
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+from tts_transport import TTSTransport
+
+AUDIO_BYTES = 32 * 1024  # roughly 2 s of MP3 per utterance
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # no delayed-ACK stalls between headers and body
+    connect_delay = 0.0
+    connections = 0
+
+    def setup(self):
+        StubHandler.connections += 1
+        time.sleep(self.connect_delay)  # stands in for handshake round trips
+        super().setup()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Length", str(AUDIO_BYTES))
+        self.end_headers()
+        self.wfile.write(b"\0" * AUDIO_BYTES)
+
+    def log_message(self, *args):
+        pass
+
+
+def self_signed_cert(directory: Path):
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                    "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+                    "-keyout", str(key), "-out", str(cert)], check=True, capture_output=True)
+    return cert, key
+
+
+def run(post, url: str, utterances: int, verify) -> list:
+    timings = []
+    for i in range(utterances):
+        start = time.perf_counter()
+        response = post(url, json={"text": f"Bullet point {i}", "model_id": "stub"}, verify=verify)
+        response.content
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-request TTS HTTP connections")
+    parser.add_argument("--utterances", type=int, default=40, help="Requests in one lesson")
+    parser.add_argument("--connect-delay", type=float, default=150.0, help="ms added to every new connection")
+    parser.add_argument("--tls", action="store_true", help="Serve HTTPS with a self-signed certificate")
+    args = parser.parse_args()
+
+    StubHandler.connect_delay = args.connect_delay / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    verify = True
+    with tempfile.TemporaryDirectory() as tmp:
+        scheme = "http"
+        if args.tls:
+            cert, key = self_signed_cert(Path(tmp))
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(cert, key)
+            server.socket = context.wrap_socket(server.socket, server_side=True)
+            verify, scheme = str(cert), "https"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"{scheme}://127.0.0.1:{server.server_port}/v1/text-to-speech/stub"
+
+        print(f"⏱️ TTS transport benchmark: {args.utterances} utterances, "
+              f"{args.connect_delay:.0f} ms per new connection, {scheme.upper()}")
+        print(f"{'client':<14} {'total s':>8} {'mean ms':>9} {'p95 ms':>9} {'connections':>12}")
+
+        results = {}
+        transport = TTSTransport()
+        for name, post in (("requests.post", requests.post), ("TTSTransport", transport.post)):
+            StubHandler.connections = 0
+            timings = run(post, url, args.utterances, verify)
+            timings_sorted = sorted(timings)
+            results[name] = sum(timings)
+            print(f"{name:<14} {sum(timings) / 1000:>8.2f} {statistics.mean(timings):>9.1f} "
+                  f"{timings_sorted[min(len(timings) - 1, int(len(timings) * 0.95))]:>9.1f} "
+                  f"{StubHandler.connections:>12}")
+        transport.close()
+        server.shutdown()
+
+    saved = results["requests.post"] - results["TTSTransport"]
+    print(f"\n💡 Pooling saved {saved / 1000:.2f}s over the lesson "
+          f"({results['requests.post'] / max(results['TTSTransport'], 1e-9):.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
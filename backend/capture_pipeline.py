@@ -0,0 +1,373 @@
+"""
+Pipelined capture -> preprocess -> detect stages for downtime detection.
+
+The original monitor loop ran grab, cvtColor, threshold and OCR serially and
+then slept 100 ms, so the sample rate was 1/(ocr_time + 100ms) and drifted
+with machine load. Here:
+- a capture thread grabs the region at a fixed rate, wraps the mss BGRA
+  buffer with np.frombuffer (no copy) and converts it straight into a
+  preallocated grayscale slot of a ring (FrameRing)
+- a processing thread always takes the freshest frame from the ring
+  (older, unprocessed frames are dropped) and runs the detector
+- OCR detectors hand the thresholded frame to a small process pool, so
+  tesseract is not GIL-bound; fast detectors run inline. Workers are
+  spawned (on every OS, as on Windows) and run ocr_worker.py, which has
+  no side-effectful imports. A spawned process also re-imports the
+  parent's main script (as __mp_main__), so the modules the servers
+  import do their setup lazily (tts_client.init(), the API clients)
+
+Verdicts are yielded from CapturePipeline.results() together with the
+capture timestamp, and get_stats() reports achieved FPS and end-to-end
+detection latency. The capture rate follows an AdaptiveSampler unless
+adaptive=False.
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import mss
+import numpy as np
+import pytesseract
+
+import ocr_worker
+from adaptive_sampler import AdaptiveSampler
+from downtime_detector import OcrDetector
+from latency_stats import detection_stats
+
+RING_SIZE = 4
+CAPTURE_FPS = 30
+OCR_WORKERS = 2
+STATS_WINDOW = 60  # samples kept for FPS / latency averages
+
+
+class FrameRing:
+    """Fixed-size ring of preallocated grayscale frame buffers"""
+
+    def __init__(self, height: int, width: int, size: int = RING_SIZE):
+        if size < 2:
+            raise ValueError("FrameRing needs at least 2 slots")
+        self.buffers = np.zeros((size, height, width), dtype=np.uint8)
+        self.timestamps = np.zeros(size, dtype=np.float64)
+        self.size = size
+        self.next_seq = 0
+        self.lock = threading.Lock()
+        self.new_frame = threading.Condition(self.lock)
+
+    def write(self, frame: np.ndarray, timestamp: float) -> int:
+        """Convert a captured frame to grayscale into the next slot, overwriting the oldest"""
+        # Readers only touch the newest published slot, never this one
+        slot = self.next_seq % self.size
+        to_gray(frame, dst=self.buffers[slot])
+        with self.lock:
+            seq = self.next_seq
+            self.timestamps[slot] = timestamp
+            self.next_seq += 1
+            self.new_frame.notify_all()
+        return seq
+
+    def latest(self, after_seq: int = -1, timeout: float = 0.5, out: np.ndarray = None):
+        """
+        Wait for and return the freshest frame newer than after_seq
+
+        Args:
+            out (np.ndarray): Preallocated (height, width) buffer to copy into
+                              (default: a new array)
+
+        Returns:
+            tuple: (seq, timestamp, frame_copy) or None on timeout
+        """
+        with self.lock:
+            if not self.new_frame.wait_for(lambda: self.next_seq - 1 > after_seq, timeout):
+                return None
+            seq = self.next_seq - 1
+            slot = seq % self.size
+            timestamp = self.timestamps[slot]
+            # Copy under the lock so the capture thread can't overwrite it mid-read
+            if out is None:
+                frame = self.buffers[slot].copy()
+            else:
+                np.copyto(out, self.buffers[slot])
+                frame = out
+        return seq, timestamp, frame
+
+
+def to_gray(frame: np.ndarray, dst: np.ndarray = None) -> np.ndarray:
+    """
+    Grayscale of a BGRA capture (also accepts BGR video frames and gray images)
+
+    Args:
+        dst (np.ndarray): Preallocated (height, width) uint8 output; without
+                          one, gray input is returned as is
+    """
+    if frame.ndim == 2:
+        if dst is None:
+            return frame
+        np.copyto(dst, frame)
+        return dst
+    code = cv2.COLOR_BGRA2GRAY if frame.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+    return cv2.cvtColor(frame, code, dst=dst)
+
+
+def bgra_view(shot) -> np.ndarray:
+    """(height, width, 4) view of an mss screenshot's raw BGRA bytes, without copying"""
+    return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+
+class _RateCounter:
+    """Rolling FPS over the last STATS_WINDOW events"""
+
+    def __init__(self):
+        self.times = deque(maxlen=STATS_WINDOW)
+
+    def tick(self, now: float):
+        self.times.append(now)
+
+    def fps(self) -> float:
+        if len(self.times) < 2:
+            return 0.0
+        span = self.times[-1] - self.times[0]
+        return (len(self.times) - 1) / span if span > 0 else 0.0
+
+
+class CapturePipeline:
+    def __init__(self, region: dict, detector, capture_fps: float = None,
+                 ring_size: int = RING_SIZE, ocr_workers: int = OCR_WORKERS,
+                 adaptive: bool = True, source=None):
+        """
+        Args:
+            region (dict): mss region {"top", "left", "width", "height"}
+            detector (DowntimeDetector): Detector run on each processed frame
+            capture_fps (float): Capture rate of the grab thread (default:
+                                 CAPTURE_FPS for OCR, the detector's poll rate otherwise)
+            ring_size (int): Number of preallocated frame buffers
+            ocr_workers (int): OCR process pool size (0 runs OCR inline)
+            adaptive (bool): Let an AdaptiveSampler slow capture down during
+                             stable states; feed it via sampler.record_transition()
+            source (callable): Returns the next frame (BGRA, BGR or gray, region-sized)
+                               instead of grabbing the region with mss, e.g. a replay
+        """
+        self.region = region
+        self.detector = detector
+        self.source = source
+        self.ocr_workers = ocr_workers if isinstance(detector, OcrDetector) else 0
+        if capture_fps is None:
+            capture_fps = CAPTURE_FPS if self.ocr_workers > 0 else 1.0 / detector.poll_interval
+        self.capture_interval = 1.0 / capture_fps
+        self.sampler = AdaptiveSampler(fast_interval=self.capture_interval) if adaptive else None
+        self.ring = FrameRing(region["height"], region["width"], ring_size)
+
+        self.running = False
+        self.capture_thread = None
+        self.process_thread = None
+        self.pool = None
+        self.in_flight = 0
+        self.in_flight_lock = threading.Lock()
+        self.last_result_seq = -1
+        # The OCR gate is used by the processing thread and by OCR completion callbacks
+        self.gate_lock = threading.Lock()
+        self.verdicts = queue.Queue(maxsize=ring_size)
+
+        # Stats
+        self.capture_rate = _RateCounter()
+        self.process_rate = _RateCounter()
+        self.latencies = deque(maxlen=STATS_WINDOW)
+        self.frames_captured = 0
+        self.frames_processed = 0
+        self.frames_dropped = 0
+
+    def start(self):
+        """Start the capture and processing threads (and the OCR pool)"""
+        if self.running:
+            return
+        self.running = True
+
+        if self.ocr_workers > 0:
+            # Spawn, not fork: the parent has capture, audio and HTTP threads running
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.ocr_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=ocr_worker.init,
+                initargs=(self.detector.psm, pytesseract.pytesseract.tesseract_cmd)
+            )
+
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.process_thread = threading.Thread(target=self._process_loop, daemon=True)
+        self.capture_thread.start()
+        self.process_thread.start()
+
+    def stop(self):
+        """Stop all stages and release the detector"""
+        self.running = False
+        for thread in (self.capture_thread, self.process_thread):
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(timeout=2)
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+        self.detector.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def results(self, keep_running=lambda: True):
+        """
+        Yield (detected, confidence, captured_at) as verdicts arrive
+
+        Args:
+            keep_running (callable): Polled between verdicts; iteration stops when it returns False
+        """
+        while self.running and keep_running():
+            try:
+                yield self.verdicts.get(timeout=0.2)
+            except queue.Empty:
+                continue
+
+    def _capture_loop(self):
+        if self.source is not None:
+            self._capture_frames(self.source)
+            return
+        with mss.mss() as sct:
+            self._capture_frames(lambda: sct.grab(self.region))
+
+    def _capture_frames(self, grab):
+        next_grab = time.perf_counter()
+        while self.running:
+            try:
+                start = time.perf_counter()
+                shot = grab()
+                now = time.perf_counter()
+                detection_stats.record("grab", start, now)
+                frame = shot if isinstance(shot, np.ndarray) else bgra_view(shot)
+                converted = time.perf_counter()
+                detection_stats.record("numpy", now, converted)
+                self.ring.write(frame, now)
+                detection_stats.record("grayscale", converted)
+                self.frames_captured += 1
+                self.capture_rate.tick(now)
+            except Exception as e:
+                print(f"❌ Error capturing frame: {e}")
+
+            # Schedule that doesn't drift with grab time
+            next_grab += self.sampler.next_interval() if self.sampler else self.capture_interval
+            delay = next_grab - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_grab = time.perf_counter()
+
+    def _process_loop(self):
+        last_seq = -1
+        # Frames are already gray in the ring; one reused buffer holds the current one
+        gray = np.empty(self.ring.buffers.shape[1:], dtype=np.uint8)
+        try:
+            while self.running:
+                item = self.ring.latest(last_seq, out=gray)
+                if item is None:
+                    continue
+                seq, captured_at, _ = item
+
+                # Everything between the last processed frame and this one is stale
+                if last_seq >= 0:
+                    self.frames_dropped += seq - last_seq - 1
+                last_seq = seq
+
+                if self.pool is None:
+                    start = time.perf_counter()
+                    detected, confidence = self.detector.detect(gray)
+                    detection_stats.record("detect", start)
+                    self._emit(seq, captured_at, detected, confidence)
+                else:
+                    self._process_ocr(seq, captured_at, gray)
+        except Exception as e:
+            print(f"❌ Error in detection pipeline: {e}")
+            self.running = False
+
+    def _process_ocr(self, seq: int, captured_at: float, gray: np.ndarray):
+        with self.in_flight_lock:
+            if self.in_flight >= self.ocr_workers:
+                # All workers busy: this frame is dropped in favour of a fresher one
+                self.frames_dropped += 1
+                return
+
+        gate = self.detector.gate
+        start = time.perf_counter()
+        thresh = self.detector.preprocess(gray)
+        detection_stats.record("threshold", start)
+        with self.gate_lock:
+            skip = not gate.should_ocr(thresh)
+            verdict = gate.last_verdict
+            signature = gate.pending_signature
+        if skip:
+            if verdict is not None:
+                self._emit(seq, captured_at, verdict, 1.0 if verdict else 0.0)
+            return
+
+        with self.in_flight_lock:
+            self.in_flight += 1
+        submitted_at = time.perf_counter()
+        # The executor pickles arguments later on its own thread, and thresh is a reused buffer
+        future = self.pool.submit(ocr_worker.run, thresh.copy())
+        future.add_done_callback(
+            lambda f: self._on_ocr_done(f, seq, captured_at, signature, submitted_at)
+        )
+
+    def _on_ocr_done(self, future, seq: int, captured_at: float, signature: np.ndarray,
+                     submitted_at: float):
+        # Includes the round trip to the worker process
+        detection_stats.record("ocr", submitted_at)
+        with self.in_flight_lock:
+            self.in_flight -= 1
+            if future.cancelled() or seq < self.last_result_seq:
+                return  # a fresher frame already produced a verdict
+            self.last_result_seq = seq
+
+        try:
+            detected = self.detector.is_match(future.result())
+        except Exception as e:
+            print(f"❌ OCR worker failed: {e}")
+            return
+
+        with self.gate_lock:
+            self.detector.gate.record(detected, signature)
+        self._emit(seq, captured_at, detected, 1.0 if detected else 0.0)
+
+    def _emit(self, seq: int, captured_at: float, detected: bool, confidence: float):
+        now = time.perf_counter()
+        self.frames_processed += 1
+        self.process_rate.tick(now)
+        self.latencies.append(now - captured_at)
+        detection_stats.record("end_to_end", captured_at, now)
+
+        verdict = (bool(detected), float(confidence), captured_at)
+        try:
+            self.verdicts.put_nowait(verdict)
+        except queue.Full:
+            # Consumer is behind: drop the oldest verdict, keep the freshest
+            try:
+                self.verdicts.get_nowait()
+            except queue.Empty:
+                pass
+            self.verdicts.put_nowait(verdict)
+
+    def get_stats(self) -> dict:
+        """Achieved FPS, drop counts and end-to-end detection latency"""
+        latencies = sorted(self.latencies)
+        return {
+            "capture_fps": round(self.capture_rate.fps(), 1),
+            "process_fps": round(self.process_rate.fps(), 1),
+            "frames_captured": self.frames_captured,
+            "frames_processed": self.frames_processed,
+            "frames_dropped": self.frames_dropped,
+            "latency_ms_avg": round(1000 * sum(latencies) / len(latencies), 1) if latencies else 0.0,
+            "latency_ms_max": round(1000 * latencies[-1], 1) if latencies else 0.0,
+            "sampler": self.sampler.get_stats() if self.sampler else None
+        }
@@ -0,0 +1,275 @@
+"""
+Detector profile registry: several games / phrases / regions from one capture.
+
+A DetectorProfile describes one downtime screen (game, phrase, screen
+region, backend). MultiProfileDetector grabs the union bounding box of all
+active profiles once per tick (the capture pipeline does the grab) and
+evaluates every profile against a slice of that single buffer, so adding a
+profile costs one detector call, not another capture or thread.
+
+Profiles are selected with the DETECTOR_PROFILES environment variable
+(comma-separated names, default "valorant_combat_report"). If a calibration
+file written by region_calibration.py exists for a profile, its tightened
+region and OCR downscale factor replace the built-in ones.
+"""
+
+import copy
+import json
+import os
+
+import numpy as np
+
+from downtime_detector import DowntimeDetector, create_detector, OCR_CONFIG, FRAMES_DIR, TEMPLATE_PATH, CLASSIFIER_PATH
+from ocr_engine import create_ocr_engine, psm_from_config
+
+ACTIVE_PROFILES = os.getenv("DETECTOR_PROFILES", "valorant_combat_report")
+
+
+class DetectorProfile:
+    def __init__(self, name: str, game: str, phrase: str, region: dict, backend: str = "auto",
+                 config: str = OCR_CONFIG, template_path=None, classifier_path=None,
+                 scale: float = 1.0, calibration_path=None):
+        """
+        Args:
+            name (str): Registry key
+            game (str): Game the screen belongs to
+            phrase (str): Lower-case phrase the OCR backend looks for
+            region (dict): mss region {"top", "left", "width", "height"} in screen coordinates
+            backend (str): Detector backend, see downtime_detector.create_detector
+            config (str): pytesseract-style config (only the --psm is used)
+            template_path / classifier_path: Reference data for the fast backends
+                (default: frames/<name>_template.png and frames/<name>_classifier.npz)
+            scale (float): Downscale factor applied before OCR
+            calibration_path: Calibrated region/scale file (default: frames/<name>_calibration.json)
+        """
+        self.name = name
+        self.game = game
+        self.phrase = phrase
+        self.region = region
+        self.backend = backend
+        self.config = config
+        self.template_path = template_path or FRAMES_DIR / f"{name}_template.png"
+        self.classifier_path = classifier_path or FRAMES_DIR / f"{name}_classifier.npz"
+        self.scale = scale
+        self.calibration_path = calibration_path or FRAMES_DIR / f"{name}_calibration.json"
+
+
+PROFILES = {}
+
+
+def register_profile(profile: DetectorProfile):
+    """Add (or replace) a profile in the registry"""
+    PROFILES[profile.name] = profile
+
+
+def load_calibration(profile: DetectorProfile):
+    """
+    Read a profile's calibration file
+
+    Returns:
+        dict: {"region", "scale", ...} or None if the profile isn't calibrated
+    """
+    path = profile.calibration_path
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            calibration = json.load(f)
+        region = {key: int(calibration["region"][key]) for key in ("top", "left", "width", "height")}
+        scale = float(calibration.get("scale", 1.0))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"⚠️ Ignoring invalid calibration {path}: {e}")
+        return None
+    if calibration.get("phrase", profile.phrase) != profile.phrase:
+        print(f"⚠️ Ignoring calibration {path}: it was made for '{calibration['phrase']}'")
+        return None
+    return {**calibration, "region": region, "scale": scale}
+
+
+def calibrated(profile: DetectorProfile) -> DetectorProfile:
+    """Copy of the profile with its calibrated region and scale applied (if any)"""
+    calibration = load_calibration(profile)
+    if calibration is None:
+        return profile
+    profile = copy.copy(profile)
+    profile.region = calibration["region"]
+    profile.scale = calibration["scale"]
+    print(f"📐 Calibrated region for {profile.name}: {profile.region} (OCR scale {profile.scale})")
+    return profile
+
+
+def get_profiles(names=None, use_calibration: bool = True) -> list:
+    """
+    Look up profiles by name
+
+    Args:
+        names (str | list): Comma-separated string or list of names (default: ACTIVE_PROFILES)
+        use_calibration (bool): Apply calibration files written by region_calibration.py
+
+    Returns:
+        list: DetectorProfile objects, in the order given
+    """
+    if names is None:
+        names = ACTIVE_PROFILES
+    if isinstance(names, str):
+        names = [n.strip() for n in names.split(",") if n.strip()]
+
+    profiles = []
+    for name in names:
+        if name not in PROFILES:
+            print(f"⚠️ Unknown detector profile: {name}")
+            continue
+        profile = PROFILES[name]
+        profiles.append(calibrated(profile) if use_calibration else profile)
+    return profiles
+
+
+# === BUILT-IN PROFILES (2560x1440 layouts) ===
+register_profile(DetectorProfile(
+    name="valorant_combat_report",
+    game="valorant",
+    phrase="combat report",
+    region={"top": 450, "left": 2050, "width": 500, "height": 500},
+    template_path=TEMPLATE_PATH,
+    classifier_path=CLASSIFIER_PATH
+))
+register_profile(DetectorProfile(
+    name="you_are_dead",
+    game="generic",
+    phrase="you are dead",
+    region={"top": 560, "left": 980, "width": 600, "height": 160},
+    backend="ocr"
+))
+register_profile(DetectorProfile(
+    name="respawning_in",
+    game="generic",
+    phrase="respawning in",
+    region={"top": 760, "left": 980, "width": 600, "height": 120},
+    backend="ocr"
+))
+
+
+def union_region(regions: list) -> dict:
+    """Smallest mss region that covers every region in the list"""
+    top = min(r["top"] for r in regions)
+    left = min(r["left"] for r in regions)
+    bottom = max(r["top"] + r["height"] for r in regions)
+    right = max(r["left"] + r["width"] for r in regions)
+    return {"top": top, "left": left, "width": right - left, "height": bottom - top}
+
+
+class MultiProfileDetector(DowntimeDetector):
+    """Runs every profile's detector on its slice of the union capture"""
+    name = "multi"
+
+    def __init__(self, profiles: list):
+        if not profiles:
+            raise ValueError("❌ MultiProfileDetector needs at least one profile")
+
+        self.profiles = profiles
+        self.region = union_region([p.region for p in profiles])
+
+        # One OCR engine per page segmentation mode, shared by all OCR profiles
+        self.engines = {}
+        self.detectors = []
+        self.slices = []
+        for profile in profiles:
+            detector = create_detector(
+                backend=profile.backend,
+                phrase=profile.phrase,
+                config=profile.config,
+                template_path=profile.template_path,
+                classifier_path=profile.classifier_path,
+                engine=self._engine_for(profile),
+                ocr_scale=profile.scale
+            )
+            self.detectors.append(detector)
+
+            # Offsets of this profile inside the union buffer
+            top = profile.region["top"] - self.region["top"]
+            left = profile.region["left"] - self.region["left"]
+            self.slices.append((slice(top, top + profile.region["height"]),
+                                slice(left, left + profile.region["width"])))
+
+        self.poll_interval = min(d.poll_interval for d in self.detectors)
+        self.last_results = {}
+        self.last_match = None
+
+    @property
+    def label(self):
+        # The phrase of the profile that matched last, else all phrases
+        for profile in self.profiles:
+            if profile.name == self.last_match:
+                return profile.phrase
+        return " / ".join(p.phrase for p in self.profiles)
+
+    def _engine_for(self, profile: DetectorProfile):
+        if profile.backend != "ocr":
+            return None  # fast backends may still fall back to OCR with their own engine
+        psm = psm_from_config(profile.config)
+        if psm not in self.engines:
+            self.engines[psm] = create_ocr_engine(psm=psm)
+        return self.engines[psm]
+
+    def detect(self, gray: np.ndarray):
+        """
+        Evaluate all profiles on one union-region frame
+
+        Returns:
+            tuple: (any profile detected, highest confidence); per-profile
+                   results are kept in last_results and the first matching
+                   profile name in last_match
+        """
+        detected_any = False
+        best_confidence = 0.0
+        self.last_match = None
+
+        for profile, detector, (rows, cols) in zip(self.profiles, self.detectors, self.slices):
+            detected, confidence = detector.detect(gray[rows, cols])
+            self.last_results[profile.name] = (detected, confidence)
+            best_confidence = max(best_confidence, confidence)
+            if detected and not detected_any:
+                detected_any = True
+                self.last_match = profile.name
+
+        return detected_any, best_confidence
+
+    def reset(self):
+        for detector in self.detectors:
+            detector.reset()
+
+    def close(self):
+        for detector in self.detectors:
+            detector.close()
+        for engine in self.engines.values():
+            engine.close()
+
+
+def create_profile_detector(names=None):
+    """
+    Build the detector for the active profiles
+
+    Returns:
+        tuple: (detector, capture region). A single profile gets its plain
+               detector (so OCR keeps the capture pipeline's process pool);
+               several profiles share one MultiProfileDetector.
+    """
+    profiles = get_profiles(names)
+    if not profiles:
+        raise ValueError("❌ No detector profiles selected")
+
+    print(f"🎯 Detector profiles: {', '.join(p.name for p in profiles)}")
+    if len(profiles) == 1:
+        profile = profiles[0]
+        detector = create_detector(
+            backend=profile.backend,
+            phrase=profile.phrase,
+            config=profile.config,
+            template_path=profile.template_path,
+            classifier_path=profile.classifier_path,
+            ocr_scale=profile.scale
+        )
+        return detector, profile.region
+
+    detector = MultiProfileDetector(profiles)
+    return detector, detector.region
@@ -0,0 +1,314 @@
+"""
+Pluggable downtime detector backends.
+
+Every backend takes the grayscale capture region and returns
+(detected, confidence):
+- TemplateMatchDetector: cv2.matchTemplate against a reference crop saved by
+  Game_Management/region_tuner.py (sub-millisecond)
+- ClassifierDetector: tiny linear classifier on HOG features, trained on
+  labeled frames saved by region_tuner.py (sub-millisecond)
+- OcrDetector: the original tesseract phrase search, kept as the fallback
+"""
+
+import os
+from pathlib import Path
+
+import time
+
+import cv2
+import numpy as np
+
+from frame_gate import FrameChangeGate
+from latency_stats import detection_stats
+from ocr_engine import create_ocr_engine, psm_from_config
+
+TARGET_PHRASE = "combat report"
+OCR_CONFIG = "--psm 6"
+BINARY_THRESHOLD = 180
+
+FRAMES_DIR = Path(__file__).parent / "Game_Management" / "frames"
+TEMPLATE_PATH = FRAMES_DIR / "template.png"
+CLASSIFIER_PATH = FRAMES_DIR / "classifier.npz"
+
+# "auto" picks the fastest backend whose reference data exists
+DETECTOR_BACKEND = os.getenv("DOWNTIME_DETECTOR", "auto")
+
+OCR_POLL_INTERVAL = 0.1
+FAST_POLL_INTERVAL = 1 / 30
+
+
+class DowntimeDetector:
+    """Base class for downtime detector backends"""
+    name = "base"
+    poll_interval = OCR_POLL_INTERVAL
+    label = TARGET_PHRASE  # what the detector looks for, used in log lines
+
+    def detect(self, gray: np.ndarray):
+        """
+        Check a grayscale frame for the downtime screen
+
+        Args:
+            gray (np.ndarray): Single-channel capture of the detection region
+
+        Returns:
+            tuple: (detected: bool, confidence: float in [0, 1])
+        """
+        raise NotImplementedError
+
+    def reset(self):
+        """Drop any per-stream state (called when the monitor restarts)"""
+        pass
+
+    def close(self):
+        """Release backend resources (called when the monitor thread exits)"""
+        pass
+
+
+class OcrDetector(DowntimeDetector):
+    """Tesseract phrase search, gated so static frames skip OCR"""
+    name = "ocr"
+    poll_interval = OCR_POLL_INTERVAL
+
+    def __init__(self, phrase: str = TARGET_PHRASE, config: str = OCR_CONFIG,
+                 threshold: int = BINARY_THRESHOLD, engine=None, scale: float = 1.0):
+        self.phrase = phrase
+        self.label = phrase
+        self.threshold = threshold
+        self.psm = psm_from_config(config)
+        self.scale = scale  # downscale before OCR (set by region calibration)
+        self.gate = FrameChangeGate()
+        self._engine = engine
+        self._small_buf = None
+        self._thresh_buf = None
+
+    @property
+    def engine(self):
+        # Created on first use so the tesseract handle lives in the detecting thread
+        if self._engine is None:
+            self._engine = create_ocr_engine(psm=self.psm)
+        return self._engine
+
+    def preprocess(self, gray: np.ndarray) -> np.ndarray:
+        """Downscale and binarize the region the way OCR expects it (into reused buffers)"""
+        if self.scale != 1.0:
+            size = (max(1, int(gray.shape[1] * self.scale)), max(1, int(gray.shape[0] * self.scale)))
+            if self._small_buf is None or self._small_buf.shape != (size[1], size[0]):
+                self._small_buf = np.empty((size[1], size[0]), dtype=np.uint8)
+            gray = cv2.resize(gray, size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+
+        if self._thresh_buf is None or self._thresh_buf.shape != gray.shape:
+            self._thresh_buf = np.empty(gray.shape, dtype=np.uint8)
+        cv2.threshold(gray, self.threshold, 255, cv2.THRESH_BINARY, dst=self._thresh_buf)
+        return self._thresh_buf
+
+    def is_match(self, text: str) -> bool:
+        """Check OCR output for the target phrase"""
+        return self.phrase in text.lower()
+
+    def detect(self, gray: np.ndarray):
+        start = time.perf_counter()
+        thresh = self.preprocess(gray)
+        detection_stats.record("threshold", start)
+
+        if self.gate.should_ocr(thresh):
+            start = time.perf_counter()
+            text = self.engine.image_to_string(thresh)
+            detection_stats.record("ocr", start)
+            self.gate.record(self.is_match(text))
+
+        detected = bool(self.gate.last_verdict)
+        return detected, 1.0 if detected else 0.0
+
+    def reset(self):
+        self.gate.reset()
+
+    def close(self):
+        if self._engine is not None:
+            self._engine.close()
+            self._engine = None
+
+
+class TemplateMatchDetector(DowntimeDetector):
+    """Normalized cross-correlation against a reference crop of the phrase"""
+    name = "template"
+    poll_interval = FAST_POLL_INTERVAL
+
+    def __init__(self, template_path=TEMPLATE_PATH, match_threshold: float = 0.7,
+                 scale: float = 0.5):
+        template = cv2.imread(str(template_path), cv2.IMREAD_GRAYSCALE)
+        if template is None:
+            raise FileNotFoundError(f"❌ Template not found: {template_path}")
+
+        self.match_threshold = match_threshold
+        self.scale = scale
+        self.template = self._downscale(template)
+
+        # Work buffers sized on the first frame and reused afterwards
+        self._frame_shape = None
+        self._small_buf = None
+        self._result_buf = None
+
+    def _downscale(self, gray: np.ndarray, dst: np.ndarray = None) -> np.ndarray:
+        if self.scale == 1.0:
+            return gray
+        size = (max(1, int(gray.shape[1] * self.scale)), max(1, int(gray.shape[0] * self.scale)))
+        return cv2.resize(gray, size, dst=dst, interpolation=cv2.INTER_AREA)
+
+    def _allocate(self, shape):
+        self._frame_shape = shape
+        h, w = int(shape[0] * self.scale), int(shape[1] * self.scale)
+        th, tw = self.template.shape[:2]
+        self._small_buf = np.empty((max(1, h), max(1, w)), dtype=np.uint8) if self.scale != 1.0 else None
+        self._result_buf = np.empty((max(1, h - th + 1), max(1, w - tw + 1)), dtype=np.float32)
+
+    def detect(self, gray: np.ndarray):
+        if gray.shape != self._frame_shape:
+            self._allocate(gray.shape)
+
+        frame = self._downscale(gray, dst=self._small_buf)
+        th, tw = self.template.shape[:2]
+        if frame.shape[0] < th or frame.shape[1] < tw:
+            return False, 0.0
+
+        result = cv2.matchTemplate(frame, self.template, cv2.TM_CCOEFF_NORMED, result=self._result_buf)
+        _, max_val, _, _ = cv2.minMaxLoc(result)
+        confidence = float(max(0.0, max_val))
+        return confidence >= self.match_threshold, confidence
+
+
+class ClassifierDetector(DowntimeDetector):
+    """Ridge-regression linear classifier over HOG features of the region"""
+    name = "classifier"
+    poll_interval = FAST_POLL_INTERVAL
+
+    WINDOW = (64, 64)
+    CELL = 8
+    BINS = 9
+
+    def __init__(self, model_path=CLASSIFIER_PATH):
+        if not Path(model_path).exists():
+            raise FileNotFoundError(f"❌ Classifier model not found: {model_path}")
+
+        model = np.load(model_path)
+        self.weights = model["weights"]
+        self.bias = float(model["bias"])
+
+    def detect(self, gray: np.ndarray):
+        score = float(hog_features(gray) @ self.weights + self.bias)
+        confidence = float(np.clip(score, 0.0, 1.0))
+        return score >= 0.5, confidence
+
+
+def hog_features(gray: np.ndarray) -> np.ndarray:
+    """
+    HOG-style feature vector of a frame resized to the classifier window
+
+    Unsigned gradient orientations are histogrammed per 8x8 cell and the
+    whole vector is L2-normalized. Done in NumPy because cv2.HOGDescriptor
+    is not available in every OpenCV build.
+    """
+    cell, bins = ClassifierDetector.CELL, ClassifierDetector.BINS
+    window = cv2.resize(gray, ClassifierDetector.WINDOW, interpolation=cv2.INTER_AREA).astype(np.float32)
+    gx = cv2.Sobel(window, cv2.CV_32F, 1, 0, ksize=1)
+    gy = cv2.Sobel(window, cv2.CV_32F, 0, 1, ksize=1)
+    magnitude, angle = cv2.cartToPolar(gx, gy, angleInDegrees=True)
+
+    bin_idx = ((angle % 180.0) * (bins / 180.0)).astype(np.int32) % bins
+    h, w = window.shape
+    cell_idx = (np.arange(h)[:, None] // cell) * (w // cell) + (np.arange(w)[None, :] // cell)
+    flat_idx = (cell_idx * bins + bin_idx).ravel()
+
+    features = np.bincount(flat_idx, weights=magnitude.ravel(),
+                           minlength=(h // cell) * (w // cell) * bins)
+    norm = np.linalg.norm(features)
+    return (features / norm if norm > 0 else features).astype(np.float32)
+
+
+def _load_gray_frames(directory: Path) -> list:
+    frames = []
+    for path in sorted(directory.glob("*")):
+        if path.suffix.lower() not in (".png", ".jpg", ".jpeg"):
+            continue
+        img = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+        if img is not None:
+            frames.append(img)
+    return frames
+
+
+def train_classifier(frames_dir=FRAMES_DIR, model_path=CLASSIFIER_PATH, ridge: float = 1.0) -> bool:
+    """
+    Train the pixel classifier from labeled frames
+
+    Expects frames_dir/positive/*.jpg (downtime screen visible) and
+    frames_dir/negative/*.jpg (gameplay), as saved by region_tuner.py.
+
+    Returns:
+        bool: True if a model was written, False otherwise
+    """
+    frames_dir = Path(frames_dir)
+    positives = _load_gray_frames(frames_dir / "positive")
+    negatives = _load_gray_frames(frames_dir / "negative")
+
+    if not positives or not negatives:
+        print(f"❌ Need positive and negative frames in {frames_dir} (got {len(positives)}/{len(negatives)})")
+        return False
+
+    X = np.stack([hog_features(f) for f in positives + negatives]).astype(np.float64)
+    y = np.array([1.0] * len(positives) + [0.0] * len(negatives))
+
+    # Closed-form ridge regression with the bias fit on centered data
+    x_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    Xc = X - x_mean
+    weights = np.linalg.solve(Xc.T @ Xc + ridge * np.eye(X.shape[1]), Xc.T @ (y - y_mean))
+    bias = y_mean - x_mean @ weights
+
+    np.savez(model_path, weights=weights.astype(np.float32), bias=bias)
+    print(f"✅ Trained classifier on {len(positives)} positive / {len(negatives)} negative frames -> {model_path}")
+    return True
+
+
+def create_detector(backend: str = DETECTOR_BACKEND, phrase: str = TARGET_PHRASE,
+                    config: str = OCR_CONFIG, template_path=TEMPLATE_PATH,
+                    classifier_path=CLASSIFIER_PATH, engine=None, ocr_scale: float = 1.0) -> DowntimeDetector:
+    """
+    Build a downtime detector
+
+    Args:
+        backend (str): "template", "classifier", "ocr" or "auto" (fastest
+                       backend with reference data, falling back to OCR)
+        template_path / classifier_path: Reference data for the fast backends
+        engine (OcrEngine): Shared OCR engine for the OCR backend (optional)
+        ocr_scale (float): Downscale factor applied before OCR
+
+    Returns:
+        DowntimeDetector: The selected detector
+    """
+    if backend in ("auto", "template"):
+        try:
+            detector = TemplateMatchDetector(template_path)
+            detector.label = phrase
+            print(f"🔍 Using template-match downtime detector ('{phrase}')")
+            return detector
+        except FileNotFoundError as e:
+            if backend == "template":
+                raise
+            print(f"⚠️ {e}")
+
+    if backend in ("auto", "classifier"):
+        try:
+            detector = ClassifierDetector(classifier_path)
+            detector.label = phrase
+            print(f"🔍 Using classifier downtime detector ('{phrase}')")
+            return detector
+        except FileNotFoundError as e:
+            if backend == "classifier":
+                raise
+            print(f"⚠️ {e}")
+
+    print(f"🔍 Using OCR downtime detector ('{phrase}')")
+    return OcrDetector(phrase=phrase, config=config, engine=engine, scale=ocr_scale)
+
+
+if __name__ == "__main__":
+    train_classifier()
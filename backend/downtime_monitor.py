@@ -0,0 +1,190 @@
+"""
+Shared downtime monitor service.
+
+One capture/detect loop per process, shared by every consumer (the
+teaching loop, the Flask server, standalone scripts). Consumers subscribe
+with a callback or get a queue, and receive event dicts:
+
+    {
+        "type": "downtime_start" | "downtime_end",
+        "timestamp": time.time() of the transition,
+        "captured_at": perf_counter() capture time of the deciding frame,
+        "confidence": detector confidence for that frame,
+        "label": what was detected (e.g. "combat report"),
+        "duration": seconds the screen was visible (downtime_end only)
+    }
+
+start()/stop() are reference-counted: the loop runs while at least one
+consumer has started it. Raw detector verdicts go through a
+TransitionDebouncer first, so one misread frame doesn't publish an event.
+"""
+
+import queue
+import threading
+import time
+
+from capture_pipeline import CapturePipeline
+from detector_profiles import create_profile_detector
+from latency_stats import detection_stats
+from transition_debouncer import TransitionDebouncer
+
+DOWNTIME_START = "downtime_start"
+DOWNTIME_END = "downtime_end"
+
+
+class DowntimeMonitor:
+    def __init__(self, profiles=None, debouncer: TransitionDebouncer = None):
+        """
+        Args:
+            profiles (str | list): Detector profile names (default: DETECTOR_PROFILES)
+            debouncer (TransitionDebouncer): Filter between raw verdicts and
+                                             events (default: DEBOUNCE_* settings)
+        """
+        self.profiles = profiles
+        self.debouncer = debouncer or TransitionDebouncer()
+        self.lock = threading.Lock()
+        self.subscribers = {}
+        self.next_token = 0
+        self.users = 0
+
+        self.thread = None
+        self.stop_event = None
+        self.pipeline = None
+        self.running = False
+        self.is_downtime = False
+        self.downtime_since = None
+        self.last_event = None
+
+    # === SUBSCRIPTIONS ===
+    def subscribe(self, callback=None):
+        """
+        Register for downtime events
+
+        Args:
+            callback (callable): Called with each event dict on the monitor
+                                 thread. If omitted, events go to a queue.
+
+        Returns:
+            tuple: (token for unsubscribe(), queue.Queue or None)
+        """
+        events = None if callback else queue.Queue()
+        with self.lock:
+            token = self.next_token
+            self.next_token += 1
+            self.subscribers[token] = callback or events.put
+        return token, events
+
+    def unsubscribe(self, token: int):
+        """Stop delivering events to a subscriber"""
+        with self.lock:
+            self.subscribers.pop(token, None)
+
+    def _publish(self, event: dict):
+        self.last_event = event
+        with self.lock:
+            handlers = list(self.subscribers.values())
+        for handler in handlers:
+            # Delay from capturing the deciding frame to the subscriber being called
+            detection_stats.record("event_to_callback", event["captured_at"])
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"❌ Error in downtime subscriber: {e}")
+
+    # === LIFECYCLE ===
+    def start(self):
+        """Start the capture loop (or join the one already running)"""
+        with self.lock:
+            self.users += 1
+            if self.running:
+                return
+            self.running = True
+            # Each run gets its own stop flag so a restart can't revive a dying loop
+            self.stop_event = threading.Event()
+            self.thread = threading.Thread(target=self._run, args=(self.stop_event,), daemon=True)
+
+        print("🎮 Starting downtime monitor...")
+        self.thread.start()
+
+    def stop(self):
+        """Release this consumer's hold; the loop stops when nobody needs it"""
+        with self.lock:
+            self.users = max(0, self.users - 1)
+            if self.users > 0 or not self.running:
+                return
+            self.running = False
+            self.stop_event.set()
+            thread = self.thread
+
+        print("⏹️ Stopping downtime monitor...")
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=3)
+
+    def _run(self, stop_event: threading.Event):
+        detector, region = create_profile_detector(self.profiles)
+        pipeline = CapturePipeline(region, detector)
+        self.pipeline = pipeline
+        self.debouncer.reset()
+
+        try:
+            pipeline.start()
+            for detected, confidence, captured_at in pipeline.results(lambda: not stop_event.is_set()):
+                detection_stats.maybe_print_summary()
+                visible = self.debouncer.update(detected, confidence, captured_at)
+                if visible is not None and visible != self.is_downtime:
+                    self._on_transition(visible, confidence, captured_at, detector.label)
+
+        except Exception as e:
+            print(f"❌ Error in downtime detection: {e}")
+        finally:
+            print(f"📈 Detection pipeline stats: {pipeline.get_stats()}")
+            print(f"🧹 Debounce stats: {self.debouncer.get_stats()}")
+            print(detection_stats.summary_line())
+            pipeline.stop()
+            with self.lock:
+                if self.stop_event is stop_event:
+                    self.running = False
+            # Consumers must not be left thinking downtime is still on
+            if self.is_downtime:
+                self._on_transition(False, 0.0, time.perf_counter(), detector.label)
+
+    def _on_transition(self, visible: bool, confidence: float, captured_at: float, label: str):
+        now = time.time()
+        event = {
+            "type": DOWNTIME_START if visible else DOWNTIME_END,
+            "timestamp": now,
+            "captured_at": captured_at,
+            "confidence": confidence,
+            "label": label
+        }
+
+        if visible:
+            self.is_downtime = True
+            self.downtime_since = now
+            print(f"[✅] '{label}' appeared at {time.strftime('%H:%M:%S')}")
+        else:
+            self.is_downtime = False
+            event["duration"] = now - self.downtime_since if self.downtime_since else 0.0
+            self.downtime_since = None
+            print(f"[❎] '{label}' disappeared at {time.strftime('%H:%M:%S')} (Visible for {event['duration']:.2f}s)")
+
+        if self.pipeline and self.pipeline.sampler:
+            self.pipeline.sampler.record_transition(visible, now)
+        self._publish(event)
+
+    def get_status(self) -> dict:
+        """Current state plus pipeline stats"""
+        return {
+            "running": self.running,
+            "is_downtime": self.is_downtime,
+            "downtime_since": self.downtime_since,
+            "subscribers": len(self.subscribers),
+            "last_event": self.last_event,
+            "pipeline": self.pipeline.get_stats() if self.pipeline else None,
+            "debounce": self.debouncer.get_stats(),
+            "latency_ms": detection_stats.summary()
+        }
+
+
+# Create global instance: one capture loop per process
+downtime_monitor = DowntimeMonitor()
@@ -0,0 +1,157 @@
+"""
+Downtime-budget-aware scheduling of teaching utterances.
+
+Reading bullets strictly in order wastes the tail of most windows: a
+12 s bullet that doesn't fit the 5 s left is deferred while a 4 s one
+right behind it would have. DowntimeScheduler estimates how much of the
+current window is left from the lengths of past windows (the combat
+report durations in downtime_end events), then solves a small 0/1
+knapsack over the durations of the next few bullets of the current
+section and reads the earliest bullet of the best-filling set first.
+Only bullets of the same section are considered and the head of the
+queue can be passed over at most MAX_DEFERRALS times, so the lesson
+order stays mostly intact.
+
+The headline metric is utilization: seconds taught per second of
+downtime.
+"""
+
+import math
+import threading
+from collections import deque
+
+from lesson_chunks import EXPECTED_DOWNTIME
+
+HISTORY_SIZE = 20       # past downtime windows the estimate is based on
+BUDGET_QUANTILE = 0.25  # conservative: three quarters of the windows lasted at least this long
+LOOKAHEAD = 4           # upcoming bullets considered at once
+MAX_DEFERRALS = 2       # times the next bullet in order may be passed over
+RESOLUTION = 0.1        # knapsack granularity in seconds
+
+
+def plan(durations: list, budget: float, resolution: float = RESOLUTION) -> list:
+    """
+    0/1 knapsack: the items whose total duration comes closest to the budget without exceeding it
+
+    Args:
+        durations (list): Item lengths in seconds, in reading order
+        budget (float): Seconds available
+        resolution (float): Granularity in seconds (durations are rounded up)
+
+    Returns:
+        list: Indices of the chosen items in ascending order; on ties earlier items win
+    """
+    capacity = int(budget / resolution + 1e-9)
+    if capacity <= 0:
+        return []
+    # best[c] = (filled units, chosen indices) using at most c units
+    best = [(0, ())] * (capacity + 1)
+    for i, duration in enumerate(durations):
+        weight = max(1, math.ceil(duration / resolution - 1e-9))
+        for c in range(capacity, weight - 1, -1):
+            filled = best[c - weight][0] + weight
+            if filled > best[c][0]:
+                best[c] = (filled, best[c - weight][1] + (i,))
+    return list(best[capacity][1])
+
+
+class DowntimeScheduler:
+    def __init__(self, history_size: int = HISTORY_SIZE, quantile: float = BUDGET_QUANTILE,
+                 default: float = EXPECTED_DOWNTIME, max_deferrals: int = MAX_DEFERRALS):
+        """
+        Args:
+            history_size (int): Past windows kept for the estimate
+            quantile (float): Quantile of the past window lengths used as the expected length
+            default (float): Expected window length before any window was seen
+            max_deferrals (int): Times the next bullet in order may be passed over
+        """
+        self.quantile = quantile
+        self.default = default
+        self.max_deferrals = max_deferrals
+        self.lock = threading.Lock()
+        self.history = deque(maxlen=history_size)
+        self.deferrals = 0
+
+        # Utilization
+        self.windows = 0
+        self.downtime_seconds = 0.0
+        self.taught_seconds = 0.0
+        self.reordered = 0
+
+    def record_window(self, duration: float):
+        """Add a finished downtime window (seconds the combat report was visible)"""
+        if duration <= 0:
+            return
+        with self.lock:
+            self.history.append(duration)
+            self.windows += 1
+            self.downtime_seconds += duration
+
+    def record_taught(self, seconds: float):
+        """Add audio that was played to the end"""
+        with self.lock:
+            self.taught_seconds += seconds
+
+    def expected_window(self, elapsed: float = 0.0) -> float:
+        """
+        Expected length of a window that has already been open for elapsed seconds
+
+        Returns:
+            float: Seconds (elapsed itself once the window outlasted every past one)
+        """
+        with self.lock:
+            history = list(self.history)
+        if not history:
+            return max(self.default, elapsed)
+        longer = sorted(d for d in history if d > elapsed)
+        if not longer:
+            return elapsed
+        return longer[int(len(longer) * self.quantile)]
+
+    def remaining(self, elapsed: float) -> float:
+        """Expected seconds left in a window that has been open for elapsed seconds"""
+        return self.expected_window(elapsed) - elapsed
+
+    def choose(self, durations: list, elapsed: float) -> int:
+        """
+        Pick the next bullet to read
+
+        Args:
+            durations (list): Audio lengths of the next bullets of the current section, in order
+            elapsed (float): Seconds since the current window opened
+
+        Returns:
+            int: Index into durations (0 keeps the reading order)
+        """
+        if len(durations) <= 1 or self.deferrals >= self.max_deferrals:
+            self.deferrals = 0
+            return 0
+        chosen = plan(durations[:LOOKAHEAD], self.remaining(elapsed))
+        choice = chosen[0] if chosen else 0
+        if choice:
+            self.deferrals += 1
+            self.reordered += 1
+        else:
+            self.deferrals = 0
+        return choice
+
+    def utilization(self) -> float:
+        """Seconds taught per second of downtime"""
+        with self.lock:
+            return self.taught_seconds / self.downtime_seconds if self.downtime_seconds else 0.0
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            stats = {
+                "windows": self.windows,
+                "downtime_seconds": round(self.downtime_seconds, 1),
+                "taught_seconds": round(self.taught_seconds, 1),
+                "reordered": self.reordered
+            }
+        stats["utilization"] = round(self.utilization(), 3)
+        stats["expected_window"] = round(self.expected_window(), 1)
+        return stats
+
+
+# Shared by every TeachingBot
+downtime_scheduler = DowntimeScheduler()
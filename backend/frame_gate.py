@@ -0,0 +1,107 @@
+"""
+Frame-change gate for downtime detection.
+
+The OCR region is identical frame to frame for most of a match, so running
+tesseract on every grab is wasted work. FrameChangeGate keeps a small
+downsampled signature of the last OCR'd (thresholded) frame and only lets a
+new frame through to OCR when it differs meaningfully from that signature.
+"""
+
+import cv2
+import numpy as np
+
+# Signature grid: a 500x500 region becomes 32x32 cells of ~15x15 pixels
+SIGNATURE_SIZE = (32, 32)
+# A cell counts as changed when its mean intensity moves by this much (0-255)
+CELL_THRESHOLD = 24
+# Number of changed cells needed before the frame is OCR'd again
+MIN_CHANGED_CELLS = 2
+# Force a fresh OCR after this many skipped frames, even if nothing changed
+MAX_SKIPPED_FRAMES = 50
+
+
+class FrameChangeGate:
+    def __init__(self, signature_size=SIGNATURE_SIZE, cell_threshold=CELL_THRESHOLD,
+                 min_changed_cells=MIN_CHANGED_CELLS, max_skipped_frames=MAX_SKIPPED_FRAMES):
+        self.signature_size = signature_size
+        self.cell_threshold = cell_threshold
+        self.min_changed_cells = min_changed_cells
+        self.max_skipped_frames = max_skipped_frames
+
+        self.last_signature = None
+        self.last_verdict = None
+        self.pending_signature = None
+        self.skipped_frames = 0
+
+        # Reused every frame so the gate doesn't allocate on the hot path
+        w, h = signature_size
+        self._signature_buf = np.zeros((h, w), dtype=np.uint8)
+        self._diff_buf = np.zeros((h, w), dtype=np.uint8)
+        self._changed_buf = np.zeros((h, w), dtype=np.uint8)
+
+        # Counters
+        self.ocr_runs = 0
+        self.ocr_skipped = 0
+
+    def signature(self, frame: np.ndarray, dst: np.ndarray = None) -> np.ndarray:
+        """Downsample a single-channel frame into a small uint8 signature grid"""
+        return cv2.resize(frame, self.signature_size, dst=dst, interpolation=cv2.INTER_AREA)
+
+    def should_ocr(self, frame: np.ndarray) -> bool:
+        """
+        Decide whether a frame needs OCR.
+
+        Args:
+            frame (np.ndarray): Thresholded single-channel frame
+
+        Returns:
+            bool: True if the frame changed since the last OCR'd frame (call
+                  record() with the new verdict), False if last_verdict can be reused
+        """
+        signature = self.signature(frame, dst=self._signature_buf)
+
+        if self.last_signature is None or self.last_verdict is None:
+            changed = True
+        elif self.skipped_frames >= self.max_skipped_frames:
+            changed = True
+        else:
+            cv2.absdiff(signature, self.last_signature, dst=self._diff_buf)
+            cv2.threshold(self._diff_buf, self.cell_threshold, 1, cv2.THRESH_BINARY, dst=self._changed_buf)
+            changed = cv2.countNonZero(self._changed_buf) >= self.min_changed_cells
+
+        if changed:
+            # Only frames that go to OCR pay for a signature copy
+            self.pending_signature = signature.copy()
+            self.ocr_runs += 1
+        else:
+            self.skipped_frames += 1
+            self.ocr_skipped += 1
+        return changed
+
+    def record(self, verdict, signature: np.ndarray = None):
+        """
+        Store the verdict for the frame last passed through should_ocr()
+
+        Pass the frame's signature (pending_signature right after should_ocr)
+        when OCR runs asynchronously and other frames may be gated meanwhile.
+        """
+        self.last_signature = self.pending_signature if signature is None else signature
+        self.last_verdict = verdict
+        self.pending_signature = None
+        self.skipped_frames = 0
+
+    def reset(self):
+        """Forget the last OCR'd frame so the next frame is always OCR'd"""
+        self.last_signature = None
+        self.last_verdict = None
+        self.pending_signature = None
+        self.skipped_frames = 0
+
+    def get_stats(self) -> dict:
+        """Return OCR run/skip counters"""
+        total = self.ocr_runs + self.ocr_skipped
+        return {
+            "ocr_runs": self.ocr_runs,
+            "ocr_skipped": self.ocr_skipped,
+            "skip_ratio": (self.ocr_skipped / total) if total > 0 else 0.0
+        }
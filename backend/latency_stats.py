@@ -0,0 +1,98 @@
+"""
+Hot-path latency instrumentation for the detection loop.
+
+Each stage (grab, numpy, grayscale, threshold, ocr, detect, callback, ...)
+keeps its last WINDOW samples in a preallocated NumPy ring, so recording a
+sample is a couple of array writes and never allocates. Percentiles are
+only computed when someone asks for a summary (the Flask endpoint or the
+periodic log line).
+
+Usage:
+    start = time.perf_counter()
+    ...stage work...
+    detection_stats.record("grab", start)
+"""
+
+import threading
+import time
+
+import numpy as np
+
+WINDOW = 1024  # samples kept per stage
+SUMMARY_INTERVAL = 30.0  # seconds between periodic summary lines
+
+
+class _StageRing:
+    def __init__(self, size: int):
+        self.samples = np.zeros(size, dtype=np.float32)
+        self.size = size
+        self.count = 0
+
+    def add(self, value_ms: float):
+        self.samples[self.count % self.size] = value_ms
+        self.count += 1
+
+    def values(self) -> np.ndarray:
+        return self.samples[:min(self.count, self.size)].copy()
+
+
+class LatencyStats:
+    def __init__(self, window: int = WINDOW):
+        self.window = window
+        self.stages = {}
+        self.lock = threading.Lock()
+        self.last_summary = time.perf_counter()
+
+    def record(self, stage: str, start: float, end: float = None):
+        """
+        Record one stage duration
+
+        Args:
+            stage (str): Stage name
+            start (float): time.perf_counter() at stage start
+            end (float): time.perf_counter() at stage end (default: now)
+        """
+        end = time.perf_counter() if end is None else end
+        ring = self.stages.get(stage)
+        if ring is None:
+            with self.lock:
+                ring = self.stages.setdefault(stage, _StageRing(self.window))
+        ring.add((end - start) * 1000.0)
+
+    def summary(self) -> dict:
+        """Per-stage {count, p50, p95, p99, max} in milliseconds over the rolling window"""
+        result = {}
+        for stage, ring in list(self.stages.items()):
+            values = ring.values()
+            if values.size == 0:
+                continue
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            result[stage] = {
+                "count": ring.count,
+                "p50": round(float(p50), 3),
+                "p95": round(float(p95), 3),
+                "p99": round(float(p99), 3),
+                "max": round(float(values.max()), 3)
+            }
+        return result
+
+    def summary_line(self) -> str:
+        """One-line p50/p95/p99 summary for logs"""
+        parts = [f"{stage} {s['p50']:.1f}/{s['p95']:.1f}/{s['p99']:.1f}"
+                 for stage, s in self.summary().items()]
+        return "⏱️ Detection latency ms (p50/p95/p99): " + (", ".join(parts) if parts else "no samples")
+
+    def maybe_print_summary(self, interval: float = SUMMARY_INTERVAL):
+        """Print summary_line() at most once per interval"""
+        now = time.perf_counter()
+        if now - self.last_summary >= interval:
+            self.last_summary = now
+            print(self.summary_line())
+
+    def reset(self):
+        with self.lock:
+            self.stages = {}
+
+
+# Create global instance shared by the detection stages
+detection_stats = LatencyStats()
@@ -0,0 +1,52 @@
+"""
+Sentence-sized teaching utterances.
+
+A bullet point can run to several sentences; read as one clip, a bullet
+that doesn't finish before the death screen closes is thrown away and
+replayed. TeachingBot instead speaks one sentence at a time, each
+synthesized and cached on its own, and only starts a sentence whose audio
+fits in what is left of the downtime window.
+"""
+
+import os
+import re
+
+EXPECTED_DOWNTIME = float(os.getenv("EXPECTED_DOWNTIME", "15"))  # seconds a downtime window usually lasts
+SPEECH_CHARS_PER_SECOND = 14.0  # duration estimate for sentences not synthesized yet
+MIN_CHUNK_CHARS = 12            # shorter fragments ("e.g.", "Dr.") are joined to the next sentence
+
+# Whitespace after ., ! or ? (optionally followed by a closing quote/bracket)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|(?<=[.!?][\"')\]])\s+")
+
+
+def split_sentences(text: str, min_chars: int = MIN_CHUNK_CHARS) -> list:
+    """
+    Split text into sentence-sized utterances
+
+    Args:
+        text (str): Text to split
+        min_chars (int): Fragments shorter than this are joined to the next sentence
+
+    Returns:
+        list: Non-empty chunks that join back into the text
+    """
+    chunks = []
+    for part in _SENTENCE_END.split(text.strip()):
+        part = part.strip()
+        if not part:
+            continue
+        if chunks and len(chunks[-1]) < min_chars:
+            chunks[-1] = f"{chunks[-1]} {part}"
+        else:
+            chunks.append(part)
+    return chunks
+
+
+def estimate_duration(text: str) -> float:
+    """Rough spoken length in seconds, for sentences without audio yet"""
+    return len(text) / SPEECH_CHARS_PER_SECOND
+
+
+def fits_remaining(duration: float, elapsed: float, expected: float = EXPECTED_DOWNTIME) -> bool:
+    """Whether a clip of duration seconds fits in a window that has been open for elapsed seconds"""
+    return duration <= expected - elapsed
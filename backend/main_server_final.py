@@ -7,18 +7,19 @@ Runs Vellum workflow and uses TTS to read through learning content during downti
 import time
 import json
 import threading
-import cv2
-import numpy as np
 import pytesseract
-import mss
 from main_vellum import run_vellum_workflow
-from tts_client import speak, stop, is_speaking
+from tts_client import (init as init_tts, speak_async, stop, pause, resume, prefetch, clear_prefetch, compile_lesson,
+                        clip_duration, get_stats as get_tts_stats)
+from tts_prefetch import PREFETCH_DEPTH
+from tts_pack import COMPILE_LESSONS
+from lesson_chunks import split_sentences, estimate_duration, fits_remaining
+from downtime_scheduler import downtime_scheduler, LOOKAHEAD
+from downtime_monitor import downtime_monitor, DOWNTIME_START
 
 # === DOWNTIME DETECTION SETTINGS ===
 pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
-OCR_REGION = {"top": 450, "left": 2050, "width": 500, "height": 500}
-TARGET_PHRASE = "combat report"
-OCR_CONFIG = "--psm 6"
+# Regions, phrases and OCR settings live in detector_profiles.py (DETECTOR_PROFILES env var)
 
 class TeachingBot:
     def __init__(self):
@@ -27,10 +28,20 @@ class TeachingBot:
         self.current_bullet_index = 0
         self.is_downtime = False
         self.teaching_active = False
-        self.downtime_thread = None
+        self.downtime_subscription = None
+        self.subscription_lock = threading.Lock()  # teaching loop and stop requests both unsubscribe
         self.teaching_thread = None
         self.unread_bullet_points = []
         self.current_bullet_index = 0
+        self.resume_baseline = {}
+        
+        # Sentences of the bullet being read, and how many are done
+        self.current_chunks = []
+        self.current_chunk_index = 0
+        
+        # When the current downtime window opened, and sentences spoken in it
+        self.downtime_started_at = 0.0
+        self.window_chunks = 0
         
     def load_content(self, text_content: str) -> bool:
         """
@@ -53,6 +64,12 @@ class TeachingBot:
             
             # Prepare unread bullet points
             self.prepare_unread_bullet_points()
+            
+            # Start synthesizing the first bullets while the game is running,
+            # then the rest of the lesson into one pack
+            self.prefetch_upcoming(None)
+            if COMPILE_LESSONS:
+                self.compile_lesson_audio()
             return True
         else:
             print("❌ Failed to load learning content")
@@ -61,6 +78,11 @@ class TeachingBot:
     def prepare_unread_bullet_points(self):
         """Prepare list of all unread bullet points"""
         self.unread_bullet_points = []
+        self.current_chunks = []
+        self.current_chunk_index = 0
+        
+        # Audio synthesized for the previous content is no longer wanted
+        clear_prefetch()
         
         for subtopic_idx, subtopic in enumerate(self.learning_content.get('subtopic', [])):
             summaries = subtopic.get('Summaries', [])
@@ -87,82 +109,163 @@ class TeachingBot:
         except Exception as e:
             print(f"❌ Error marking bullet as read: {e}")
     
+    def get_reading_text(self, bullet_data: dict, is_new_section: bool = False) -> str:
+        """Text spoken for a bullet point - only include section title for new sections"""
+        if is_new_section:
+            return f"Section: {bullet_data['section_title']}. {bullet_data['bullet_point']}"
+        return bullet_data['bullet_point']
+    
+    def get_reading_chunks(self, bullet_data: dict, is_new_section: bool = False) -> list:
+        """Sentence-sized utterances of a bullet point, each synthesized and cached on its own"""
+        return split_sentences(self.get_reading_text(bullet_data, is_new_section))
+    
+    def upcoming_texts(self, current_section, limit: int = None) -> list:
+        """Sentences of the unread bullet points from the current one on, as they will be read"""
+        # Rest of a bullet cut off by the previous window first
+        texts = self.current_chunks[self.current_chunk_index:]
+        start = self.current_bullet_index
+        section = current_section
+        if self.current_chunks:
+            section = self.unread_bullet_points[start]['section_title']
+            start += 1
+        for bullet_data in self.unread_bullet_points[start:]:
+            if limit is not None and len(texts) >= limit:
+                break
+            texts.extend(self.get_reading_chunks(bullet_data, bullet_data['section_title'] != section))
+            section = bullet_data['section_title']
+        return texts[:limit]
+    
+    def prefetch_upcoming(self, current_section):
+        """Synthesize the next bullet points in the background, as they will be read"""
+        prefetch(self.upcoming_texts(current_section, PREFETCH_DEPTH))
+    
+    def compile_lesson_audio(self):
+        """Synthesize the whole lesson into an audio pack in the background, so teaching needs no network"""
+        texts = self.upcoming_texts(None)
+        threading.Thread(target=compile_lesson, args=(texts,), daemon=True, name="tts-compile").start()
+    
     def read_bullet_point(self, bullet_data: dict, is_new_section: bool = False):
-        """Read a single bullet point using TTS"""
+        """
+        Read a bullet point sentence by sentence using TTS
+        
+        Returns:
+            True once the whole bullet was read, None if its next sentence doesn't fit in
+            this downtime window (or the window closed), False if speaking failed or was interrupted
+        """
         subtopic_idx = bullet_data['subtopic_idx']
         bullet_idx = bullet_data['bullet_idx']
         section_title = bullet_data['section_title']
         bullet_point = bullet_data['bullet_point']
         
-        print(f"\n📖 Reading: {section_title}")
-        print(f"   Bullet: {bullet_point[:100]}{'...' if len(bullet_point) > 100 else ''}")
-        
-        # Create reading format - only include section title for new sections
-        if is_new_section:
-            reading_text = f"Section: {section_title}. {bullet_point}"
-        else:
-            reading_text = bullet_point
-        
-        # Speak the content
-        success = speak(reading_text)
+        if not self.current_chunks:
+            print(f"\n📖 Reading: {section_title}")
+            print(f"   Bullet: {bullet_point[:100]}{'...' if len(bullet_point) > 100 else ''}")
+            
+            self.current_chunks = self.get_reading_chunks(bullet_data, is_new_section)
+            self.current_chunk_index = 0
         
-        if success:
-            # Wait for speech to finish
-            while is_speaking():
-                time.sleep(0.1)
+        while self.current_chunk_index < len(self.current_chunks):
+            # Downtime can end while a sentence plays: the rest waits for the next window
+            if not self.is_downtime or not self.teaching_active:
+                return None
+            chunk = self.current_chunks[self.current_chunk_index]
+            if not self.chunk_fits(chunk):
+                return None
+            
+            # Speak the sentence and wait for the end of playback (stop() cancels it);
+            # the downtime left decides how fast an uncached sentence must be synthesized
+            speech = speak_async(chunk, budget=downtime_scheduler.remaining(time.time() - self.downtime_started_at))
+            speech.wait()
             
-            # Mark as read
-            self.mark_bullet_as_read(subtopic_idx, bullet_idx)
+            if speech.cancelled:
+                print(f"⏹️ Interrupted - sentence stays unread")
+                return False
+            elif not speech.result:
+                print(f"❌ Failed to speak bullet point")
+                return False
+            self.current_chunk_index += 1
+            self.window_chunks += 1
+            downtime_scheduler.record_taught(self.chunk_duration(chunk))
+        
+        # Mark as read
+        self.current_chunks = []
+        self.current_chunk_index = 0
+        self.mark_bullet_as_read(subtopic_idx, bullet_idx)
+        return True
+    
+    def chunk_duration(self, chunk: str) -> float:
+        """Measured audio length of a sentence, estimated if it hasn't been synthesized yet"""
+        return clip_duration(chunk) or estimate_duration(chunk)
+    
+    def chunk_fits(self, chunk: str) -> bool:
+        """Whether a sentence fits in what is left of this downtime window (its first one always starts)"""
+        if self.window_chunks == 0:
             return True
-        else:
-            print(f"❌ Failed to speak bullet point")
-            return False
+        duration = self.chunk_duration(chunk)
+        elapsed = time.time() - self.downtime_started_at
+        expected = downtime_scheduler.expected_window(elapsed)
+        if fits_remaining(duration, elapsed, expected):
+            return True
+        print(f"⏳ Next sentence ({duration:.1f}s) won't fit the ~{expected - elapsed:.1f}s "
+              f"of downtime left - saving it for the next window")
+        return False
     
-    def start_downtime_detection(self):
-        """Start monitoring for downtime (combat report)"""
-        print("🎮 Starting downtime detection...")
-        self.downtime_thread = threading.Thread(target=self.monitor_downtime, daemon=True)
-        self.downtime_thread.start()
-    
-    def monitor_downtime(self):
-        """Monitor screen for combat report (downtime detection)"""
-        was_visible = False
-        last_seen_time = None
+    def schedule_next(self, current_section):
+        """Move the upcoming bullet that best fills the rest of this downtime window to the front"""
+        if self.current_chunks:
+            return  # finish the bullet in progress first
+        head = self.current_bullet_index
+        section = self.unread_bullet_points[head]['section_title']
+        durations = []
+        for bullet_data in self.unread_bullet_points[head:head + LOOKAHEAD]:
+            if bullet_data['section_title'] != section:
+                break
+            chunks = self.get_reading_chunks(bullet_data, section != current_section)
+            durations.append(sum(self.chunk_duration(chunk) for chunk in chunks))
         
-        with mss.mss() as sct:
-            try:
-                while True:
-                    # Capture and preprocess screen
-                    img = np.array(sct.grab(OCR_REGION))
-                    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-                    _, thresh = cv2.threshold(gray, 180, 255, cv2.THRESH_BINARY)
-
-                    # OCR
-                    text = pytesseract.image_to_string(thresh, config=OCR_CONFIG).lower()
-
-                    if TARGET_PHRASE in text:
-                        if not was_visible:
-                            was_visible = True
-                            last_seen_time = time.time()
-                            print(f"[✅] '{TARGET_PHRASE}' appeared at {time.strftime('%H:%M:%S')}")
-                            self.on_downtime_start()
-                    else:
-                        if was_visible:
-                            was_visible = False
-                            duration = time.time() - last_seen_time
-                            print(f"[❎] '{TARGET_PHRASE}' disappeared at {time.strftime('%H:%M:%S')} (Visible for {duration:.2f}s)")
-                            self.on_downtime_end()
-
-                    time.sleep(0.1)
-
-            except Exception as e:
-                print(f"❌ Error in downtime detection: {e}")
+        choice = downtime_scheduler.choose(durations, time.time() - self.downtime_started_at)
+        if choice:
+            bullet_data = self.unread_bullet_points.pop(head + choice)
+            self.unread_bullet_points.insert(head, bullet_data)
+            print(f"🧮 Reading a {durations[choice]:.1f}s bullet early to fill the window")
+    
+    def start_downtime_detection(self):
+        """Subscribe to the shared downtime monitor (combat report)"""
+        with self.subscription_lock:
+            if self.downtime_subscription is not None:
+                return
+            print("🎮 Starting downtime detection...")
+            self.downtime_subscription, _ = downtime_monitor.subscribe(self.handle_downtime_event)
+        downtime_monitor.start()
+    
+    def stop_downtime_detection(self):
+        """Unsubscribe from the shared downtime monitor (only the first of racing callers releases it)"""
+        with self.subscription_lock:
+            if self.downtime_subscription is None:
+                return
+            downtime_monitor.unsubscribe(self.downtime_subscription)
+            self.downtime_subscription = None
+        downtime_monitor.stop()
+    
+    def handle_downtime_event(self, event: dict):
+        """Route downtime_start / downtime_end events from the monitor"""
+        if event["type"] == DOWNTIME_START:
+            self.downtime_started_at = event.get("timestamp", time.time())
+            self.on_downtime_start()
+        else:
+            downtime_scheduler.record_window(event.get("duration", 0.0))
+            self.on_downtime_end()
     
     def on_downtime_start(self):
         """Called when downtime (combat report) appears"""
         self.is_downtime = True
+        self.window_chunks = 0
         print("🎓 Downtime detected - starting teaching session...")
         
+        # A bullet cut off by the previous window continues where it stopped;
+        # its teaching thread is still waiting on it
+        resume()
+        
         # Start teaching if not already active
         if not self.teaching_active:
             self.start_teaching_session()
@@ -170,6 +273,12 @@ class TeachingBot:
     def on_downtime_end(self):
         """Called when downtime (combat report) disappears"""
         self.is_downtime = False
+        
+        # Keep the current bullet's audio and position for the next window
+        if pause():
+            print("🎮 Downtime ended - pausing mid-bullet...")
+            return
+        
         print("🎮 Downtime ended - stopping teaching session...")
         
         # Stop current teaching
@@ -181,6 +290,7 @@ class TeachingBot:
             return
         
         self.teaching_active = True
+        self.resume_baseline = get_tts_stats()["resume"]
         print("📚 Starting teaching session...")
         
         # Start teaching thread
@@ -205,7 +315,11 @@ class TeachingBot:
                 print("✅ All bullet points have been read!")
                 break
             
-            # Get current bullet point
+            # Have the next bullets synthesized before they are needed
+            self.prefetch_upcoming(current_section)
+            
+            # Get current bullet point - the one that best fills what is left of the window
+            self.schedule_next(current_section)
             bullet_data = self.unread_bullet_points[self.current_bullet_index]
             
             # Check if this is a new section
@@ -222,6 +336,12 @@ class TeachingBot:
             if success:
                 self.current_bullet_index += 1
                 print(f"📖 Progress: {self.current_bullet_index}/{len(self.unread_bullet_points)}")
+            elif success is None:
+                # The next sentence is for the next window
+                break
+            elif not self.is_downtime or not self.teaching_active:
+                # Cut off by the end of downtime: read it again next time
+                continue
             else:
                 print(f"❌ Failed to read bullet point {self.current_bullet_index + 1}")
                 break
@@ -235,8 +355,20 @@ class TeachingBot:
                 break
         
         self.teaching_active = False
+        self.report_resume_savings()
+        stats = downtime_scheduler.get_stats()
+        print(f"📊 Utilization: {stats['utilization']:.0%} ({stats['taught_seconds']}s taught "
+              f"in {stats['downtime_seconds']}s of downtime over {stats['windows']} window(s))")
         print("🏁 Teaching session ended")
     
+    def report_resume_savings(self):
+        """Print the replayed audio and synthesis requests pause/resume avoided this session"""
+        stats = get_tts_stats()["resume"]
+        saved = {key: stats[key] - self.resume_baseline.get(key, 0) for key in stats}
+        if saved["resumes"]:
+            print(f"⏯️ {saved['resumes']} resume(s) saved {saved['audio_seconds_saved']:.1f}s of replayed audio "
+                  f"and {saved['api_calls_saved']} API call(s)")
+    
     def get_progress(self):
         """Get current reading progress"""
         if not self.learning_content:
@@ -257,6 +389,7 @@ class TeachingBot:
 
 def main():
     """Main function to run the teaching bot with downtime detection"""
+    init_tts()  # mixer and API key check up front, not on the first utterance
     
     # Example text - you can replace this with your content
     example_text = """
@@ -314,6 +447,7 @@ def main():
     except KeyboardInterrupt:
         print("\n🛑 Shutting down teaching bot...")
         bot.stop_teaching_session()
+        bot.stop_downtime_detection()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
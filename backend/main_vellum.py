@@ -10,10 +10,17 @@ import vellum.types as types
 project_root = Path(__file__).parent.parent
 load_dotenv(project_root / '.env')
 
-# create your API key here: https://app.vellum.ai/api-keys#keys
-client = Vellum(
-  api_key=os.environ["VELLUM_API_KEY"]
-)
+_client = None
+
+def get_client() -> Vellum:
+    """Vellum client, created on first use so importing this module needs no API key"""
+    global _client
+    if _client is None:
+        # create your API key here: https://app.vellum.ai/api-keys#keys
+        _client = Vellum(
+          api_key=os.environ["VELLUM_API_KEY"]
+        )
+    return _client
 
 def run_vellum_workflow(text_content: str):
     """
@@ -26,7 +33,7 @@ def run_vellum_workflow(text_content: str):
         dict: Structured learning content with overall_topic, subtopics, summaries, and quiz questions
     """
     try:
-        result = client.execute_workflow(
+        result = get_client().execute_workflow(
             workflow_deployment_name="dual-wield",
             release_tag="LATEST",
             inputs=[
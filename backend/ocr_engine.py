@@ -0,0 +1,204 @@
+"""
+Persistent OCR engines for downtime detection.
+
+pytesseract forks a tesseract process and writes a temp image for every
+call, so the language model is reloaded ten times per second. The engines
+here keep one initialized tesseract API handle alive for as long as the
+engine object lives (create it inside the monitor thread, close() it on
+exit), with the page segmentation mode and character whitelist preloaded:
+- TesserocrEngine: tesserocr Python binding (if installed)
+- CApiEngine: tesseract's C API loaded through ctypes, no extra packages
+- PytesseractEngine: the original subprocess path, kept as the fallback
+"""
+
+import ctypes
+import ctypes.util
+import glob
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+import pytesseract
+
+# Try to import tesserocr for the in-process binding
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+OCR_LANG = "eng"
+OCR_PSM = 7  # single text line
+OCR_WHITELIST = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz "
+
+# "auto" tries tesserocr, then the C API, then pytesseract
+OCR_ENGINE = os.getenv("OCR_ENGINE", "auto")
+
+
+class OcrEngine:
+    """Base class for OCR engines"""
+    name = "base"
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        """
+        Recognize text in a single-channel uint8 image
+
+        Returns:
+            str: Recognized text (not lower-cased)
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release the tesseract handle"""
+        pass
+
+
+class PytesseractEngine(OcrEngine):
+    """One tesseract subprocess per call (original behaviour)"""
+    name = "pytesseract"
+
+    def __init__(self, psm: int = OCR_PSM, whitelist: str = OCR_WHITELIST, config: str = None):
+        if config is None:
+            config = f"--psm {psm}"
+            if whitelist:
+                # pytesseract splits the config with shlex, so the space must be quoted
+                config += f' -c "tessedit_char_whitelist={whitelist}"'
+        self.config = config
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        return pytesseract.image_to_string(image, config=self.config)
+
+
+class TesserocrEngine(OcrEngine):
+    """Long-lived tesserocr.PyTessBaseAPI handle"""
+    name = "tesserocr"
+
+    def __init__(self, psm: int = OCR_PSM, whitelist: str = OCR_WHITELIST, lang: str = OCR_LANG):
+        if not TESSEROCR_AVAILABLE:
+            raise RuntimeError("❌ tesserocr is not installed")
+
+        self.api = tesserocr.PyTessBaseAPI(lang=lang, psm=psm)
+        if whitelist:
+            self.api.SetVariable("tessedit_char_whitelist", whitelist)
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        self.api.SetImageBytes(image.tobytes(), width, height, 1, width)
+        return self.api.GetUTF8Text()
+
+    def close(self):
+        if self.api is not None:
+            self.api.End()
+            self.api = None
+
+
+def _find_tesseract_library():
+    """Locate libtesseract: $TESSERACT_LIB, the system loader, then next to tesseract_cmd"""
+    path = os.getenv("TESSERACT_LIB")
+    if path:
+        return path
+
+    path = ctypes.util.find_library("tesseract")
+    if path:
+        return path
+
+    # Windows installs ship libtesseract-5.dll next to tesseract.exe
+    cmd_dir = Path(pytesseract.pytesseract.tesseract_cmd).parent
+    matches = sorted(glob.glob(str(cmd_dir / "libtesseract*.dll")))
+    return matches[-1] if matches else None
+
+
+class CApiEngine(OcrEngine):
+    """Long-lived TessBaseAPI handle driven through tesseract's C API"""
+    name = "capi"
+
+    def __init__(self, psm: int = OCR_PSM, whitelist: str = OCR_WHITELIST, lang: str = OCR_LANG,
+                 library_path: str = None):
+        library_path = library_path or _find_tesseract_library()
+        if not library_path:
+            raise RuntimeError("❌ libtesseract not found (set TESSERACT_LIB)")
+
+        lib = ctypes.CDLL(library_path)
+        lib.TessBaseAPICreate.restype = ctypes.c_void_p
+        lib.TessBaseAPIInit3.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
+        lib.TessBaseAPIInit3.restype = ctypes.c_int
+        lib.TessBaseAPISetPageSegMode.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        lib.TessBaseAPISetVariable.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
+        lib.TessBaseAPISetVariable.restype = ctypes.c_int
+        lib.TessBaseAPISetImage.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int,
+                                            ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        lib.TessBaseAPIGetUTF8Text.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p
+        lib.TessDeleteText.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIEnd.argtypes = [ctypes.c_void_p]
+        lib.TessBaseAPIDelete.argtypes = [ctypes.c_void_p]
+        self.lib = lib
+
+        self.handle = lib.TessBaseAPICreate()
+        datapath = os.getenv("TESSDATA_PREFIX")
+        if lib.TessBaseAPIInit3(self.handle, datapath.encode() if datapath else None, lang.encode()) != 0:
+            lib.TessBaseAPIDelete(self.handle)
+            self.handle = None
+            raise RuntimeError(f"❌ Could not initialize tesseract ({library_path}, lang={lang})")
+
+        lib.TessBaseAPISetPageSegMode(self.handle, psm)
+        if whitelist:
+            lib.TessBaseAPISetVariable(self.handle, b"tessedit_char_whitelist", whitelist.encode())
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        height, width = image.shape[:2]
+        self.lib.TessBaseAPISetImage(self.handle, image.ctypes.data, width, height, 1, width)
+
+        text_ptr = self.lib.TessBaseAPIGetUTF8Text(self.handle)
+        if not text_ptr:
+            return ""
+        try:
+            return ctypes.string_at(text_ptr).decode("utf-8", errors="replace")
+        finally:
+            self.lib.TessDeleteText(text_ptr)
+
+    def close(self):
+        if self.handle is not None:
+            self.lib.TessBaseAPIEnd(self.handle)
+            self.lib.TessBaseAPIDelete(self.handle)
+            self.handle = None
+
+
+def psm_from_config(config: str, default: int = OCR_PSM) -> int:
+    """Pull the page segmentation mode out of a pytesseract config string ("--psm 6")"""
+    match = re.search(r"--psm\s+(\d+)", config or "")
+    return int(match.group(1)) if match else default
+
+
+def create_ocr_engine(engine: str = OCR_ENGINE, psm: int = OCR_PSM,
+                      whitelist: str = OCR_WHITELIST) -> OcrEngine:
+    """
+    Build an OCR engine
+
+    Args:
+        engine (str): "tesserocr", "capi", "pytesseract" or "auto" (first
+                      persistent engine that initializes, else pytesseract)
+
+    Returns:
+        OcrEngine: The selected engine
+    """
+    if engine in ("auto", "tesserocr"):
+        try:
+            return TesserocrEngine(psm=psm, whitelist=whitelist)
+        except Exception as e:
+            if engine == "tesserocr":
+                raise
+            print(f"⚠️ tesserocr engine unavailable: {e}")
+
+    if engine in ("auto", "capi"):
+        try:
+            return CApiEngine(psm=psm, whitelist=whitelist)
+        except Exception as e:
+            if engine == "capi":
+                raise
+            print(f"⚠️ Tesseract C API engine unavailable: {e}")
+
+    return PytesseractEngine(psm=psm, whitelist=whitelist)
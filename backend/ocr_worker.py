@@ -0,0 +1,26 @@
+"""
+OCR pool worker for CapturePipeline.
+
+Workers are started with the spawn method, which imports the target
+functions' module in a fresh interpreter. This module only pulls in
+pytesseract and ocr_engine, so a worker loads one OCR engine and nothing
+else (no capture, TTS or server setup).
+"""
+
+import numpy as np
+import pytesseract
+
+from ocr_engine import create_ocr_engine
+
+_ENGINE = None
+
+
+def init(psm: int, tesseract_cmd: str):
+    """Pool initializer: one persistent OCR engine per worker process"""
+    global _ENGINE
+    pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    _ENGINE = create_ocr_engine(psm=psm)
+
+
+def run(image: np.ndarray) -> str:
+    return _ENGINE.image_to_string(image)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Auto-tighten a detector profile's OCR region from saved calibration frames.
+
+Tesseract's cost grows with pixel count, and the built-in regions are much
+larger than the phrase they look for. Given frames saved with
+Game_Management/region_tuner.py (P key -> frames/positive/), this:
+1. finds the phrase in every frame with tesseract's image_to_data word boxes
+2. takes the union of those boxes plus padding as the new region
+3. picks the smallest downscale factor at which OCR on the cropped region
+   still finds the phrase in every frame it found it in before (and, if
+   frames/negative/ exists, still finds it in none of those)
+4. writes frames/<profile>_calibration.json, which detector_profiles loads
+   in place of the built-in region
+
+Frames must have been saved with the profile's built-in region.
+
+Usage:
+    python region_calibration.py valorant_combat_report
+    python region_calibration.py you_are_dead --frames path/to/frames --padding 16
+"""
+
+import argparse
+import json
+import string
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytesseract
+
+from detector_profiles import DetectorProfile, get_profiles
+from downtime_detector import OcrDetector, BINARY_THRESHOLD, FRAMES_DIR, _load_gray_frames
+from ocr_engine import create_ocr_engine, psm_from_config
+
+PADDING = 12  # pixels kept around the phrase box
+SCALES = (1.0, 0.75, 0.6, 0.5, 0.4, 0.33, 0.25)
+CALIBRATION_PSM = 11  # sparse text: find the phrase anywhere in the frame
+
+
+def _normalize(word: str) -> str:
+    return word.lower().strip(string.punctuation + " ")
+
+
+def phrase_box(data: dict, phrase: str):
+    """
+    Locate a phrase in pytesseract.image_to_data output
+
+    Args:
+        data (dict): image_to_data(..., output_type=Output.DICT) result
+        phrase (str): Words to find, in order
+
+    Returns:
+        tuple: (left, top, width, height) of the first consecutive run of
+               matching words, or None
+    """
+    words = [i for i, text in enumerate(data["text"]) if _normalize(text)]
+    tokens = phrase.lower().split()
+
+    for start in range(len(words) - len(tokens) + 1):
+        run = words[start:start + len(tokens)]
+        if all(_normalize(data["text"][i]) == token for i, token in zip(run, tokens)):
+            left = min(data["left"][i] for i in run)
+            top = min(data["top"][i] for i in run)
+            right = max(data["left"][i] + data["width"][i] for i in run)
+            bottom = max(data["top"][i] + data["height"][i] for i in run)
+            return left, top, right - left, bottom - top
+    return None
+
+
+def find_phrase(gray: np.ndarray, phrase: str, threshold: int = BINARY_THRESHOLD):
+    """Bounding box of the phrase in a grayscale frame, or None"""
+    _, thresh = cv2.threshold(gray, threshold, 255, cv2.THRESH_BINARY)
+    data = pytesseract.image_to_data(thresh, config=f"--psm {CALIBRATION_PSM}",
+                                     output_type=pytesseract.Output.DICT)
+    return phrase_box(data, phrase)
+
+
+def padded_box(boxes: list, shape: tuple, padding: int = PADDING):
+    """Union of (left, top, width, height) boxes grown by padding and clamped to the frame"""
+    left = max(0, min(b[0] for b in boxes) - padding)
+    top = max(0, min(b[1] for b in boxes) - padding)
+    right = min(shape[1], max(b[0] + b[2] for b in boxes) + padding)
+    bottom = min(shape[0], max(b[1] + b[3] for b in boxes) + padding)
+    return left, top, right - left, bottom - top
+
+
+def ocr_hits(frames: list, detector: OcrDetector, engine) -> tuple:
+    """(frames where OCR finds the phrase, average ms per frame) with the detector's preprocessing"""
+    hits = 0
+    start = time.perf_counter()
+    for frame in frames:
+        if detector.is_match(engine.image_to_string(detector.preprocess(frame))):
+            hits += 1
+    elapsed = time.perf_counter() - start
+    return hits, 1000 * elapsed / len(frames) if frames else 0.0
+
+
+def choose_scale(profile: DetectorProfile, crops: list, negatives: list, baseline_hits: int,
+                 engine, scales=SCALES) -> tuple:
+    """
+    Smallest downscale factor that keeps recall (and adds no false positives)
+
+    Returns:
+        tuple: (scale, {scale: {"hits", "ocr_ms"}} for every scale tried)
+    """
+    best = 1.0
+    results = {}
+    for scale in sorted(scales, reverse=True):
+        detector = OcrDetector(phrase=profile.phrase, config=profile.config, scale=scale, engine=engine)
+        hits, ocr_ms = ocr_hits(crops, detector, engine)
+        false_hits, _ = ocr_hits(negatives, detector, engine)
+        results[scale] = {"hits": hits, "false_hits": false_hits, "ocr_ms": round(ocr_ms, 2)}
+        if hits < baseline_hits or false_hits > 0:
+            break  # smaller scales only lose more detail
+        best = scale
+    return best, results
+
+
+def calibrate(profile: DetectorProfile, frames_dir=None, negatives_dir=None, padding: int = PADDING,
+              scales=SCALES) -> dict:
+    """
+    Compute a tightened region and OCR scale for a profile
+
+    Args:
+        profile (DetectorProfile): Profile the frames were saved with (built-in region)
+        frames_dir: Frames showing the phrase (default: frames/positive)
+        negatives_dir: Frames without it (default: frames/negative, optional)
+        padding (int): Pixels kept around the phrase box
+
+    Returns:
+        dict: Calibration as written to the profile's calibration file
+    """
+    frames_dir = Path(frames_dir or FRAMES_DIR / "positive")
+    negatives_dir = Path(negatives_dir or FRAMES_DIR / "negative")
+    shape = (profile.region["height"], profile.region["width"])
+
+    frames = [f for f in _load_gray_frames(frames_dir) if f.shape == shape]
+    if not frames:
+        raise ValueError(f"❌ No {shape[1]}x{shape[0]} frames in {frames_dir} for profile {profile.name}")
+    negatives = [f for f in _load_gray_frames(negatives_dir) if f.shape == shape] if negatives_dir.is_dir() else []
+
+    boxes = [box for box in (find_phrase(f, profile.phrase) for f in frames) if box is not None]
+    if not boxes:
+        raise ValueError(f"❌ '{profile.phrase}' was not found in any frame in {frames_dir}")
+    left, top, width, height = padded_box(boxes, shape, padding)
+
+    def crop(frame):
+        return frame[top:top + height, left:left + width]
+
+    engine = create_ocr_engine(psm=psm_from_config(profile.config))
+    try:
+        # Recall of the current setup: full region, full resolution
+        baseline = OcrDetector(phrase=profile.phrase, config=profile.config, engine=engine)
+        baseline_hits, baseline_ms = ocr_hits(frames, baseline, engine)
+        scale, tried = choose_scale(profile, [crop(f) for f in frames], [crop(f) for f in negatives],
+                                    baseline_hits, engine, scales)
+    finally:
+        engine.close()
+
+    if tried.get(1.0, {}).get("hits", baseline_hits) < baseline_hits:
+        print("⚠️ The cropped region already misses frames the full region catches; try a larger --padding")
+
+    return {
+        "profile": profile.name,
+        "phrase": profile.phrase,
+        "source_region": profile.region,
+        "region": {
+            "top": profile.region["top"] + top,
+            "left": profile.region["left"] + left,
+            "width": width,
+            "height": height
+        },
+        "scale": scale,
+        "frames": len(frames),
+        "phrase_found": len(boxes),
+        "baseline": {"hits": baseline_hits, "ocr_ms": round(baseline_ms, 2)},
+        "scales": {str(s): r for s, r in tried.items()}
+    }
+
+
+def save_calibration(calibration: dict, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(calibration, indent=2))
+    print(f"💾 Saved calibration to {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tighten a detector profile's OCR region from saved frames")
+    parser.add_argument("profile", help="Detector profile name")
+    parser.add_argument("--frames", help="Frames showing the phrase (default: frames/positive)")
+    parser.add_argument("--negatives", help="Frames without the phrase (default: frames/negative)")
+    parser.add_argument("--padding", type=int, default=PADDING, help="Pixels kept around the phrase")
+    args = parser.parse_args(argv)
+
+    profiles = get_profiles([args.profile], use_calibration=False)
+    if not profiles:
+        return 1
+    profile = profiles[0]
+
+    calibration = calibrate(profile, args.frames, args.negatives, args.padding)
+    print(json.dumps(calibration, indent=2))
+    source, region = calibration["source_region"], calibration["region"]
+    shrink = (source["width"] * source["height"]) / (region["width"] * region["height"] * calibration["scale"] ** 2)
+    print(f"📐 {profile.name}: {region} at scale {calibration['scale']} ({shrink:.1f}x fewer pixels for OCR)")
+    save_calibration(calibration, profile.calibration_path)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Offline replay benchmark for downtime detection (headless, no display)
+
+Plays a recorded gameplay video or a directory of PNG/JPG frames into the
+live CapturePipeline (capture thread, sampler, OCR gate, detector and
+worker pool) at the recorded timestamps, and reports:
+- pipeline stats: achieved FPS, dropped frames, end-to-end latency
+- detection latency: how late, in stream time, each labeled downtime
+  window is detected given the frames the pipeline actually processed
+- frame-level and event-level precision/recall against a labeled timeline
+
+Verdicts are scored after the same TransitionDebouncer the monitor applies
+before publishing events (--raw scores the detector's own verdicts).
+
+With --all-frames every frame goes straight through the detector instead,
+to measure throughput (frames/sec the detector sustains).
+
+Timeline file: CSV lines "start_s,end_s" (header optional) or a JSON list
+of {"start": s, "end": s}, one entry per downtime window.
+
+Usage:
+    python replay_benchmark.py ../TwelveLabGameReport/videos/VALORANT.mp4 --labels labels.csv
+    python replay_benchmark.py frames_dir/ --fps 10 --labels labels.json --backend template
+    python replay_benchmark.py frames_dir/ --fps 10 --labels labels.json --raw --all-frames
+"""
+
+import argparse
+import bisect
+import csv
+import json
+import statistics
+import threading
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from capture_pipeline import CapturePipeline, to_gray
+from detector_profiles import create_profile_detector
+from downtime_detector import create_detector
+from transition_debouncer import TransitionDebouncer
+
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg")
+
+
+# === FRAME SOURCES ===
+def video_frames(path: str):
+    """Yield (media_time_s, BGR frame) from a video file"""
+    capture = cv2.VideoCapture(str(path))
+    if not capture.isOpened():
+        raise FileNotFoundError(f"❌ Could not open video: {path}")
+    try:
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            yield capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0, frame
+    finally:
+        capture.release()
+
+
+def image_frames(directory: str, fps: float):
+    """Yield (media_time_s, frame) from sorted image files at a fixed frame rate"""
+    paths = sorted(p for p in Path(directory).iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+    if not paths:
+        raise FileNotFoundError(f"❌ No frames found in {directory}")
+    for index, path in enumerate(paths):
+        frame = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
+        if frame is not None:
+            yield index / fps, frame
+
+
+def crop_region(frame: np.ndarray, region: dict) -> np.ndarray:
+    """Cut the capture region out of a full-screen frame (no-op if the frame is smaller)"""
+    top, left = region["top"], region["left"]
+    bottom, right = top + region["height"], left + region["width"]
+    if frame.shape[0] < bottom or frame.shape[1] < right:
+        return frame
+    return frame[top:bottom, left:right]
+
+
+def load_timeline(path: str) -> list:
+    """Load labeled downtime windows as a sorted list of (start_s, end_s)"""
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        entries = json.loads(path.read_text())
+        windows = [(float(e["start"]), float(e["end"])) for e in entries]
+    else:
+        windows = []
+        with open(path, newline="") as f:
+            for row in csv.reader(f):
+                if not row or row[0].strip().startswith("#"):
+                    continue
+                try:
+                    windows.append((float(row[0]), float(row[1])))
+                except ValueError:
+                    continue  # header line
+    return sorted(windows)
+
+
+def is_labeled(timeline: list, t: float) -> bool:
+    return any(start <= t < end for start, end in timeline)
+
+
+# === REPLAY ===
+class ReplaySource:
+    """
+    Frame source for CapturePipeline that plays a recording back in real time
+
+    Each grab returns the recorded frame on screen at that moment (frames
+    that went by between grabs are never seen, as on a live screen), and
+    remembers which one it served so verdicts can be placed on the
+    recording's timeline.
+    """
+
+    def __init__(self, frames, region: dict = None):
+        self.frames = iter(frames)
+        self.region = region
+        self.current = self._next()
+        if self.current is None:
+            raise ValueError("❌ Recording has no frames")
+        self.upcoming = self._next()
+        self.started = None
+        self.finished = threading.Event()
+        self.served = []         # (perf_counter when the grab returned, media_time_s)
+        self.skipped = 0         # recorded frames no grab landed on
+        self.current_served = False
+
+    def _next(self):
+        item = next(self.frames, None)
+        if item is None:
+            return None
+        media_time, frame = item
+        if self.region is not None:
+            frame = crop_region(frame, self.region)
+        return media_time, frame
+
+    @property
+    def shape(self) -> tuple:
+        return self.current[1].shape[:2]
+
+    def grab(self) -> np.ndarray:
+        now = time.perf_counter()
+        if self.started is None:
+            self.started = now - self.current[0]
+        while self.upcoming is not None and self.upcoming[0] <= now - self.started:
+            if not self.current_served:
+                self.skipped += 1
+            self.current, self.upcoming = self.upcoming, self._next()
+            self.current_served = False
+        if self.upcoming is None:
+            self.finished.set()
+
+        self.current_served = True
+        self.served.append((time.perf_counter(), self.current[0]))
+        return self.current[1]
+
+    def media_time(self, captured_at: float) -> float:
+        """Media time of the frame the pipeline captured at captured_at"""
+        index = bisect.bisect_right(self.served, (captured_at, float("inf"))) - 1
+        return self.served[max(0, index)][1]
+
+
+def replay(frames, detector, region: dict = None) -> dict:
+    """
+    Run a recording through CapturePipeline as if it were on screen
+
+    The pipeline's own capture thread, sampler, OCR gate and worker pool
+    see the frames at their recorded timestamps, so frames it would skip
+    or drop live are skipped here too. Takes as long as the recording.
+
+    Args:
+        frames: Iterable of (media_time_s, frame)
+        detector (DowntimeDetector): Detector under test (closed afterwards)
+        region (dict): Capture region to crop from full-screen frames (optional)
+
+    Returns:
+        dict: Raw and debounced per-verdict results, pipeline and debounce stats
+    """
+    source = ReplaySource(frames, region)
+    height, width = source.shape
+    pipeline = CapturePipeline({"top": 0, "left": 0, "width": width, "height": height}, detector,
+                               source=source.grab)
+    debouncer = TransitionDebouncer()
+    results = []    # (media_time_s, detected, confidence)
+    debounced = []  # (media_time_s, state the monitor would publish, confidence)
+
+    with pipeline:
+        for detected, confidence, captured_at in pipeline.results(lambda: not source.finished.is_set()):
+            media_time = source.media_time(captured_at)
+            results.append((media_time, bool(detected), float(confidence)))
+            # As in DowntimeMonitor: transitions also drive the sampler
+            visible = debouncer.update(detected, confidence, captured_at)
+            if visible is not None and pipeline.sampler:
+                pipeline.sampler.record_transition(visible)
+            debounced.append((media_time, debouncer.state, float(confidence)))
+        stats = pipeline.get_stats()
+
+    results.sort(key=lambda r: r[0])
+    debounced.sort(key=lambda r: r[0])
+    return {"results": results, "debounced": debounced, "pipeline": stats,
+            "debounce": debouncer.get_stats(), "skipped": source.skipped}
+
+
+def replay_all(frames, detector, region: dict = None) -> dict:
+    """
+    Run every frame through the detector, back to back, to measure throughput
+
+    Returns:
+        dict: Raw and debounced per-frame results and detect timings
+    """
+    results = []  # (media_time_s, detected, confidence)
+    timings = []
+    for media_time, frame in frames:
+        if region is not None:
+            frame = crop_region(frame, region)
+
+        start = time.perf_counter()
+        detected, confidence = detector.detect(to_gray(frame))
+        timings.append(time.perf_counter() - start)
+        results.append((media_time, bool(detected), float(confidence)))
+
+    return {"results": results, "debounced": debounce(results), "timings": timings}
+
+
+def debounce(results: list) -> list:
+    """Per-frame verdicts replaced by the state the monitor would publish (TransitionDebouncer)"""
+    debouncer = TransitionDebouncer()
+    debounced = []
+    for media_time, detected, confidence in results:
+        debouncer.update(detected, confidence, media_time)
+        debounced.append((media_time, debouncer.state, confidence))
+    return debounced
+
+
+def detected_windows(results: list) -> list:
+    """Collapse per-frame verdicts into (start_s, end_s) detection windows"""
+    windows = []
+    start = None
+    for media_time, detected, _ in results:
+        if detected and start is None:
+            start = media_time
+        elif not detected and start is not None:
+            windows.append((start, media_time))
+            start = None
+    if start is not None and results:
+        windows.append((start, results[-1][0]))
+    return windows
+
+
+def evaluate(results: list, timeline: list) -> dict:
+    """Frame-level and event-level precision/recall plus onset latency"""
+    tp = fp = fn = 0
+    for media_time, detected, _ in results:
+        labeled = is_labeled(timeline, media_time)
+        if detected and labeled:
+            tp += 1
+        elif detected:
+            fp += 1
+        elif labeled:
+            fn += 1
+
+    detections = detected_windows(results)
+    onset_latencies = []
+    hit_windows = 0
+    for start, end in timeline:
+        overlapping = [d for d in detections if d[0] < end and d[1] > start]
+        if overlapping:
+            hit_windows += 1
+            onset_latencies.append(max(0.0, overlapping[0][0] - start))
+    true_detections = sum(1 for d in detections if any(d[0] < end and d[1] > start for start, end in timeline))
+
+    def ratio(a, b):
+        return round(a / b, 3) if b else None
+
+    return {
+        "frame_precision": ratio(tp, tp + fp),
+        "frame_recall": ratio(tp, tp + fn),
+        "event_precision": ratio(true_detections, len(detections)),
+        "event_recall": ratio(hit_windows, len(timeline)),
+        "labeled_windows": len(timeline),
+        "detected_windows": len(detections),
+        "onset_latency_ms_avg": round(1000 * statistics.mean(onset_latencies), 1) if onset_latencies else None,
+        "onset_latency_ms_max": round(1000 * max(onset_latencies), 1) if onset_latencies else None
+    }
+
+
+def summarize_timings(timings: list) -> dict:
+    if not timings:
+        return {"frames": 0}
+    ordered = sorted(timings)
+    total = sum(ordered)
+    return {
+        "frames": len(ordered),
+        "fps": round(len(ordered) / total, 1) if total > 0 else None,
+        "detect_ms_p50": round(1000 * ordered[len(ordered) // 2], 3),
+        "detect_ms_p95": round(1000 * ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded frames through the downtime detector")
+    parser.add_argument("source", help="Video file or directory of PNG/JPG frames")
+    parser.add_argument("--labels", help="Labeled timeline (CSV start,end or JSON)")
+    parser.add_argument("--fps", type=float, default=10.0, help="Frame rate of an image directory")
+    parser.add_argument("--backend", help="Detector backend (default: the active detector profiles)")
+    parser.add_argument("--full-frame", action="store_true", help="Don't crop the profile region")
+    parser.add_argument("--raw", action="store_true", help="Score raw detector verdicts, without debouncing")
+    parser.add_argument("--all-frames", action="store_true",
+                        help="Time the detector on every frame instead of replaying through the live pipeline")
+    args = parser.parse_args()
+
+    if args.backend:
+        detector, region = create_detector(backend=args.backend), None
+    else:
+        detector, region = create_profile_detector()
+    if args.full_frame:
+        region = None
+
+    source = Path(args.source)
+    frames = image_frames(source, args.fps) if source.is_dir() else video_frames(source)
+
+    print(f"🎬 Replaying {source} ({'every frame' if args.all_frames else 'live, in real time'})")
+    try:
+        if args.all_frames:
+            run = replay_all(frames, detector, region=region)
+            report = {"throughput": summarize_timings(run["timings"])}
+        else:
+            run = replay(frames, detector, region=region)
+            report = {"pipeline": run["pipeline"], "debounce": run["debounce"], "frames_skipped": run["skipped"]}
+    finally:
+        detector.close()
+
+    if args.labels:
+        report["accuracy"] = evaluate(run["results"] if args.raw else run["debounced"], load_timeline(args.labels))
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
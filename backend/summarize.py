@@ -11,18 +11,26 @@ LANGUAGE = "en"
 INDEX_NAME = "chatgpt_index"
 # ======================
 
-client = TwelveLabs(api_key=API_KEY)
+_client = None
+
+
+def get_client() -> TwelveLabs:
+    """TwelveLabs client, created on first use"""
+    global _client
+    if _client is None:
+        _client = TwelveLabs(api_key=API_KEY)
+    return _client
 
 
 def get_or_create_index(index_name: str):
     """
     Retrieves the TwelveLabs index by name, or creates it if it doesn't exist.
     """
-    for index in client.index.list():
+    for index in get_client().index.list():
         if index.name == index_name:
             return index
 
-    return client.index.create(
+    return get_client().index.create(
         name=index_name,
         models=[{
             "name": ENGINE,
@@ -35,7 +43,7 @@ def get_existing_video_id(index_id: str, filename: str) -> Optional[str]:
     """
     Checks if the given video file is already indexed and returns its video ID.
     """
-    tasks = client.task.list(index_id=index_id)
+    tasks = get_client().task.list(index_id=index_id)
     base_filename = os.path.basename(filename)
 
     print(f"🔍 Looking for existing uploaded video matching: {base_filename}")
@@ -70,7 +78,7 @@ def summarize_video(file_path: str) -> str:
 
     if not video_id:
         print("📤 Uploading and indexing video...")
-        task = client.task.create(index_id=index.id, file=file_path)
+        task = get_client().task.create(index_id=index.id, file=file_path)
         task.wait_for_done()
 
         if task.status != "ready":
@@ -83,12 +91,12 @@ def summarize_video(file_path: str) -> str:
 
     # Generate Summary
     print("\n📄 Generating summary...")
-    res_summary = client.summarize(video_id=video_id, type="summary")
+    res_summary = get_client().summarize(video_id=video_id, type="summary")
     summary_text = f"\n🔹 Summary:\n{res_summary.summary}"
 
     # Generate Chapters
     print("\n📑 Generating chapters...")
-    res_chapters = client.summarize(video_id=video_id, type="chapter")
+    res_chapters = get_client().summarize(video_id=video_id, type="chapter")
 
     chapter_texts = []
     for chapter in res_chapters.chapters:
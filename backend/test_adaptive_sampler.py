@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test script for the adaptive downtime sampling rate
+"""
+
+from adaptive_sampler import AdaptiveSampler
+
+def test_adaptive_sampler():
+    """Slow polling early in a learned state, fast polling near its expected end"""
+    sampler = AdaptiveSampler(fast_interval=0.05, slow_interval=0.5)
+
+    # No history yet: always fast
+    assert sampler.next_interval(now=0.0) == 0.05
+
+    # Learn ~60s rounds and ~10s death screens
+    t = 0.0
+    for _ in range(5):
+        sampler.record_transition(True, t)
+        t += 10.0
+        sampler.record_transition(False, t)
+        t += 60.0
+    sampler.record_transition(True, t)
+
+    stats = sampler.get_stats()
+    print(f"✅ Learned: {stats}")
+    assert stats["avg_downtime_s"] == 10.0
+    assert stats["avg_round_s"] == 60.0
+
+    # Early in the death screen: slow; near its expected end: fast
+    assert sampler.next_interval(now=t + 1.0) == 0.5
+    assert sampler.next_interval(now=t + 7.8) < 0.5
+    assert sampler.next_interval(now=t + 9.0) == 0.05
+
+    # Early in a round: slow again
+    sampler.record_transition(False, t + 10.0)
+    assert sampler.next_interval(now=t + 15.0) == 0.5
+
+if __name__ == "__main__":
+    test_adaptive_sampler()
+    print("\n🎉 Adaptive sampler tests completed!")
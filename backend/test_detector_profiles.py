@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for multi-profile detection from one union capture
+"""
+
+import tempfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+from detector_profiles import DetectorProfile, MultiProfileDetector, union_region
+from downtime_detector import DowntimeDetector
+
+class BrightSliceDetector(DowntimeDetector):
+    """Stand-in detector: 'detected' when its slice is mostly white"""
+    poll_interval = 1 / 30
+
+    def detect(self, gray):
+        detected = gray.mean() > 128
+        return detected, 1.0 if detected else 0.0
+
+def test_union_region():
+    """Union bounding box covers every profile region"""
+    region = union_region([
+        {"top": 10, "left": 20, "width": 30, "height": 40},
+        {"top": 100, "left": 5, "width": 10, "height": 10}
+    ])
+    assert region == {"top": 10, "left": 5, "width": 45, "height": 100}
+
+def test_multi_profile_slices():
+    """Each profile sees only its own slice of the shared buffer"""
+    with tempfile.TemporaryDirectory() as tmp:
+        template_path = Path(tmp) / "template.png"
+        cv2.imwrite(str(template_path), np.full((4, 4), 255, dtype=np.uint8))
+        profiles = [
+            DetectorProfile("a", "test", "phrase a", {"top": 0, "left": 0, "width": 10, "height": 10},
+                            backend="template", template_path=template_path),
+            DetectorProfile("b", "test", "phrase b", {"top": 20, "left": 30, "width": 10, "height": 10},
+                            backend="template", template_path=template_path)
+        ]
+        detector = MultiProfileDetector(profiles)
+
+    assert detector.slices == [(slice(0, 10), slice(0, 10)), (slice(20, 30), slice(30, 40))]
+    detector.detectors = [BrightSliceDetector(), BrightSliceDetector()]
+
+    frame = np.zeros((detector.region["height"], detector.region["width"]), dtype=np.uint8)
+    assert detector.detect(frame) == (False, 0.0)
+
+    frame[20:30, 30:40] = 255
+    assert detector.detect(frame) == (True, 1.0)
+    assert detector.last_match == "b"
+    assert detector.label == "phrase b"
+    assert detector.last_results["a"] == (False, 0.0)
+
+if __name__ == "__main__":
+    test_union_region()
+    test_multi_profile_slices()
+    print("\n🎉 Detector profile tests completed!")
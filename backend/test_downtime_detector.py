@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test script for the template and classifier downtime detectors
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+from downtime_detector import TemplateMatchDetector, ClassifierDetector, train_classifier
+
+def make_frame(with_phrase: bool, seed: int = 0) -> np.ndarray:
+    """Synthetic 500x500 gameplay frame, optionally with the combat report banner"""
+    rng = np.random.default_rng(seed)
+    frame = rng.integers(0, 90, size=(500, 500), dtype=np.uint8)
+    if with_phrase:
+        cv2.putText(frame, "COMBAT REPORT", (60, 120), cv2.FONT_HERSHEY_SIMPLEX, 1.4, 255, 3)
+    return frame
+
+def test_template_detector():
+    """Template matching finds the banner and rejects plain gameplay"""
+    print("🧪 Testing template detector...")
+    with tempfile.TemporaryDirectory() as tmp:
+        template_path = Path(tmp) / "template.png"
+        cv2.imwrite(str(template_path), make_frame(True)[80:135, 50:360])
+
+        detector = TemplateMatchDetector(template_path)
+        detected, confidence = detector.detect(make_frame(True, seed=1))
+        assert detected, confidence
+        detected, confidence = detector.detect(make_frame(False, seed=2))
+        assert not detected, confidence
+
+        frame = make_frame(True, seed=3)
+        start = time.perf_counter()
+        for _ in range(100):
+            detector.detect(frame)
+        print(f"✅ Template detect: {(time.perf_counter() - start) * 10:.3f} ms/frame")
+
+def test_classifier_detector():
+    """Classifier trained on labeled frames separates the two classes"""
+    print("🧪 Testing classifier detector...")
+    with tempfile.TemporaryDirectory() as tmp:
+        frames_dir = Path(tmp)
+        for label, with_phrase in (("positive", True), ("negative", False)):
+            (frames_dir / label).mkdir()
+            for i in range(8):
+                cv2.imwrite(str(frames_dir / label / f"region_{i}.png"), make_frame(with_phrase, seed=i))
+
+        model_path = frames_dir / "classifier.npz"
+        assert train_classifier(frames_dir, model_path)
+
+        detector = ClassifierDetector(model_path)
+        assert detector.detect(make_frame(True, seed=100))[0]
+        assert not detector.detect(make_frame(False, seed=101))[0]
+        print("✅ Classifier separates combat report from gameplay")
+
+if __name__ == "__main__":
+    test_template_detector()
+    test_classifier_detector()
+    print("\n🎉 Downtime detector tests completed!")
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared downtime monitor's event delivery (no display needed)
+"""
+
+from downtime_monitor import DowntimeMonitor, DOWNTIME_START, DOWNTIME_END
+
+def test_monitor_publishes_events():
+    """Transitions reach both callback and queue subscribers"""
+    monitor = DowntimeMonitor()
+    received = []
+    callback_token, _ = monitor.subscribe(received.append)
+    queue_token, events = monitor.subscribe()
+
+    monitor._on_transition(True, 0.9, 1.0, "combat report")
+    monitor._on_transition(False, 0.1, 2.0, "combat report")
+
+    assert [e["type"] for e in received] == [DOWNTIME_START, DOWNTIME_END]
+    assert received[0]["confidence"] == 0.9
+    assert "duration" in received[1]
+    assert events.get_nowait()["type"] == DOWNTIME_START
+    assert events.get_nowait()["type"] == DOWNTIME_END
+
+    # Unsubscribed consumers get nothing; a failing subscriber doesn't break others
+    monitor.unsubscribe(callback_token)
+    monitor.subscribe(lambda event: 1 / 0)
+    monitor._on_transition(True, 1.0, 3.0, "combat report")
+    assert len(received) == 2
+    assert events.get_nowait()["type"] == DOWNTIME_START
+    assert monitor.get_status()["is_downtime"]
+
+if __name__ == "__main__":
+    test_monitor_publishes_events()
+    print("\n🎉 Downtime monitor tests completed!")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for the downtime-budget utterance scheduler
+"""
+
+from downtime_scheduler import DowntimeScheduler, plan
+
+def test_plan_fills_budget():
+    """The knapsack picks the set that best fills the budget, earliest items on ties"""
+    assert plan([12.0, 4.0, 3.0], 7.5) == [1, 2]
+    assert plan([5.0, 5.0, 5.0], 10.0) == [0, 1]
+    assert plan([6.0, 2.0], 6.0) == [0]
+    assert plan([9.0], 8.0) == []
+    assert plan([1.0], 0.0) == []
+
+def test_expected_window_from_history():
+    """The remaining budget is conditioned on how long the window has been open"""
+    scheduler = DowntimeScheduler(quantile=0.25, default=15.0)
+    assert scheduler.remaining(5.0) == 10.0  # no history yet: the default
+
+    for duration in [8.0, 10.0, 12.0, 20.0]:
+        scheduler.record_window(duration)
+    assert scheduler.expected_window(0.0) == 10.0   # lower quartile of all windows
+    assert scheduler.remaining(11.0) == 1.0          # only the 12 s and 20 s windows got this far
+    assert scheduler.remaining(25.0) == 0.0          # longer than any window seen
+
+def test_choose_reorders_within_limits():
+    """A shorter bullet that fits goes first, but the head isn't passed over forever"""
+    scheduler = DowntimeScheduler(default=6.0, max_deferrals=2)
+    bullets = [12.0, 4.0, 3.0]
+    assert scheduler.choose(bullets, elapsed=0.0) == 1
+    assert scheduler.choose(bullets, elapsed=0.0) == 1
+    assert scheduler.choose(bullets, elapsed=0.0) == 0  # deferred twice: read in order now
+    assert scheduler.choose([12.0], elapsed=0.0) == 0
+
+def test_utilization():
+    """Seconds taught per second of downtime"""
+    scheduler = DowntimeScheduler()
+    scheduler.record_window(10.0)
+    scheduler.record_window(10.0)
+    scheduler.record_taught(15.0)
+    stats = scheduler.get_stats()
+    print(f"✅ Scheduler stats: {stats}")
+    assert stats["utilization"] == 0.75
+    assert stats["windows"] == 2
+
+if __name__ == "__main__":
+    test_plan_fills_budget()
+    test_expected_window_from_history()
+    test_choose_reorders_within_limits()
+    test_utilization()
+    print("\n🎉 Downtime scheduler tests completed!")
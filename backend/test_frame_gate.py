@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for the OCR frame-change gate
+"""
+
+import numpy as np
+from frame_gate import FrameChangeGate
+
+def test_frame_gate():
+    """Static frames skip OCR, changed frames go through"""
+    gate = FrameChangeGate()
+    frame = np.zeros((500, 500), dtype=np.uint8)
+
+    print("🧪 Testing frame-change gate...")
+
+    # First frame is always OCR'd
+    assert gate.should_ocr(frame)
+    gate.record(False)
+
+    # Identical and lightly-noised frames reuse the last verdict
+    assert not gate.should_ocr(frame.copy())
+    noisy = frame.copy()
+    noisy[10, 10] = 255
+    assert not gate.should_ocr(noisy)
+
+    # "Text" appearing in the region triggers OCR
+    text_frame = frame.copy()
+    text_frame[200:230, 100:400] = 255
+    assert gate.should_ocr(text_frame)
+    gate.record(True)
+    assert gate.last_verdict is True
+    assert not gate.should_ocr(text_frame.copy())
+
+    stats = gate.get_stats()
+    print(f"✅ Gate stats: {stats}")
+    assert stats["ocr_runs"] == 2
+    assert stats["ocr_skipped"] == 3
+
+def test_frame_gate_forced_refresh():
+    """A long run of identical frames is periodically re-verified"""
+    gate = FrameChangeGate(max_skipped_frames=3)
+    frame = np.zeros((500, 500), dtype=np.uint8)
+
+    assert gate.should_ocr(frame)
+    gate.record(False)
+    results = [gate.should_ocr(frame) for _ in range(4)]
+    assert results == [False, False, False, True]
+
+if __name__ == "__main__":
+    test_frame_gate()
+    test_frame_gate_forced_refresh()
+    print("\n🎉 Frame gate tests completed!")
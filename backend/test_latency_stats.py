@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test script for the rolling per-stage latency histograms
+"""
+
+import time
+from latency_stats import LatencyStats
+
+def test_latency_percentiles():
+    """Percentiles are computed over the rolling window only"""
+    stats = LatencyStats(window=100)
+    for ms in range(1, 101):
+        stats.record("ocr", 0.0, ms / 1000.0)
+
+    summary = stats.summary()["ocr"]
+    print(f"✅ OCR stage: {summary}")
+    assert summary["count"] == 100
+    assert 50 <= summary["p50"] <= 51
+    assert 99 <= summary["p99"] <= 100
+
+    # Older samples roll out of the window
+    for _ in range(100):
+        stats.record("ocr", 0.0, 0.001)
+    assert stats.summary()["ocr"]["p99"] == 1.0
+    assert "ocr 1.0/1.0/1.0" in stats.summary_line()
+
+def test_record_overhead():
+    """Recording a sample stays in the low-microsecond range"""
+    stats = LatencyStats()
+    start = time.perf_counter()
+    for _ in range(10000):
+        stats.record("grab", start)
+    per_call_us = (time.perf_counter() - start) / 10000 * 1e6
+    print(f"✅ record() overhead: {per_call_us:.2f} µs")
+    assert per_call_us < 50
+
+if __name__ == "__main__":
+    test_latency_percentiles()
+    test_record_overhead()
+    print("\n🎉 Latency stats tests completed!")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test script for sentence-level lesson chunks and clip durations
+"""
+
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import tempfile
+
+from lesson_chunks import split_sentences, estimate_duration, fits_remaining
+from tts_cache import AudioCache
+from tts_service import TTSService
+from tts_streaming import audio_duration, pcm_to_wav
+
+def test_split_sentences():
+    """Bullets split at sentence ends; short fragments stay with the next sentence"""
+    text = "Section: Photosynthesis. Plants turn light into sugar! Why? Chlorophyll absorbs red and blue light."
+    assert split_sentences(text) == [
+        "Section: Photosynthesis.",
+        "Plants turn light into sugar!",
+        "Why? Chlorophyll absorbs red and blue light."
+    ]
+    assert split_sentences('He said "stop." Then he left the room.') == ['He said "stop."', "Then he left the room."]
+    assert split_sentences("One sentence without an end") == ["One sentence without an end"]
+    assert split_sentences("  ") == []
+
+def test_fits_remaining():
+    """A chunk starts only if its audio ends before the window is expected to close"""
+    assert fits_remaining(4.0, elapsed=10.0, expected=15.0)
+    assert not fits_remaining(6.0, elapsed=10.0, expected=15.0)
+    assert abs(estimate_duration("x" * 28) - 2.0) < 1e-9
+
+def test_clip_duration_is_measured():
+    """Durations come from the synthesized audio, not the text length"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = TTSService()
+        service.cache = AudioCache(tmp)
+        clip = pcm_to_wav(b"\x00\x00" * 33075, 22050)  # 1.5 s
+        assert audio_duration(clip) == 1.5
+
+        assert service.clip_duration("Hello there.") is None
+        service.preload("Hello there.", clip, service.playback_format)
+        assert service.clip_duration("Hello there.") == 1.5
+
+if __name__ == "__main__":
+    test_split_sentences()
+    test_fits_remaining()
+    test_clip_duration_is_measured()
+    print("\n🎉 Lesson chunk tests completed!")
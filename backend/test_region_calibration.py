@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test script for OCR region calibration and calibrated profiles (no tesseract needed)
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from detector_profiles import DetectorProfile, calibrated
+from downtime_detector import OcrDetector
+from region_calibration import phrase_box, padded_box
+
+def test_phrase_box_and_padding():
+    """Word boxes of the phrase are merged, padded and clamped to the frame"""
+    data = {
+        "text": ["", "Match", "COMBAT", "Report:", "", "kills"],
+        "left": [0, 10, 100, 190, 0, 100],
+        "top": [0, 5, 200, 202, 0, 300],
+        "width": [500, 60, 80, 70, 0, 40],
+        "height": [500, 20, 24, 22, 0, 20]
+    }
+    assert phrase_box(data, "combat report") == (100, 200, 160, 24)
+    assert phrase_box(data, "you are dead") is None
+
+    assert padded_box([(100, 200, 160, 26), (95, 198, 160, 26)], (500, 500), padding=10) == (85, 188, 185, 48)
+    assert padded_box([(2, 490, 10, 10)], (500, 500), padding=10) == (0, 480, 22, 20)
+
+def test_calibrated_profile_and_scaled_ocr():
+    """Calibration files replace the region and scale the OCR input down"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "test_calibration.json"
+        profile = DetectorProfile("test", "test", "combat report",
+                                  {"top": 450, "left": 2050, "width": 500, "height": 500},
+                                  backend="ocr", calibration_path=path)
+        assert calibrated(profile) is profile
+
+        path.write_text(json.dumps({"phrase": "combat report", "scale": 0.5,
+                                    "region": {"top": 640, "left": 2150, "width": 185, "height": 48}}))
+        tuned = calibrated(profile)
+        assert tuned.region == {"top": 640, "left": 2150, "width": 185, "height": 48}
+        assert tuned.scale == 0.5
+        assert profile.region["width"] == 500  # the registry entry is untouched
+
+        path.write_text(json.dumps({"phrase": "you are dead", "region": tuned.region}))
+        assert calibrated(profile) is profile
+
+    detector = OcrDetector(scale=0.5)
+    assert detector.preprocess(np.zeros((48, 185), dtype=np.uint8)).shape == (24, 92)
+
+if __name__ == "__main__":
+    test_phrase_box_and_padding()
+    test_calibrated_profile_and_scaled_ocr()
+    print("\n🎉 Region calibration tests completed!")
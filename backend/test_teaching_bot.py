@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script for TeachingBot's sentence-by-sentence reading and downtime subscription
+(needs the server's dependencies; speech and the monitor are replaced by fakes)
+"""
+
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import threading
+import time
+
+import server
+
+class FinishedSpeech:
+    """A SpeechHandle that has already played its whole clip"""
+    cancelled = False
+    result = True
+
+    def wait(self, timeout=None):
+        return True
+
+class CountingMonitor:
+    """Stand-in DowntimeMonitor that counts start/stop calls; unsubscribing is slow"""
+    def __init__(self):
+        self.starts = 0
+        self.stops = 0
+
+    def subscribe(self, callback=None):
+        return 1, None
+
+    def unsubscribe(self, token):
+        time.sleep(0.05)
+
+    def start(self):
+        self.starts += 1
+
+    def stop(self):
+        self.stops += 1
+
+def test_racing_stops_release_monitor_once():
+    """stop_teaching_session and the end of teach_content can't both release the shared monitor"""
+    bot = server.TeachingBot()
+    monitor = CountingMonitor()
+    original = server.downtime_monitor
+    server.downtime_monitor = monitor
+    try:
+        bot.start_downtime_detection()
+        threads = [threading.Thread(target=bot.stop_downtime_detection) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        server.downtime_monitor = original
+
+    print(f"✅ Monitor starts/stops: {monitor.starts}/{monitor.stops}")
+    assert monitor.starts == 1 and monitor.stops == 1
+    assert bot.downtime_subscription is None
+
+def test_downtime_end_stops_between_sentences():
+    """Once downtime ends, the sentence after the one playing is left for the next window"""
+    bot = server.TeachingBot()
+    bot.teaching_active = True
+    bot.is_downtime = True
+    bot.downtime_started_at = time.time()
+    spoken = []
+
+    def speak_async(text, budget=None):
+        spoken.append(text)
+        bot.is_downtime = False  # the game resumes while the first sentence plays
+        return FinishedSpeech()
+
+    original = server.speak_async
+    server.speak_async = speak_async
+    try:
+        bullet = {
+            'subtopic_idx': 0,
+            'bullet_idx': 0,
+            'section_title': "Photosynthesis",
+            'bullet_point': "Plants turn light into sugar. Chlorophyll absorbs red and blue light."
+        }
+        bot.current_chunks = ["Plants turn light into sugar.", "Chlorophyll absorbs red and blue light."]
+        bot.current_chunk_index = 0
+        assert bot.read_bullet_point(bullet) is None
+    finally:
+        server.speak_async = original
+
+    print(f"✅ Spoken before downtime ended: {spoken}")
+    assert spoken == ["Plants turn light into sugar."]
+    assert bot.current_chunk_index == 1  # the second sentence is read in the next window
+
+if __name__ == "__main__":
+    test_downtime_end_stops_between_sentences()
+    test_racing_stops_release_monitor_once()
+    print("\n🎉 Teaching bot tests completed!")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script for the downtime transition debouncer
+"""
+
+from transition_debouncer import TransitionDebouncer
+
+def feed(debouncer, verdicts, start=0.0, step=0.1):
+    """Feed (detected, confidence) pairs at a fixed frame interval; return the transitions"""
+    transitions = []
+    for i, (detected, confidence) in enumerate(verdicts):
+        state = debouncer.update(detected, confidence, start + i * step)
+        if state is not None:
+            transitions.append((round(start + i * step, 2), state))
+    return transitions
+
+def test_single_frame_flaps_are_suppressed():
+    """Isolated misreads never publish a transition and are counted"""
+    debouncer = TransitionDebouncer(window=4, enter_frames=2, exit_frames=3, min_dwell=0.0)
+    hit, miss = (True, 1.0), (False, 0.0)
+
+    assert feed(debouncer, [miss, hit, miss, miss, miss, miss, hit, miss, miss, miss, miss]) == []
+    stats = debouncer.get_stats()
+    print(f"✅ Flap stats: {stats}")
+    assert stats["suppressed_flaps"] == 2 and stats["transitions"] == 0
+
+    # A real death screen (sustained hits) still gets through after 2 frames
+    transitions = feed(debouncer, [hit, hit, hit, miss, hit, hit, miss, miss, miss], start=2.0)
+    assert transitions == [(2.1, True), (2.8, False)]
+
+def test_min_dwell_and_exit_confidence():
+    """Transitions wait out the dwell time; borderline frames keep downtime on"""
+    debouncer = TransitionDebouncer(window=2, enter_frames=1, exit_frames=2, min_dwell=1.0,
+                                    enter_confidence=0.7, exit_confidence=0.5)
+
+    # 0.6 is below the entry bar, 0.9 enters
+    assert feed(debouncer, [(True, 0.6), (True, 0.9)]) == [(0.1, True)]
+
+    # Within downtime, 0.6 counts as still visible; misses inside the dwell time are held back
+    transitions = feed(debouncer, [(False, 0.6), (False, 0.0), (False, 0.0), (False, 0.0)], start=0.5)
+    assert transitions == []
+    assert debouncer.get_stats()["dwell_blocked"] == 2  # frames at 0.7s and 0.8s
+    assert feed(debouncer, [(False, 0.0)], start=1.2) == [(1.2, False)]
+
+if __name__ == "__main__":
+    test_single_frame_flaps_are_suppressed()
+    test_min_dwell_and_exit_confidence()
+    print("\n🎉 Debouncer tests completed!")
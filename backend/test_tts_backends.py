@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Test script for the local TTS fallback, per-backend latency and synthesis profiles
+(no network, sound card or speech engine needed: a fake espeak-ng is used)
+"""
+
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import json
+import struct
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from tts_backends import LocalTTSBackend, normalize_wav
+from tts_cache import AudioCache
+from tts_service import TTSService
+from tts_streaming import audio_duration, pcm_to_wav
+
+RATE = 22050
+
+# Writes 0.25 s of silence as a WAV to stdout with streaming placeholder sizes, like espeak-ng --stdout
+FAKE_ESPEAK = f"""#!{sys.executable}
+import struct, sys
+sys.stdin.read()
+pcm = b"\\x00\\x00" * {RATE // 4}
+fmt = struct.pack("<HHIIHH", 1, 1, {RATE}, {RATE * 2}, 2, 16)
+sys.stdout.buffer.write(b"RIFF" + struct.pack("<I", 0x7ffff024) + b"WAVE"
+                        + b"fmt " + struct.pack("<I", 16) + fmt
+                        + b"data" + struct.pack("<I", 0x7ffff000) + pcm)
+"""
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Stand-in Eleven Labs endpoint that takes 1 s to answer"""
+    requests_seen = 0
+
+    def do_POST(self):
+        SlowHandler.requests_seen += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(1.0)
+        try:
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+class ProfileHandler(BaseHTTPRequestHandler):
+    """Stand-in Eleven Labs endpoint that records the model and format asked for"""
+    requests_seen = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        output_format = parse_qs(urlparse(self.path).query).get("output_format", [None])[0]
+        ProfileHandler.requests_seen.append((body["model_id"], output_format))
+        audio_data = pcm_to_wav(b"\x00\x00" * (RATE // 10), RATE)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(audio_data)))
+        self.end_headers()
+        self.wfile.write(audio_data)
+
+    def log_message(self, *args):
+        pass
+
+def make_engine(tmp):
+    path = os.path.join(tmp, "espeak-ng")
+    with open(path, "w") as f:
+        f.write(FAKE_ESPEAK)
+    os.chmod(path, 0o755)
+    return LocalTTSBackend("espeak-ng", path)
+
+def make_service(tmp, engine):
+    service = TTSService()
+    service.streaming = False
+    service.cache = AudioCache(os.path.join(tmp, "cache"))
+    service.local = engine
+    return service
+
+def test_local_engine_output():
+    """The engine's streamed WAV is rewritten with real sizes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        audio_data = make_engine(tmp).synthesize("Hello there.")
+        assert audio_data[:4] == b"RIFF"
+        assert struct.unpack("<I", audio_data[40:44])[0] == 2 * (RATE // 4)
+        assert abs(audio_duration(audio_data) - 0.25) < 0.001
+    assert normalize_wav(b"ID3 not a wav") == b"ID3 not a wav"
+
+def test_offline_uses_local_engine():
+    """Without an API key uncached speech comes from the local engine"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(tmp, make_engine(tmp))
+        service.api_key = None
+        assert service.speak("Plants turn light into sugar.")
+
+        stats = service.get_backend_stats()
+        print(f"✅ Offline backend stats: {stats}")
+        assert stats["local:espeak-ng"]["requests"] == 1
+        assert "elevenlabs" not in stats
+
+def test_slow_remote_falls_back():
+    """A remote that misses the latency budget is replaced by the local engine for a while"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(tmp, make_engine(tmp))
+        service.api_key = "test"
+        service.base_url = f"http://127.0.0.1:{server.server_port}"
+        service.latency_budget = 0.2
+
+        start = time.perf_counter()
+        assert service.speak("Chlorophyll absorbs red and blue light.")
+        assert time.perf_counter() - start < 1.0  # didn't wait for the remote
+        assert service.speak("Light reactions happen in the thylakoids.")
+        assert SlowHandler.requests_seen == 1  # cooling down: the remote wasn't asked again
+
+        # A clip the remote already made still plays in the remote voice
+        clip = pcm_to_wav(b"\x00\x00" * (RATE // 10), RATE)
+        service.preload("Cached sentence.", clip)
+        assert service.speak("Cached sentence.")
+
+        stats = service.get_backend_stats()
+        print(f"✅ Fallback backend stats: {stats}")
+        assert stats["elevenlabs"]["failures"] == 1
+        assert stats["local:espeak-ng"]["requests"] == 2
+        assert "latency_ms_p50" in stats["local:espeak-ng"]
+    server.shutdown()
+
+def test_profile_follows_downtime_budget():
+    """Uncached speech uses the quality profile early in a window and the fast one near its end"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ProfileHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(tmp, None)
+        service.api_key = "test"
+        service.base_url = f"http://127.0.0.1:{server.server_port}"
+        assert service.choose_profile(None) == "quality"
+        assert service.choose_profile(12.0) == "quality"  # a typical window, just opened
+        assert service.choose_profile(8.0) == "quality"
+        assert service.choose_profile(4.0) == "fast"      # the window is almost over
+
+        handle = service.speak_async("The window is closing.", budget=4.0)
+        assert handle.wait(timeout=5) and handle.tier == "fast"
+        assert ProfileHandler.requests_seen[-1] == ("eleven_flash_v2_5", "mp3_22050_32")
+
+        assert service.synthesize("Prefetched in the background.") is not None
+        assert ProfileHandler.requests_seen[-1] == ("eleven_monolingual_v1", None)
+        handle = service.speak_async("Prefetched in the background.", budget=4.0)
+        assert handle.wait(timeout=5) and handle.tier == "cached:quality"
+
+        handle = service.speak_async("The window is closing.")
+        assert handle.wait(timeout=5) and handle.tier == "cached:fast"
+
+        handle = service.speak_async("The window just opened.", budget=12.0)
+        assert handle.wait(timeout=5) and handle.tier == "quality"
+        assert ProfileHandler.requests_seen[-1] == ("eleven_monolingual_v1", None)
+        assert len(ProfileHandler.requests_seen) == 3
+
+        stats = service.get_tier_stats()
+        print(f"✅ Tier stats: {stats}")
+        assert set(stats) == {"fast", "quality", "cached:quality", "cached:fast"}
+        assert "latency_ms_p50" in stats["fast"]
+    server.shutdown()
+
+if __name__ == "__main__":
+    test_local_engine_output()
+    test_offline_uses_local_engine()
+    test_slow_remote_falls_back()
+    test_profile_follows_downtime_budget()
+    print("\n🎉 TTS backend tests completed!")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test script for the on-disk TTS audio cache (no network needed)
+"""
+
+import os
+import tempfile
+import time
+
+from tts_cache import AudioCache, cache_key
+
+SETTINGS = {"stability": 0.5, "similarity_boost": 0.75}
+
+def test_cache_key():
+    """Keys change with anything that changes the audio, not with dict order"""
+    key = cache_key("Hello", "voice", "model", SETTINGS)
+    assert key == cache_key("Hello", "voice", "model", dict(reversed(list(SETTINGS.items()))))
+    assert key != cache_key("Hello.", "voice", "model", SETTINGS)
+    assert key != cache_key("Hello", "voice", "other_model", SETTINGS)
+    assert key != cache_key("Hello", "voice", "model", {**SETTINGS, "stability": 0.6})
+
+def test_lru_eviction_and_persistence():
+    """Least recently used clips go first, and the cache survives a restart"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = AudioCache(tmp, max_bytes=250)
+        assert cache.get("a") is None
+        cache.put("a", b"a" * 100)
+        time.sleep(0.01)
+        cache.put("b", b"b" * 100)
+        assert cache.get("a") == b"a" * 100  # 'a' is now the most recent
+        cache.put("c", b"c" * 100)           # over the cap: 'b' is evicted
+
+        stats = cache.get_stats()
+        print(f"✅ Cache stats: {stats}")
+        assert "b" not in cache and "a" in cache and "c" in cache
+        assert stats["hits"] == 1 and stats["misses"] == 1 and stats["evictions"] == 1
+        assert stats["bytes"] == 200
+
+        reopened = AudioCache(tmp, max_bytes=250)
+        assert reopened.get("c") == b"c" * 100
+        assert sorted(os.listdir(tmp)) == sorted(f"{k}.audio" for k in ("a", "c"))
+
+if __name__ == "__main__":
+    test_cache_key()
+    test_lru_eviction_and_persistence()
+    print("\n🎉 TTS cache tests completed!")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test script for compiled lesson audio packs (no network or sound card needed)
+"""
+
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tts_cache import AudioCache
+from tts_pack import LessonPack, compile_lesson, pack_path, write_pack
+from tts_service import TTSService
+from tts_streaming import pcm_to_wav
+
+RATE = 22050
+CLIP = pcm_to_wav(b"\x00\x00" * (RATE // 10), RATE)  # 0.1 s of silence
+
+class FailingHandler(BaseHTTPRequestHandler):
+    """Stand-in Eleven Labs endpoint that rejects texts containing 'fail'"""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if b"fail" in body:
+            self.send_response(400)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(CLIP)))
+        self.end_headers()
+        self.wfile.write(CLIP)
+
+    def log_message(self, *args):
+        pass
+
+class BlockingMap:
+    """mmap stand-in whose reads wait for an event"""
+
+    def __init__(self, target, reading, release):
+        self.target = target
+        self.reading = reading
+        self.release = release
+
+    def __getitem__(self, item):
+        self.reading.set()
+        self.release.wait(timeout=5)
+        return self.target[item]
+
+    def close(self):
+        self.target.close()
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Stand-in Eleven Labs endpoint: 200 ms per clip"""
+    requests_seen = 0
+
+    def do_POST(self):
+        SlowHandler.requests_seen += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(0.2)
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/wav")
+        self.send_header("Content-Length", str(len(CLIP)))
+        self.end_headers()
+        self.wfile.write(CLIP)
+
+    def log_message(self, *args):
+        pass
+
+def test_pack_round_trip():
+    """Clips come back byte for byte through the memory-mapped index"""
+    with tempfile.TemporaryDirectory() as tmp:
+        clips = {"a": b"first clip", "b": b"", "c": b"\x00\xff" * 1000}
+        path = pack_path(clips, tmp)
+        assert path == pack_path(["c", "b", "a"], tmp)  # key order doesn't matter
+        write_pack(path, clips, {"voice_id": "test"})
+
+        pack = LessonPack(path)
+        for key, audio_data in clips.items():
+            assert pack.get(key) == audio_data
+        assert pack.get("missing") is None
+        assert len(pack) == 3 and pack.metadata["voice_id"] == "test"
+        pack.close()
+        assert pack.get("a") is None  # closed: callers fall back to the cache
+
+def test_close_waits_for_readers():
+    """Closing a pack mid-read unmaps it only once the read is done"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pack_path(["a"], tmp)
+        write_pack(path, {"a": b"first clip"})
+        pack = LessonPack(path)
+        mapped = pack.map
+        reading, release = threading.Event(), threading.Event()
+        pack.map = BlockingMap(mapped, reading, release)
+
+        result = []
+        reader = threading.Thread(target=lambda: result.append(pack.get("a")))
+        reader.start()
+        assert reading.wait(timeout=5)
+        pack.close()
+        assert not mapped.closed  # still being read
+        release.set()
+        reader.join(timeout=5)
+        assert result == [b"first clip"]
+        assert mapped.closed and pack.file.closed
+
+def test_failed_clips_are_skipped():
+    """A clip that can't be synthesized is left out of the pack instead of losing the rest"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FailingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    texts = ["Bullet 0", "Bullet 1 will fail", "Bullet 2"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = TTSService()
+        service.api_key = "test"
+        service.local = None
+        service.streaming = False
+        service.base_url = f"http://127.0.0.1:{server.server_port}/v1"
+        service.cache = AudioCache(os.path.join(tmp, "cache"))
+
+        pack = compile_lesson(service, texts, os.path.join(tmp, "packs"))
+        print(f"✅ Partial pack: {pack.get_stats()}, missing {pack.metadata['missing']}")
+        assert len(pack) == 2 and pack.metadata["missing"] == ["Bullet 1 will fail"]
+        assert pack.path != pack_path([service.cache_key(t) for t in texts], os.path.join(tmp, "packs"))
+
+        # Clips in the pack aren't kept twice
+        assert service.cache.get_stats()["entries"] == 2
+        service.set_pack(pack)
+        assert service.cache.get_stats()["entries"] == 0
+        assert service.speak("Bullet 0")
+        service.set_pack(None)
+
+    server.shutdown()
+
+def test_compile_lesson_then_teach_offline():
+    """Compiling is concurrent; the pack is reused and played with no requests"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    texts = [f"Section: Intro. Bullet {i}" if i == 0 else f"Bullet {i}" for i in range(8)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = TTSService()
+        service.api_key = "test"
+        service.streaming = False
+        service.base_url = f"http://127.0.0.1:{server.server_port}/v1"
+        service.cache = AudioCache(os.path.join(tmp, "cache"))
+
+        start = time.perf_counter()
+        pack = compile_lesson(service, texts, os.path.join(tmp, "packs"), workers=4)
+        elapsed = time.perf_counter() - start
+        print(f"✅ Compiled {len(pack)} clips in {elapsed * 1000:.0f} ms")
+        assert len(pack) == 8 and SlowHandler.requests_seen == 8
+        assert elapsed < 8 * 0.2 / 2  # concurrent, not one after another
+        pack.close()
+
+        # Restart with no network and an empty cache: the pack on disk is reused
+        offline = TTSService()
+        offline.api_key = None
+        offline.streaming = False
+        offline.cache = AudioCache(os.path.join(tmp, "other_cache"))
+        offline.set_pack(compile_lesson(offline, texts, os.path.join(tmp, "packs")))
+        for text in texts[:2]:
+            assert offline.speak(text)
+        assert SlowHandler.requests_seen == 8
+        assert offline.get_pack_stats()["hits"] == 2
+        offline.set_pack(None)
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    test_pack_round_trip()
+    test_close_waits_for_readers()
+    test_failed_clips_are_skipped()
+    test_compile_lesson_then_teach_offline()
+    print("\n🎉 Lesson pack tests completed!")
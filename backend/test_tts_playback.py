@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Test script for speak_async handles, end-event driven playback and pause/resume
+(no network or sound card needed)
+"""
+
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tts_cache import AudioCache
+from tts_service import TTSService
+from tts_streaming import pcm_to_wav
+
+RATE = 22050
+
+class EndlessHandler(BaseHTTPRequestHandler):
+    """Stand-in streaming endpoint that trickles silence for 10 s"""
+    disconnected = threading.Event()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/pcm")
+        self.end_headers()
+        try:
+            for _ in range(100):
+                self.wfile.write(b"\x00\x00" * (RATE // 10))
+                self.wfile.flush()
+                time.sleep(0.1)
+        except OSError:
+            EndlessHandler.disconnected.set()
+
+    def log_message(self, *args):
+        pass
+
+def make_service(tmp, streaming=False):
+    service = TTSService()
+    service.api_key = None  # any network request would fail
+    service.streaming = streaming
+    service.cache = AudioCache(tmp)
+    return service
+
+def test_speak_async_completes():
+    """The handle is done when the clip has played, not before"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(tmp)
+        service.preload("Hello", pcm_to_wav(b"\x00\x00" * (RATE // 2), RATE))  # 0.5 s
+
+        handle = service.speak_async("Hello")
+        assert not handle.done()
+        assert handle.wait(timeout=3)
+        elapsed = handle.finished_at - handle.created_at
+        print(f"✅ 0.5 s clip done after {elapsed * 1000:.0f} ms (events: {service.events.available})")
+        assert handle.result and not handle.cancelled
+        assert 0.4 < elapsed < 1.0
+        assert not service.get_speaking_status()
+        assert not handle.cancel()  # already finished
+
+def test_cancel_stops_playback():
+    """cancel() ends a playing clip right away"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(tmp)
+        service.preload("Long", pcm_to_wav(b"\x00\x00" * RATE * 5, RATE))  # 5 s
+
+        handle = service.speak_async("Long")
+        time.sleep(0.3)
+        start = time.perf_counter()
+        assert handle.cancel()
+        assert handle.wait(timeout=1)
+        print(f"✅ Playback cancelled in {(time.perf_counter() - start) * 1000:.0f} ms")
+        assert handle.cancelled and not handle.result
+
+def test_cancel_stops_streaming_synthesis():
+    """cancel() abandons an in-progress download and nothing partial is cached"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EndlessHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(tmp, streaming=True)
+        service.api_key = "test"
+        service.base_url = f"http://127.0.0.1:{server.server_port}/v1"
+
+        handle = service.speak_async("Endless")
+        time.sleep(0.5)
+        handle.cancel()
+        assert handle.wait(timeout=1)
+        assert handle.cancelled and not handle.result
+        assert EndlessHandler.disconnected.wait(timeout=2)
+        assert service.get_cache_stats()["entries"] == 0
+
+    server.shutdown()
+
+def test_stop_while_preparing():
+    """stop() also cancels a handle still waiting on its prefetch; it never plays"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(tmp)
+        service.preload("Prefetched", pcm_to_wav(b"\x00\x00" * (RATE // 2), RATE))
+        preparing = threading.Event()
+        release = threading.Event()
+
+        def prepare(text):
+            preparing.set()
+            release.wait(timeout=2)
+
+        handle = service.speak_async("Prefetched", prepare=prepare)
+        assert preparing.wait(timeout=1)
+        service.stop()
+        release.set()
+        assert handle.wait(timeout=1)
+        assert handle.cancelled and not handle.result
+        assert service.get_latency_stats()["count"] == 0  # nothing started playing
+
+        # Handles created after the stop play normally
+        assert service.speak_async("Prefetched").wait(timeout=3)
+
+def test_newer_speech_interrupts_older():
+    """Starting a new utterance cancels the one in progress"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(tmp)
+        service.preload("First", pcm_to_wav(b"\x00\x00" * RATE * 5, RATE))
+        service.preload("Second", pcm_to_wav(b"\x00\x00" * (RATE // 5), RATE))
+
+        first = service.speak_async("First")
+        time.sleep(0.3)
+        second = service.speak_async("Second")
+        assert first.wait(timeout=1) and first.cancelled
+        assert second.wait(timeout=2) and second.result
+
+def test_pause_resumes_at_offset():
+    """A paused clip continues where it stopped, without replaying or re-synthesizing"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(tmp)
+        service.preload("Bullet", pcm_to_wav(b"\x00\x00" * RATE, RATE))  # 1 s
+
+        handle = service.speak_async("Bullet")
+        time.sleep(0.6)
+        assert service.pause()
+        time.sleep(0.5)
+        assert not handle.done()  # paused is not finished
+        assert service.resume()
+        resumed = time.perf_counter()
+        assert handle.wait(timeout=2) and handle.result
+
+        remaining = handle.finished_at - resumed
+        stats = service.get_resume_stats()
+        print(f"✅ Finished {remaining * 1000:.0f} ms after resuming; {stats}")
+        assert remaining < 0.7  # only the rest of the clip was played
+        assert stats["resumes"] == 1 and 0.5 <= stats["audio_seconds_saved"] <= 0.8
+        assert stats["api_calls_saved"] == 0  # the whole clip was cached already
+
+def test_pause_during_streaming_saves_request():
+    """Pausing a clip that is still downloading avoids requesting it again"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EndlessHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = make_service(tmp, streaming=True)
+        service.api_key = "test"
+        service.base_url = f"http://127.0.0.1:{server.server_port}/v1"
+
+        handle = service.speak_async("Endless")
+        time.sleep(0.5)
+        assert service.pause()
+        time.sleep(0.2)
+        assert service.resume()
+        assert service.get_resume_stats()["api_calls_saved"] == 1
+        handle.cancel()
+        assert handle.wait(timeout=1)
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    test_speak_async_completes()
+    test_cancel_stops_playback()
+    test_cancel_stops_streaming_synthesis()
+    test_stop_while_preparing()
+    test_newer_speech_interrupts_older()
+    test_pause_resumes_at_offset()
+    test_pause_during_streaming_saves_request()
+    print("\n🎉 TTS playback tests completed!")
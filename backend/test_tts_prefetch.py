@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for lookahead TTS synthesis (no network or sound card needed)
+"""
+
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import tempfile
+import threading
+import time
+
+from tts_cache import AudioCache
+from tts_prefetch import SpeechPrefetcher
+from tts_service import TTSService
+from tts_streaming import pcm_to_wav
+
+class SlowService:
+    """Stand-in TTSService: synthesis takes 50 ms and concurrency is tracked"""
+    playback_format = None
+
+    def __init__(self):
+        self.preloaded = {}
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def synthesize(self, text, output_format=None):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return text.encode()
+
+    def preload(self, text, audio_data, output_format=None):
+        self.preloaded[text] = audio_data
+
+    def clear_preloaded(self):
+        self.preloaded.clear()
+
+def test_prefetch_depth_concurrency_and_invalidation():
+    """Only the next `depth` texts are synthesized, `workers` at a time; reloads discard them"""
+    service = SlowService()
+    prefetcher = SpeechPrefetcher(service, depth=3, workers=2)
+
+    prefetcher.update(["one", "two", "three", "four"])
+    prefetcher.update(["one", "two", "three", "four"])  # no duplicate requests
+    prefetcher.wait("three")
+    assert set(service.preloaded) == {"one", "two", "three"}
+    assert service.max_active == 2
+    assert prefetcher.get_stats()["requested"] == 3
+
+    # Content reloaded while a request is in flight: its result is dropped
+    prefetcher.update(["two", "three", "four"])
+    prefetcher.invalidate()
+    time.sleep(0.15)
+    stats = prefetcher.get_stats()
+    print(f"✅ Prefetch stats: {stats}")
+    assert service.preloaded == {}
+    assert stats["discarded"] == 1
+
+def test_preloaded_audio_plays_without_request():
+    """speak() starts a preloaded clip straight from memory"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = TTSService()
+        service.api_key = None  # any network request would fail
+        service.cache = AudioCache(tmp)
+        clip = pcm_to_wav(b"\x00\x00" * 2205, 22050)  # 0.1 s of silence
+        service.preload("Hello", clip, service.playback_format)
+
+        assert service.speak("Hello")
+        assert service.get_latency_stats()["last_ms"] < 100
+        assert service.get_cache_stats()["misses"] == 0
+
+if __name__ == "__main__":
+    test_prefetch_depth_concurrency_and_invalidation()
+    test_preloaded_audio_plays_without_request()
+    print("\n🎉 TTS prefetch tests completed!")
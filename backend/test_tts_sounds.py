@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the decoded clip cache and channel playback (no sound card needed)
+"""
+
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import tempfile
+from pathlib import Path
+
+import pygame
+from tts_cache import AudioCache
+from tts_service import TTSService
+from tts_sounds import SoundCache, sound_bytes
+from tts_streaming import pcm_to_wav
+
+RATE = 22050
+
+def clip(seconds: float) -> bytes:
+    return pcm_to_wav(b"\x00\x00" * int(RATE * seconds), RATE)
+
+def test_eviction_by_size():
+    """The least recently played clips go once the decoded total exceeds the limit"""
+    TTSService()  # initializes the mixer
+    one = SoundCache().decode("probe", clip(0.5))
+    size = sound_bytes(one)
+
+    sounds = SoundCache(limit_bytes=int(size * 2.5))
+    sounds.decode("a", clip(0.5))
+    sounds.decode("b", clip(0.5))
+    assert sounds.get("a") is not None  # a is now the most recently played
+    sounds.decode("c", clip(0.5))
+    assert "a" in sounds and "c" in sounds and "b" not in sounds
+
+    assert sounds.decode("huge", clip(2.0)) is not None  # too big to keep, still playable
+    assert "huge" not in sounds
+
+    stats = sounds.get_stats()
+    print(f"✅ Sound cache stats: {stats}")
+    assert stats["evictions"] == 1 and stats["clips"] == 2
+    assert sounds.decode("broken", b"not audio") is None
+
+def test_replay_from_decoded_cache():
+    """Prefetched clips are decoded ahead of time and start on a channel without decoding"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = TTSService()
+        service.api_key = None
+        service.local = None
+        service.streaming = False
+        service.cache = AudioCache(tmp)
+
+        service.preload("Hello there.", clip(0.3))
+        sound = service.sounds.get(service.cache_key("Hello there."))
+        assert sound is not None
+        decode_ms = service.get_sound_stats()["decode_ms"]
+
+        played = []
+        play_sound = service._play_sound
+        service._play_sound = lambda s, is_cancelled: played.append(s) or play_sound(s, is_cancelled)
+
+        assert service.speak("Hello there.")
+        assert service.speak("Hello there.")
+        stats = service.get_sound_stats()
+        print(f"✅ Replayed from decoded cache: {stats}")
+        assert stats["hits"] == 3 and stats["misses"] == 0 and stats["decode_ms"] == decode_ms
+        assert len(played) == 2 and all(s is sound for s in played)  # no new decode, same Sound
+        assert service.sound_channel is None
+
+def test_mp3_decoded_once():
+    """An MP3's duration comes from the Sound it will be played from, not from a second decode"""
+    mp3 = (Path(pygame.__file__).parent / "examples" / "data" / "house_lo.mp3").read_bytes()
+    with tempfile.TemporaryDirectory() as tmp:
+        service = TTSService()
+        service.api_key = None
+        service.local = None
+        service.streaming = False
+        service.cache = AudioCache(tmp)
+
+        decodes = []
+        sound_class = pygame.mixer.Sound
+        pygame.mixer.Sound = lambda *args, **kwargs: decodes.append(1) or sound_class(*args, **kwargs)
+        try:
+            service.preload("An MP3 clip.", mp3)
+            duration = service.clip_duration("An MP3 clip.")
+        finally:
+            pygame.mixer.Sound = sound_class
+
+        sound = service.sounds.get(service.cache_key("An MP3 clip."))
+        print(f"✅ MP3 clip of {duration:.2f}s decoded {len(decodes)} time(s)")
+        assert len(decodes) == 1
+        assert sound is not None and duration == sound.get_length()
+
+if __name__ == "__main__":
+    test_eviction_by_size()
+    test_replay_from_decoded_cache()
+    test_mp3_decoded_once()
+    print("\n🎉 Sound cache tests completed!")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming TTS playback against a local server that trickles audio
+(no network or sound card needed)
+"""
+
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+from tts_cache import AudioCache
+from tts_service import TTSService
+
+RATE = 22050
+CHUNKS = 10
+CHUNK_DELAY = 0.1  # 1 s of audio delivered over ~1 s
+
+class TrickleHandler(BaseHTTPRequestHandler):
+    """Stand-in for the Eleven Labs streaming endpoint"""
+    requests_seen = 0
+
+    def do_POST(self):
+        TrickleHandler.requests_seen += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        assert self.path.endswith("/stream?output_format=pcm_22050")
+
+        tone = (3000 * np.sin(np.arange(RATE) * 2 * np.pi * 440 / RATE)).astype("<i2").tobytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/pcm")
+        self.end_headers()
+        step = len(tone) // CHUNKS
+        for i in range(0, len(tone), step):
+            self.wfile.write(tone[i:i + step])
+            self.wfile.flush()
+            time.sleep(CHUNK_DELAY)
+
+    def log_message(self, *args):
+        pass
+
+def test_streaming_starts_before_download_ends():
+    """Playback starts on the first buffered audio; the finished clip is cached"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TrickleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = TTSService()
+        service.api_key = "test"
+        service.streaming = True
+        service.base_url = f"http://127.0.0.1:{server.server_port}/v1"
+        service.cache = AudioCache(tmp)
+
+        start = time.perf_counter()
+        assert service.speak("Streaming test")
+        total = time.perf_counter() - start
+
+        stats = service.get_latency_stats()
+        print(f"✅ First sound after {stats['last_ms']} ms, clip done after {total * 1000:.0f} ms")
+        assert stats["last_ms"] < CHUNKS * CHUNK_DELAY * 1000 * 0.6
+        assert total >= 1.0  # the whole second of audio was played
+
+        # Second time: served from the cache, no request
+        assert service.speak("Streaming test")
+        assert TrickleHandler.requests_seen == 1
+        assert service.get_cache_stats()["hits"] == 1
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    test_streaming_starts_before_download_ends()
+    print("\n🎉 Streaming TTS tests completed!")
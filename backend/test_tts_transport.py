@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the pooled, retrying TTS HTTP transport (local server, no network)
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from tts_transport import TTSTransport
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Keep-alive server whose first request fails with 503 and '/hang' never answers in time"""
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    requests_seen = 0
+
+    def setup(self):
+        FlakyHandler.connections += 1
+        super().setup()
+
+    def do_POST(self):
+        FlakyHandler.requests_seen += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/hang":
+            time.sleep(0.5)
+        status = 503 if FlakyHandler.requests_seen == 1 else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "5")
+        self.end_headers()
+        self.wfile.write(b"audio")
+
+    def log_message(self, *args):
+        pass
+
+class RejectingHandler(BaseHTTPRequestHandler):
+    """Answers every request with 401, like a bad API key"""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"detail": "invalid api key"}'
+        self.send_response(401)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def test_rejected_stream_releases_connection():
+    """A non-retryable 4xx on a streamed request gives its connection back to the pool"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RejectingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/tts"
+    transport = TTSTransport(max_retries=2, backoff=0.01, pool_size=2)
+
+    for _ in range(3):
+        try:
+            transport.post(url, json={"text": "hi"}, stream=True)
+            assert False, "expected a 401"
+        except requests.HTTPError as e:
+            assert e.response.status_code == 401
+
+    pools = transport.session.get_adapter(url).poolmanager.pools
+    pool = pools[next(iter(pools.keys()))]
+    assert pool.pool.qsize() == 2  # nothing left checked out
+    assert pool.num_connections == 1  # and the one connection was reused
+    assert transport.get_stats()["retries"] == 0 and transport.get_stats()["failures"] == 3
+    transport.close()
+    server.shutdown()
+
+def test_retry_keepalive_and_timeout():
+    """503s are retried, connections are reused and a hung request times out"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    transport = TTSTransport(read_timeout=0.2, max_retries=2, backoff=0.01)
+
+    for _ in range(3):
+        assert transport.post(url + "/tts", json={"text": "hi"}).content == b"audio"
+
+    stats = transport.get_stats()
+    print(f"✅ Transport stats: {stats}")
+    assert stats["requests"] == 3 and stats["retries"] == 1
+    assert FlakyHandler.connections == 1
+    assert "latency_ms_p50" in stats
+
+    try:
+        transport.post(url + "/hang", json={"text": "hi"})
+        assert False, "expected a timeout"
+    except requests.Timeout:
+        pass
+    assert transport.get_stats()["failures"] == 1
+
+    transport.close()
+    server.shutdown()
+
+if __name__ == "__main__":
+    test_retry_keepalive_and_timeout()
+    test_rejected_stream_releases_connection()
+    print("\n🎉 TTS transport tests completed!")
@@ -0,0 +1,126 @@
+"""
+Hysteresis / debounce between raw detector verdicts and downtime events.
+
+A single misread frame used to flip the monitor's state, and a downtime_end
+stops the TTS clip that was playing (which then gets synthesized again on
+the next death screen). TransitionDebouncer only changes state when:
+- at least enter_frames (or exit_frames) of the last `window` verdicts
+  disagree with the current state (N-of-M voting)
+- the current state has lasted at least min_dwell seconds
+- entering needs confidence >= enter_confidence; once in downtime a frame
+  still counts as visible while confidence >= exit_confidence, so
+  borderline frames can't toggle the state back and forth
+
+Disagreements that wash out of the window without causing a transition are
+counted as suppressed flaps.
+"""
+
+import os
+from collections import deque
+
+WINDOW = int(os.getenv("DEBOUNCE_WINDOW", "4"))            # M: verdicts considered
+ENTER_FRAMES = int(os.getenv("DEBOUNCE_ENTER_FRAMES", "2"))  # N: visible verdicts needed to enter downtime
+EXIT_FRAMES = int(os.getenv("DEBOUNCE_EXIT_FRAMES", "3"))    # N: hidden verdicts needed to leave downtime
+MIN_DWELL = float(os.getenv("DEBOUNCE_MIN_DWELL", "1.0"))    # seconds a state must last before it can flip
+ENTER_CONFIDENCE = 0.0  # detectors already threshold their own confidence
+EXIT_CONFIDENCE = None  # disabled: only the detector's verdict keeps downtime on
+
+
+class TransitionDebouncer:
+    def __init__(self, window: int = WINDOW, enter_frames: int = ENTER_FRAMES, exit_frames: int = EXIT_FRAMES,
+                 min_dwell: float = MIN_DWELL, enter_confidence: float = ENTER_CONFIDENCE,
+                 exit_confidence: float = EXIT_CONFIDENCE):
+        """
+        Args:
+            window (int): Number of recent verdicts voted over
+            enter_frames (int): Visible verdicts in the window needed to start downtime
+            exit_frames (int): Hidden verdicts in the window needed to end downtime
+            min_dwell (float): Minimum seconds between transitions
+            enter_confidence (float): Minimum confidence for a detection to count towards entering
+            exit_confidence (float): While in downtime, frames at or above this
+                                     confidence count as visible even if not detected
+        """
+        if not (1 <= enter_frames <= window and 1 <= exit_frames <= window):
+            raise ValueError("❌ enter_frames and exit_frames must be between 1 and window")
+
+        self.window = window
+        self.enter_frames = enter_frames
+        self.exit_frames = exit_frames
+        self.min_dwell = min_dwell
+        self.enter_confidence = enter_confidence
+        self.exit_confidence = exit_confidence
+        self.reset()
+
+    def reset(self):
+        """Back to 'no downtime' with an empty window and zeroed counters"""
+        self.votes = deque(maxlen=self.window)
+        self.state = False
+        self.state_since = None  # the initial state has no known start, so no dwell applies
+        self.pending = False     # a disagreement with the current state is in the window
+        self.last_vote = None
+
+        # Counters
+        self.frames = 0
+        self.raw_flips = 0
+        self.transitions = 0
+        self.suppressed_flaps = 0
+        self.dwell_blocked = 0  # frames whose vote was held back by min_dwell
+
+    def vote(self, detected: bool, confidence: float) -> bool:
+        """Whether one raw verdict counts as 'downtime screen visible'"""
+        if self.state and self.exit_confidence is not None and confidence >= self.exit_confidence:
+            return True
+        return bool(detected) and confidence >= self.enter_confidence
+
+    def update(self, detected: bool, confidence: float, timestamp: float):
+        """
+        Feed one raw verdict
+
+        Args:
+            detected (bool): Detector verdict
+            confidence (float): Detector confidence
+            timestamp (float): Capture time of the frame (perf_counter)
+
+        Returns:
+            bool | None: The new state if this verdict caused a transition, else None
+        """
+        visible = self.vote(detected, confidence)
+        self.frames += 1
+        if self.last_vote is not None and visible != self.last_vote:
+            self.raw_flips += 1
+        self.last_vote = visible
+        self.votes.append(visible)
+
+        disagreeing = sum(1 for v in self.votes if v != self.state)
+        if disagreeing == 0:
+            if self.pending:
+                self.suppressed_flaps += 1
+                self.pending = False
+            return None
+
+        self.pending = True
+        needed = self.exit_frames if self.state else self.enter_frames
+        if disagreeing < needed:
+            return None
+        if self.state_since is not None and timestamp - self.state_since < self.min_dwell:
+            self.dwell_blocked += 1
+            return None
+
+        self.state = not self.state
+        self.state_since = timestamp
+        self.pending = False
+        # Votes for the old state must not count as disagreement with the new one
+        self.votes.clear()
+        self.transitions += 1
+        return self.state
+
+    def get_stats(self) -> dict:
+        """Raw verdict changes vs. transitions let through"""
+        return {
+            "state": self.state,
+            "frames": self.frames,
+            "raw_flips": self.raw_flips,
+            "transitions": self.transitions,
+            "suppressed_flaps": self.suppressed_flaps,
+            "dwell_blocked": self.dwell_blocked
+        }
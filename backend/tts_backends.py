@@ -0,0 +1,292 @@
+"""
+Speech synthesis backends.
+
+TTSBackend is what TTSService synthesizes with: ElevenLabsBackend is the
+remote voice, LocalTTSBackend runs an offline engine (piper, espeak-ng or
+espeak) as a subprocess, so the teacher keeps talking on a slow or absent
+network. TTSService routes an uncached utterance to the local engine when
+there is no API key, when the remote missed its latency budget recently,
+or (TTS_LOCAL_WHEN_UNCACHED=1) always; cached remote clips keep playing
+in the remote voice. BackendStats records per-backend latency.
+
+Remote requests use one of the named SYNTHESIS_PROFILES: "quality" (the
+service's model and format) for prefetching, compiling and uncached clips
+early in a downtime window, and "fast" (a low-latency model with a
+low-bitrate format) when a listener is waiting on an uncached clip and the
+quality tier's wait would eat too much of the downtime left (more than
+MAX_WAIT_SHARE of it, i.e. late in the window).
+"""
+
+import json
+import os
+import shutil
+import struct
+import subprocess
+import threading
+from collections import deque
+from pathlib import Path
+
+import requests
+
+from tts_streaming import CHUNK_BYTES, pcm_rate, pcm_to_wav
+from tts_transport import TTSTransport, CONNECT_TIMEOUT
+
+LOCAL_ENGINE = os.getenv("TTS_LOCAL_ENGINE", "auto")  # auto | piper | espeak-ng | espeak | off
+LOCAL_VOICE = os.getenv("TTS_LOCAL_VOICE", "en-us")   # espeak voice
+LOCAL_WPM = int(os.getenv("TTS_LOCAL_WPM", "165"))    # espeak speaking rate
+PIPER_MODEL = os.getenv("PIPER_MODEL")                # .onnx voice; piper is skipped without one
+LOCAL_TIMEOUT = 30.0                                  # seconds a local synthesis may take
+LATENCY_BUDGET = float(os.getenv("TTS_LATENCY_BUDGET", "1.5"))  # seconds until remote audio can start
+REMOTE_COOLDOWN = 60.0                                # seconds on the local engine after the remote missed it
+LOCAL_WHEN_UNCACHED = os.getenv("TTS_LOCAL_WHEN_UNCACHED", "0") == "1"
+STATS_WINDOW = 200
+
+# Best first; None means the service's own model / playback format
+SYNTHESIS_PROFILES = {
+    "quality": {
+        "model_id": None,
+        "output_format": None,
+        "stream_format": None,
+        "expected_latency": 1.0  # seconds until audio can start, until measured
+    },
+    "fast": {
+        "model_id": os.getenv("TTS_FAST_MODEL", "eleven_flash_v2_5"),
+        "output_format": "mp3_22050_32",
+        "stream_format": "pcm_16000",
+        "expected_latency": 0.3
+    }
+}
+# A tier is used if its wait is at most this share of the downtime left: with 10-15 s windows the
+# quality tier (about 1 s) is used early in a window, the fast one in its last ~6 s
+MAX_WAIT_SHARE = 0.15
+
+
+class RemoteUnavailable(Exception):
+    """The remote backend failed or missed its latency budget before any audio arrived"""
+
+
+class TTSBackend:
+    name = "backend"
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    def synthesize(self, text: str, output_format: str = None, is_cancelled=None):
+        """
+        Turn text into audio
+
+        Returns:
+            bytes: Audio (WAV for PCM), or None if cancelled
+        """
+        raise NotImplementedError
+
+
+class ElevenLabsBackend(TTSBackend):
+    name = "elevenlabs"
+
+    def __init__(self, api_key: str = None, voice_id: str = 'ErXwobaYiN019PkySvjV',
+                 model_id: str = 'eleven_monolingual_v1', voice_settings: dict = None,
+                 base_url: str = 'https://api.elevenlabs.io/v1', transport: TTSTransport = None):
+        """
+        Args:
+            api_key (str): Eleven Labs API key
+            voice_id (str): Voice to speak with (default: Antoni - good for teaching)
+            model_id (str): Synthesis model
+            voice_settings (dict): Stability, similarity boost, ...
+            base_url (str): API root
+            transport (TTSTransport): Pooled HTTP session (default: a new one)
+        """
+        self.api_key = api_key
+        self.voice_id = voice_id
+        self.model_id = model_id
+        self.voice_settings = voice_settings or {
+            'stability': 0.5,
+            'similarity_boost': 0.75,
+            'style': 0.0,
+            'use_speaker_boost': True
+        }
+        self.base_url = base_url
+        self.transport = transport or TTSTransport()
+
+    @property
+    def available(self) -> bool:
+        return bool(self.api_key)
+
+    def open(self, text: str, output_format: str = None, stream: bool = False, latency_budget: float = None,
+             model_id: str = None):
+        """
+        Start a synthesis request
+
+        Args:
+            text (str): Text to speak
+            output_format (str): Eleven Labs output format (default: MP3)
+            stream (bool): Use the streaming endpoint
+            latency_budget (float): Give up (without retrying) if the response takes longer to start
+            model_id (str): Synthesis model (default: the backend's)
+
+        Returns:
+            requests.Response: Streamed response; iterate its content and close it
+
+        Raises:
+            RemoteUnavailable: If the request failed
+        """
+        url = f"{self.base_url}/text-to-speech/{self.voice_id}" + ("/stream" if stream else "")
+        headers = {
+            'xi-api-key': self.api_key,
+            'Content-Type': 'application/json'
+        }
+        data = {
+            'text': text,
+            'model_id': model_id or self.model_id,
+            'voice_settings': self.voice_settings
+        }
+        params = {'output_format': output_format} if output_format else None
+        options = {}
+        if latency_budget is not None:
+            options = {"timeout": (min(CONNECT_TIMEOUT, latency_budget), latency_budget), "max_retries": 0}
+        try:
+            return self.transport.post(url, headers=headers, json=data, params=params, stream=True, **options)
+        except requests.RequestException as e:
+            raise RemoteUnavailable(str(e)) from e
+
+    def synthesize(self, text: str, output_format: str = None, is_cancelled=None, latency_budget: float = None,
+                   model_id: str = None):
+        chunks = []
+        try:
+            with self.open(text, output_format, latency_budget=latency_budget, model_id=model_id) as response:
+                # Download in chunks so a cancelled utterance stops using the connection
+                for chunk in response.iter_content(chunk_size=CHUNK_BYTES):
+                    if is_cancelled is not None and is_cancelled():
+                        return None
+                    chunks.append(chunk)
+        except requests.RequestException as e:
+            raise RemoteUnavailable(str(e)) from e
+
+        audio_data = b''.join(chunks)
+        if output_format and output_format.startswith('pcm_'):
+            audio_data = pcm_to_wav(audio_data, pcm_rate(output_format))
+        return audio_data
+
+
+def normalize_wav(data: bytes) -> bytes:
+    """
+    Rewrite a streamed WAV (espeak writes placeholder sizes to stdout) with correct sizes
+
+    Only 16-bit mono is rewritten; anything else is returned as is.
+    """
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return data
+    offset, channels, rate, bits = 12, None, None, None
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        (size,) = struct.unpack("<I", data[offset + 4:offset + 8])
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            channels, rate, _, _, bits = struct.unpack("<HIIHH", data[body + 2:body + 16])
+        elif chunk_id == b"data":
+            if channels == 1 and bits == 16:
+                return pcm_to_wav(data[body:body + min(size, len(data) - body)], rate)
+            return data
+        offset = body + size + size % 2
+    return data
+
+
+class LocalTTSBackend(TTSBackend):
+    def __init__(self, engine: str, executable: str, voice: str = LOCAL_VOICE, wpm: int = LOCAL_WPM,
+                 model: str = PIPER_MODEL, timeout: float = LOCAL_TIMEOUT):
+        """
+        Args:
+            engine (str): "piper", "espeak-ng" or "espeak"
+            executable (str): Path of the engine's command
+            voice (str): espeak voice
+            wpm (int): espeak words per minute
+            model (str): piper .onnx voice model
+            timeout (float): Seconds one synthesis may take
+        """
+        self.engine = engine
+        self.executable = executable
+        self.voice = voice
+        self.wpm = wpm
+        self.model = model
+        self.timeout = timeout
+        self.name = f"local:{engine}"
+
+        # piper writes raw PCM at the model's rate (from the model's .json config)
+        self.sample_rate = 22050
+        if engine == "piper" and model:
+            config = Path(f"{model}.json")
+            if config.exists():
+                self.sample_rate = json.loads(config.read_text()).get("audio", {}).get("sample_rate", 22050)
+
+    def command(self) -> list:
+        if self.engine == "piper":
+            return [self.executable, "--model", self.model, "--output-raw"]
+        return [self.executable, "--stdout", "--stdin", "-v", self.voice, "-s", str(self.wpm)]
+
+    def synthesize(self, text: str, output_format: str = None, is_cancelled=None):
+        # Text goes in on stdin, so it is never parsed as options
+        result = subprocess.run(self.command(), input=text.encode("utf-8"), capture_output=True,
+                                timeout=self.timeout)
+        if result.returncode != 0 or not result.stdout:
+            raise RuntimeError(f"{self.engine} failed ({result.returncode}): "
+                               f"{result.stderr.decode(errors='replace').strip()[:200]}")
+        if is_cancelled is not None and is_cancelled():
+            return None
+        if self.engine == "piper":
+            return pcm_to_wav(result.stdout, self.sample_rate)
+        return normalize_wav(result.stdout)
+
+
+def find_local_backend(engine: str = LOCAL_ENGINE):
+    """
+    The configured offline engine, or the first one installed
+
+    Returns:
+        LocalTTSBackend: Or None if no engine is available (or engine is "off")
+    """
+    if engine == "off":
+        return None
+    for name in (["piper", "espeak-ng", "espeak"] if engine == "auto" else [engine]):
+        if name == "piper" and not PIPER_MODEL:
+            continue
+        executable = shutil.which(name)
+        if executable:
+            return LocalTTSBackend(name, executable)
+    return None
+
+
+class BackendStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {}  # backend name -> deque of seconds until audio could start
+        self.requests = {}
+        self.failures = {}
+
+    def record(self, backend: str, seconds: float = None, failed: bool = False):
+        with self.lock:
+            self.requests[backend] = self.requests.get(backend, 0) + 1
+            if failed:
+                self.failures[backend] = self.failures.get(backend, 0) + 1
+            elif seconds is not None:
+                self.latencies.setdefault(backend, deque(maxlen=STATS_WINDOW)).append(seconds)
+
+    def median(self, backend: str):
+        """Median latency in seconds, or None before the first sample"""
+        with self.lock:
+            latencies = sorted(self.latencies.get(backend, ()))
+        return latencies[len(latencies) // 2] if latencies else None
+
+    def get_stats(self) -> dict:
+        """Per backend: requests, failures and latency until audio could start, in ms"""
+        stats = {}
+        with self.lock:
+            for backend, requests_made in self.requests.items():
+                latencies = sorted(self.latencies.get(backend, ()))
+                stats[backend] = {"requests": requests_made, "failures": self.failures.get(backend, 0)}
+                if latencies:
+                    stats[backend].update({
+                        "latency_ms_p50": round(1000 * latencies[len(latencies) // 2], 1),
+                        "latency_ms_p95": round(1000 * latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1)
+                    })
+        return stats
@@ -0,0 +1,182 @@
+"""
+Content-addressed on-disk cache for synthesized TTS audio.
+
+Every ElevenLabs request is keyed by a SHA-256 of (text, voice_id, model_id,
+voice_settings), so re-read bullets and repeated section headers, and
+whole repeat sessions over the same material, are served from disk with
+no API call. Files are evicted least-recently-used once the cache grows
+past its byte cap; file mtimes record recency so the order survives
+restarts.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+CACHE_DIR = Path(os.getenv("TTS_CACHE_DIR", Path(__file__).parent / "tts_cache"))
+MAX_CACHE_BYTES = int(float(os.getenv("TTS_CACHE_MB", "200")) * 1024 * 1024)
+CACHE_SUFFIX = ".audio"
+
+
+def cache_key(text: str, voice_id: str, model_id: str, voice_settings: dict, **extra) -> str:
+    """
+    Stable key for one synthesis request
+
+    Args:
+        text (str): Text to speak
+        voice_id (str): ElevenLabs voice
+        model_id (str): ElevenLabs model
+        voice_settings (dict): Stability, similarity boost, ...
+        **extra: Anything else that changes the audio (e.g. output_format)
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    payload = json.dumps({
+        "text": text,
+        "voice_id": voice_id,
+        "model_id": model_id,
+        "voice_settings": voice_settings,
+        **extra
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    def __init__(self, directory=CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        """
+        Args:
+            directory: Folder holding one file per cached clip
+            max_bytes (int): Size cap; least recently used clips are evicted beyond it
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+        # key -> size in bytes, least recently used first
+        self.index = OrderedDict()
+        self.total_bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._load_index()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{CACHE_SUFFIX}"
+
+    def _load_index(self):
+        if not self.directory.exists():
+            return
+        entries = []
+        for path in self.directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self.index[key] = size
+            self.total_bytes += size
+        with self.lock:
+            self._evict()
+
+    def get(self, key: str):
+        """
+        Look up a clip
+
+        Returns:
+            bytes: The cached audio, or None on a miss
+        """
+        with self.lock:
+            if key not in self.index:
+                self.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                data = path.read_bytes()
+                os.utime(path)  # recency survives restarts
+            except OSError:
+                # Deleted behind our back: treat as a miss
+                self.total_bytes -= self.index.pop(key)
+                self.misses += 1
+                return None
+            self.index.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def put(self, key: str, data: bytes):
+        """Store a clip, evicting least recently used clips past the size cap"""
+        if not data or len(data) > self.max_bytes:
+            return
+        with self.lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            # Write then rename so a crash never leaves a truncated clip behind
+            temp_path = path.with_suffix(".tmp")
+            try:
+                temp_path.write_bytes(data)
+                os.replace(temp_path, path)
+            except OSError as e:
+                print(f"❌ Could not write TTS cache entry: {e}")
+                return
+
+            if key in self.index:
+                self.total_bytes -= self.index.pop(key)
+            self.index[key] = len(data)
+            self.total_bytes += len(data)
+            self._evict()
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self.index:
+            key, size = self.index.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def discard(self, keys):
+        """Delete the given clips (e.g. ones a lesson pack now holds)"""
+        with self.lock:
+            for key in keys:
+                if key not in self.index:
+                    continue
+                self.total_bytes -= self.index.pop(key)
+                try:
+                    self._path(key).unlink()
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Delete every cached clip"""
+        with self.lock:
+            for key in list(self.index):
+                try:
+                    self._path(key).unlink()
+                except OSError:
+                    pass
+            self.index.clear()
+            self.total_bytes = 0
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self.index),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions
+        }
@@ -1,4 +1,31 @@
-from tts_service import tts
+import threading
+
+from tts_service import get_tts
+from tts_prefetch import SpeechPrefetcher
+from tts_pack import compile_lesson as compile_pack
+
+# Synthesizes upcoming utterances in the background
+_prefetcher = None
+_init_lock = threading.Lock()
+
+def init():
+    """
+    Set up TTS on first use (pygame mixer, API key check, prefetcher); every function below calls it
+
+    Returns:
+        tuple: (TTSService, SpeechPrefetcher)
+    """
+    global _prefetcher
+    with _init_lock:
+        if _prefetcher is None:
+            tts = get_tts()
+            _prefetcher = SpeechPrefetcher(tts)
+            try:
+                tts.initialize()
+                print("🎤 TTS Client initialized successfully")
+            except Exception as e:
+                print(f"❌ Failed to initialize TTS Client: {e}")
+    return _prefetcher.service, _prefetcher
 
 def speak(text: str) -> bool:
     """
@@ -10,19 +37,94 @@ def speak(text: str) -> bool:
     Returns:
         bool: True if successful
     """
+    tts, prefetcher = init()
+    prefetcher.wait(text)
     return tts.speak(text)
 
+def speak_async(text: str, budget: float = None):
+    """
+    Start speaking text without blocking
+    
+    Args:
+        text (str): Text to speak
+        budget (float): Seconds of downtime left; an uncached clip is synthesized
+                        with the fast profile when the best one would take too long
+    
+    Returns:
+        SpeechHandle: done() / wait(timeout) / cancel(); handle.result is True
+                      once the whole clip played
+    """
+    tts, prefetcher = init()
+    return tts.speak_async(text, prepare=prefetcher.wait, budget=budget)
+
 def stop() -> bool:
     """Stop current TTS"""
+    tts, _ = init()
     return tts.stop()
 
+def pause() -> bool:
+    """Pause current TTS, keeping its audio and position (False if nothing is playing)"""
+    tts, _ = init()
+    return tts.pause()
+
+def resume() -> bool:
+    """Continue paused TTS where it stopped (False if nothing is paused)"""
+    tts, _ = init()
+    return tts.resume()
+
 def is_speaking() -> bool:
     """Check if currently speaking"""
+    tts, _ = init()
     return tts.get_speaking_status()
 
-# Initialize TTS when module is imported
-try:
-    tts.initialize()
-    print("🎤 TTS Client initialized successfully")
-except Exception as e:
-    print(f"❌ Failed to initialize TTS Client: {e}") 
\ No newline at end of file
+def clip_duration(text: str):
+    """Measured length in seconds of the clip for text, or None if not synthesized yet"""
+    tts, _ = init()
+    return tts.clip_duration(text)
+
+def prefetch(texts: list):
+    """Synthesize the next utterances in the background so speak() starts instantly"""
+    _, prefetcher = init()
+    prefetcher.update(texts)
+
+def clear_prefetch():
+    """Drop prefetched audio (call when the lesson content changes)"""
+    _, prefetcher = init()
+    prefetcher.invalidate()
+
+def compile_lesson(texts: list) -> bool:
+    """
+    Synthesize every utterance of a lesson into a memory-mapped pack and play from it
+    
+    Args:
+        texts (list): All utterances of the lesson
+    
+    Returns:
+        bool: True if every clip is available offline
+    """
+    tts, prefetcher = init()
+    try:
+        pack = compile_pack(tts, texts, prepare=prefetcher.wait)
+    except Exception as e:
+        print(f"❌ Failed to compile lesson audio: {e}")
+        return False
+    if pack is None:
+        return False
+    tts.set_pack(pack)
+    return not pack.metadata.get("missing")
+
+def get_stats() -> dict:
+    """TTS cache hit/miss counters, decoded clips, time to first sound (overall and per tier), resume savings,
+    lesson pack, backend, HTTP and prefetch stats"""
+    tts, prefetcher = init()
+    return {
+        "cache": tts.get_cache_stats(),
+        "sounds": tts.get_sound_stats(),
+        "time_to_first_sound": tts.get_latency_stats(),
+        "tiers": tts.get_tier_stats(),
+        "resume": tts.get_resume_stats(),
+        "pack": tts.get_pack_stats(),
+        "backends": tts.get_backend_stats(),
+        "http": tts.get_transport_stats(),
+        "prefetch": prefetcher.get_stats()
+    }
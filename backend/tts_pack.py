@@ -0,0 +1,216 @@
+"""
+Precompiled lesson audio packs.
+
+Once a lesson is loaded every utterance is known, so compile_lesson()
+synthesizes all of them concurrently into one pack file: a small header,
+a JSON index of cache key -> (offset, length) plus clip durations, then
+the clips back to back. LessonPack memory-maps the file and hands out
+clips by key, so teaching from a compiled lesson needs no network. The
+file name is derived from the keys (text + voice + model + settings +
+format), so the same lesson reuses its pack across restarts, and a pack
+copied to another machine with the same voice settings is picked up as is.
+Clips that fail to synthesize are left out (and named in the metadata):
+they are synthesized on demand, and the next compile retries them.
+
+Compiling synthesizes a whole lesson up front, so it is opt-in
+(TTS_COMPILE_LESSON=1).
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from tts_streaming import audio_duration
+
+PACK_DIR = Path(os.getenv("TTS_PACK_DIR", Path(__file__).parent / "tts_packs"))
+PACK_MAGIC = b"DWPACK1\n"
+PACK_SUFFIX = ".pack"
+COMPILE_WORKERS = 4  # concurrent synthesis requests while compiling
+COMPILE_LESSONS = os.getenv("TTS_COMPILE_LESSON", "0") == "1"  # compile each lesson when it is loaded
+
+
+def pack_path(keys, directory=PACK_DIR) -> Path:
+    """Pack file for a set of clip keys (order-independent)"""
+    digest = hashlib.sha256("\n".join(sorted(set(keys))).encode("ascii")).hexdigest()
+    return Path(directory) / f"lesson_{digest[:16]}{PACK_SUFFIX}"
+
+
+def write_pack(path, clips: dict, metadata: dict = None):
+    """
+    Write clips into a pack file atomically
+
+    Args:
+        path: Destination file
+        clips (dict): Cache key -> audio bytes
+        metadata (dict): Stored alongside the index (voice, model, format, ...)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    index, offset = {}, 0
+    for key, audio_data in clips.items():
+        index[key] = [offset, len(audio_data)]
+        offset += len(audio_data)
+    header = json.dumps({"clips": index, "metadata": metadata or {}}).encode("utf-8")
+
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(PACK_MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for audio_data in clips.values():
+            f.write(audio_data)
+    os.replace(tmp_path, path)
+
+
+class LessonPack:
+    def __init__(self, path):
+        """
+        Args:
+            path: Pack file written by write_pack()
+
+        Raises:
+            ValueError: If the file is not a lesson pack
+        """
+        self.path = Path(path)
+        # close() is deferred while a get() is copying out of the map
+        self.lock = threading.Lock()
+        self.readers = 0
+        self.closed = False
+        self.file = open(self.path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = len(self.map)
+
+        if self.map[:len(PACK_MAGIC)] != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"❌ Not a lesson pack: {self.path}")
+        header_start = len(PACK_MAGIC) + 8
+        (header_length,) = struct.unpack("<Q", self.map[len(PACK_MAGIC):header_start])
+        header = json.loads(self.map[header_start:header_start + header_length])
+        self.data_start = header_start + header_length
+        self.index = {key: tuple(entry) for key, entry in header["clips"].items()}
+        self.metadata = header["metadata"]
+        self.durations = self.metadata.get("durations", {})
+
+        self.hits = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def get(self, key: str):
+        """Audio for key straight from the mapped file, or None (also once closed)"""
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        offset, length = entry
+        start = self.data_start + offset
+        with self.lock:
+            if self.closed:
+                return None
+            self.readers += 1
+            self.hits += 1
+        try:
+            return self.map[start:start + length]
+        finally:
+            with self.lock:
+                self.readers -= 1
+                if self.closed and self.readers == 0:
+                    self._unmap()
+
+    def close(self):
+        """Unmap the file once no get() is reading from it"""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            if self.readers == 0:
+                self._unmap()
+
+    def _unmap(self):
+        self.map.close()
+        self.file.close()
+
+    def get_stats(self) -> dict:
+        return {
+            "path": str(self.path),
+            "clips": len(self.index),
+            "bytes": self.size,
+            "hits": self.hits
+        }
+
+
+def compile_lesson(service, texts: list, directory=PACK_DIR, workers: int = COMPILE_WORKERS,
+                   prepare=None) -> LessonPack:
+    """
+    Synthesize every utterance of a lesson into a pack, or reuse an existing one
+
+    Args:
+        service (TTSService): Synthesizes the clips (cache hits cost nothing)
+        texts (list): Every utterance of the lesson
+        directory: Folder holding the packs
+        workers (int): Concurrent synthesis requests
+        prepare (callable): Called with each text first (e.g. to wait for an in-flight prefetch)
+
+    Returns:
+        LessonPack: The opened pack (without the clips that failed), or None if no clip could be synthesized
+    """
+    output_format = service.playback_format
+    keys = {service.cache_key(text, output_format): text for text in texts if text and text.strip()}
+    path = pack_path(keys, directory)
+    if path.exists():
+        print(f"📦 Reusing lesson pack {path.name} ({len(keys)} clips)")
+        return LessonPack(path)
+
+    print(f"📦 Compiling {len(keys)} clips into {path.name}...")
+    start = time.perf_counter()
+    lock = threading.Lock()
+    clips = {}
+
+    def synthesize(key, text):
+        try:
+            if prepare is not None:
+                prepare(text)
+            audio_data = service.synthesize(text, output_format)
+        except Exception as e:
+            print(f"❌ Could not synthesize '{text[:50]}' for the pack: {e}")
+            return
+        if audio_data is None:
+            print(f"❌ Could not synthesize '{text[:50]}' for the pack")
+            return
+        with lock:
+            clips[key] = audio_data
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts-compile") as pool:
+        for future in [pool.submit(synthesize, key, text) for key, text in keys.items()]:
+            future.result()
+
+    if not clips:
+        print("❌ No clip could be synthesized, no lesson pack written")
+        return None
+    missing = [text for key, text in keys.items() if key not in clips]
+    if missing:
+        # Named after the clips it holds, so the full lesson's pack is compiled (retrying these) next time
+        path = pack_path(clips, directory)
+
+    # Keep lesson order in the file
+    durations = {key: audio_duration(audio_data) for key, audio_data in clips.items()}
+    write_pack(path, {key: clips[key] for key in keys if key in clips}, {
+        "voice_id": service.voice_id,
+        "model_id": service.model_id,
+        "output_format": output_format,
+        "texts": [text for key, text in keys.items() if key in clips],
+        "missing": missing,
+        "durations": {key: duration for key, duration in durations.items() if duration is not None}
+    })
+    print(f"✅ Lesson pack compiled in {time.perf_counter() - start:.1f}s: {path}"
+          + (f" ({len(missing)} clips missing)" if missing else ""))
+    return LessonPack(path)
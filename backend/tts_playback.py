@@ -0,0 +1,162 @@
+"""
+pygame end-of-track events for TTS playback.
+
+Instead of polling pygame.mixer.music.get_busy() every 100 ms, the mixer
+posts MUSIC_END / CHANNEL_END events when a clip finishes (or is stopped),
+and one dispatcher thread turns them into threading.Events the playback
+code waits on. The event queue needs pygame's display subsystem; where it
+can't be initialized off the main thread (macOS) or at all, `available`
+stays False and callers fall back to polling.
+
+SpeechHandle is what TTSService.speak_async() returns: a future-like handle
+whose cancel() aborts the synthesis download and stops playback.
+"""
+
+import platform
+import threading
+import time
+
+try:
+    import pygame
+    MUSIC_END = pygame.USEREVENT + 1
+    CHANNEL_END = pygame.USEREVENT + 2
+except ImportError:
+    pygame = None
+    MUSIC_END = CHANNEL_END = None
+
+POLL_INTERVAL = 0.1  # fallback polling, and the dispatcher's wake-up interval
+
+
+class PlaybackEvents:
+    def __init__(self):
+        self.music_ended = threading.Event()
+        self.channel_ended = threading.Event()
+        self.last_end_at = None  # perf_counter() of the latest end event
+        self.available = False
+        self.thread = None
+        self.ready = threading.Event()
+
+    def start(self):
+        """Start the dispatcher thread (no-op without pygame or if already started)"""
+        if pygame is None or self.thread is not None:
+            return self.available
+        if platform.system() == "Darwin":
+            # Cocoa only allows video init on the main thread
+            return False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self.ready.wait(timeout=2)
+        return self.available
+
+    def _run(self):
+        try:
+            # The event queue lives in the display subsystem; no window is opened
+            pygame.display.init()
+            pygame.mixer.music.set_endevent(MUSIC_END)
+            self.available = True
+        except Exception as e:
+            print(f"⚠️ pygame events unavailable, polling playback instead: {e}")
+            return
+        finally:
+            self.ready.set()
+
+        while True:
+            event = pygame.event.wait(int(POLL_INTERVAL * 1000))
+            if event.type == MUSIC_END:
+                self.last_end_at = time.perf_counter()
+                self.music_ended.set()
+            elif event.type == CHANNEL_END:
+                self.last_end_at = time.perf_counter()
+                self.channel_ended.set()
+
+    def wait_music(self, is_busy, is_cancelled=lambda: False):
+        """
+        Block until the music stream finishes
+
+        Args:
+            is_busy (callable): Whether playback is still running (checked after each wake-up,
+                                so a late event from an earlier clip can't end this one)
+            is_cancelled (callable): Stop waiting early when it returns True
+        """
+        self._wait(self.music_ended, is_busy, is_cancelled)
+
+    def wait_channel(self, is_busy, is_cancelled=lambda: False, timeout: float = None):
+        """Block until a channel sound ends (or timeout); see wait_music"""
+        self._wait(self.channel_ended, is_busy, is_cancelled, timeout)
+
+    def _wait(self, ended: threading.Event, is_busy, is_cancelled, timeout: float = None):
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while is_busy() and not is_cancelled():
+            remaining = POLL_INTERVAL if deadline is None else min(POLL_INTERVAL, deadline - time.perf_counter())
+            if remaining <= 0:
+                return
+            if self.available:
+                ended.wait(remaining)
+                ended.clear()
+            else:
+                time.sleep(remaining)
+            if deadline is not None:
+                return
+
+    def notify(self):
+        """Wake every waiter (e.g. after stop())"""
+        self.music_ended.set()
+        self.channel_ended.set()
+
+
+class SpeechHandle:
+    """Handle for one utterance started with speak_async()"""
+
+    def __init__(self, text: str, service):
+        """
+        Args:
+            text (str): Text being spoken
+            service (TTSService): Service speaking it
+        """
+        self.text = text
+        self.service = service
+        self.utterance = None     # id assigned by the service when speaking starts
+        self.stops = service.stops  # stop() calls before this one: a later stop() cancels it too
+        self.cancelled = False
+        self.result = None        # True once the whole clip played
+        self.tier = None          # synthesis profile that served it (see TTSService.current_tier)
+        self.created_at = time.perf_counter()
+        self.finished_at = None
+        self._done = threading.Event()
+
+    def done(self) -> bool:
+        """Whether speaking finished, failed or was cancelled"""
+        return self._done.is_set()
+
+    def cancel(self) -> bool:
+        """
+        Abort synthesis and playback of this utterance
+
+        Returns:
+            bool: False if it had already finished
+        """
+        if self.done():
+            return False
+        self.cancelled = True
+        self.service.cancel(self)
+        return True
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Block until the utterance is done
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        return self._done.wait(timeout)
+
+    def _finish(self, result: bool, interrupted: bool = False):
+        # Stopped by stop() or a newer speak() counts as cancelled too
+        self.cancelled = self.cancelled or (interrupted and not result)
+        self.result = bool(result) and not self.cancelled
+        self.finished_at = time.perf_counter()
+        self._done.set()
+
+
+# Shared by every TTSService: only one thread may read pygame's event queue
+playback_events = PlaybackEvents()
@@ -0,0 +1,107 @@
+"""
+Lookahead synthesis for the teaching loop.
+
+Without it every downtime window starts with a full round trip to Eleven
+Labs. SpeechPrefetcher is told which texts come next (update()) and
+synthesizes them on a small thread pool while the current clip plays or
+the game is running, handing the audio to TTSService.preload() so the next
+speak() starts from memory. invalidate() drops everything when the lesson
+content is reloaded; results of requests already in flight are discarded.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+PREFETCH_DEPTH = 3    # upcoming utterances kept ready
+PREFETCH_WORKERS = 2  # concurrent synthesis requests
+PREFETCH_WAIT = 2.0   # seconds speak() waits for an in-flight prefetch of the same text
+
+
+class SpeechPrefetcher:
+    def __init__(self, service, depth: int = PREFETCH_DEPTH, workers: int = PREFETCH_WORKERS):
+        """
+        Args:
+            service (TTSService): Service that synthesizes and plays the audio
+            depth (int): How many upcoming texts to synthesize ahead
+            workers (int): Maximum concurrent synthesis requests
+        """
+        self.service = service
+        self.depth = depth
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts-prefetch")
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.ready = set()      # texts handed to the service for the current generation
+        self.in_flight = {}     # text -> future of its synthesis
+
+        # Counters
+        self.requested = 0
+        self.completed = 0
+        self.failed = 0
+        self.discarded = 0
+
+    def update(self, texts: list):
+        """
+        Make sure the next texts are (being) synthesized
+
+        Args:
+            texts (list): Upcoming utterances in reading order; only the first `depth` are used
+        """
+        upcoming = texts[:self.depth]
+        with self.lock:
+            generation = self.generation
+            self.ready.intersection_update(upcoming)  # older texts were spoken or skipped
+            pending = [t for t in upcoming if t and t not in self.ready and t not in self.in_flight]
+            for text in pending:
+                self.in_flight[text] = self.pool.submit(self._synthesize, text, generation)
+            self.requested += len(pending)
+
+    def wait(self, text: str, timeout: float = PREFETCH_WAIT):
+        """Block until an in-flight prefetch of text finishes, instead of requesting it twice"""
+        with self.lock:
+            future = self.in_flight.get(text)
+        if future is None:
+            return
+        try:
+            future.result(timeout=timeout)
+        except Exception:
+            pass  # speak() falls back to synthesizing it itself
+
+    def _synthesize(self, text: str, generation: int):
+        output_format = self.service.playback_format
+        try:
+            audio_data = self.service.synthesize(text, output_format)
+        except Exception as e:
+            print(f"❌ Prefetch failed for '{text[:50]}': {e}")
+            audio_data = None
+
+        with self.lock:
+            if generation == self.generation:
+                self.in_flight.pop(text, None)
+            if audio_data is None:
+                self.failed += 1
+                return
+            if generation != self.generation:
+                self.discarded += 1  # content was reloaded while this was in flight
+                return
+            self.ready.add(text)
+            self.completed += 1
+        self.service.preload(text, audio_data, output_format)
+
+    def invalidate(self):
+        """Forget all prefetched audio (call when the lesson content changes)"""
+        with self.lock:
+            self.generation += 1
+            self.ready.clear()
+            self.in_flight.clear()
+        self.service.clear_preloaded()
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                "requested": self.requested,
+                "completed": self.completed,
+                "failed": self.failed,
+                "discarded": self.discarded,
+                "in_flight": len(self.in_flight),
+                "ready": len(self.ready)
+            }
@@ -4,10 +4,16 @@ import subprocess
 import platform
 import threading
 import time
-import requests
 import io
+from collections import deque, OrderedDict
 from pathlib import Path
 from dotenv import load_dotenv
+from tts_cache import AudioCache, cache_key
+from tts_backends import (ElevenLabsBackend, BackendStats, RemoteUnavailable, find_local_backend,
+                          LATENCY_BUDGET, LOCAL_WHEN_UNCACHED, REMOTE_COOLDOWN, SYNTHESIS_PROFILES, MAX_WAIT_SHARE)
+from tts_streaming import PcmStreamPlayer, audio_duration, pcm_rate, STREAM_FORMAT, CHUNK_BYTES
+from tts_playback import SpeechHandle, playback_events, CHANNEL_END
+from tts_sounds import SoundCache
 
 # Try to import pygame for direct audio playback
 try:
@@ -24,31 +30,108 @@ from pathlib import Path
 # Get the project root directory (two levels up from backend)
 project_root = Path(__file__).parent.parent
 env_path = project_root / '.env'
-print(f"🔍 Loading .env from: {env_path}")
-print(f"📁 File exists: {env_path.exists()}")
 
 # Load the .env file
 load_dotenv(env_path)
 
-# Debug: Check what environment variables are loaded
-print(f"🔑 Environment variables after loading:")
-for key, value in os.environ.items():
-    if 'API_KEY' in key:
-        print(f"  {key}: {value[:10]}..." if value else f"  {key}: None")
+def report_env():
+    """Debug: print where .env came from and which API keys are set"""
+    print(f"🔍 Loading .env from: {env_path}")
+    print(f"📁 File exists: {env_path.exists()}")
+    print(f"🔑 Environment variables after loading:")
+    for key, value in os.environ.items():
+        if 'API_KEY' in key:
+            print(f"  {key}: {value[:10]}..." if value else f"  {key}: None")
+
+# Stream synthesis and start playing on the first buffered audio (needs pygame)
+STREAMING = os.getenv('TTS_STREAMING', '1') == '1'
+
+# Prefetched clips kept in memory for instant playback
+PRELOAD_LIMIT = 8
+
+def _remote_attribute(name: str):
+    """TTSService attribute that lives on the Eleven Labs backend"""
+    return property(lambda self: getattr(self.remote, name),
+                    lambda self, value: setattr(self.remote, name, value))
 
 class TTSService:
+    # Voice settings for AI Teaching Bot, kept on the remote backend
+    api_key = _remote_attribute('api_key')
+    voice_id = _remote_attribute('voice_id')
+    base_url = _remote_attribute('base_url')
+    model_id = _remote_attribute('model_id')
+    voice_settings = _remote_attribute('voice_settings')
+    transport = _remote_attribute('transport')  # pooled keep-alive session with timeouts and retries
+    
     def __init__(self):
-        self.api_key = os.getenv('ELEVEN_LABS_API_KEY')
         self.is_speaking = False
         self.current_audio_file = None
         
-        # Voice settings for AI Teaching Bot
-        self.voice_id = 'ErXwobaYiN019PkySvjV'  # Antoni - good for teaching
-        self.base_url = 'https://api.elevenlabs.io/v1'
+        # Eleven Labs voice (Antoni - good for teaching)
+        self.remote = ElevenLabsBackend(os.getenv('ELEVEN_LABS_API_KEY'))
+        
+        # Offline engine for uncached speech when the remote is missing or slow (see tts_backends.py)
+        self.local = find_local_backend()
+        self.latency_budget = LATENCY_BUDGET  # seconds the remote may take before audio can start
+        self.remote_down_until = 0.0  # time.monotonic() until which the remote is skipped
+        self.backend_stats = BackendStats()
+        
+        # Synthesis profile that served each utterance ("fast", "cached:quality", "local:espeak-ng", ...)
+        # and its time to first sound
+        self.current_tier = None
+        self.tier_stats = BackendStats()
+        
+        # Synthesized clips are cached on disk, keyed by text + voice + model + settings
+        self.cache = AudioCache()
+        
+        # Clips synthesized ahead of time (see tts_prefetch.py), ready without disk I/O
+        self.preloaded = OrderedDict()
+        self.preload_lock = threading.Lock()
+        
+        # Decoded clips by cache key, played on mixer channels (see tts_sounds.py)
+        self.sounds = SoundCache()
+        self.sound_channel = None  # channel of the clip being played, if any
+        
+        # Compiled lesson (see tts_pack.py), memory-mapped
+        self.pack = None
+        
+        # Measured clip lengths in seconds, by cache key
+        self.durations = {}
+        
+        # Streaming synthesis (raw PCM played as it arrives)
+        self.streaming = STREAMING and PYGAME_AVAILABLE
+        self.stream_format = STREAM_FORMAT
+        self.stream_player = None
+        
+        # Time from speak() to audio starting, in ms
+        self.speak_started = None
+        self.first_sound_ms = deque(maxlen=50)
+        
+        # Every speak() gets a new id; stop() bumps it, which cancels the one in progress
+        self.utterance = 0
+        self.utterance_lock = threading.Lock()
+        
+        # stop() calls so far; handles from speak_async remember it to notice a stop while preparing
+        self.stops = 0
+        
+        # End-of-track events, so playback is waited on rather than polled
+        self.events = playback_events
+        
+        # Pause/resume keeps the mixer's decoded audio and position instead of replaying
+        self.paused = False
+        self.resumed = threading.Event()
+        self.resumed.set()
+        self.current_key = None       # cache key of the clip being spoken
+        self.played = 0.0             # seconds of it heard before the current segment
+        self.segment_started = None   # perf_counter() when playback last (re)started
+        self.pause_was_playing = False
+        self.pause_needs_request = False
+        self.resume_stats = {"pauses": 0, "resumes": 0, "audio_seconds_saved": 0.0, "api_calls_saved": 0}
         
         # Initialize pygame if available
         if PYGAME_AVAILABLE:
             pygame.mixer.init()
+            self.events.start()
         
         if not self.api_key:
             print(f"Warning: ELEVEN_LABS_API_KEY not found in environment variables")
@@ -58,6 +141,8 @@ class TTSService:
                 print(f"File contents: {env_path.read_text()[:100]}...")
         else:
             print(f"✅ Found ELEVEN_LABS_API_KEY: {self.api_key[:10]}...")
+        if self.local is not None:
+            print(f"🗣️ Local TTS fallback: {self.local.name} ({self.local.executable})")
     
     def initialize(self):
         """Initialize the TTS service"""
@@ -72,89 +157,505 @@ class TTSService:
             print(f"❌ Failed to initialize TTS service: {e}")
             return False
     
-    def speak(self, text: str) -> bool:
+    def speak(self, text: str, handle: SpeechHandle = None, budget: float = None) -> bool:
         """
         Speak text using TTS
         
         Args:
             text (str): Text to speak
+            handle (SpeechHandle): Handle to attach this utterance to (see speak_async)
+            budget (float): Seconds of downtime left, which picks the synthesis profile
+                            of an uncached clip (None: nobody is waiting, use the best)
         
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if successful, False otherwise (including when stopped midway)
         """
         if not text or not text.strip():
             print("❌ No text provided for TTS")
             return False
         
-        if not self.api_key:
-            print("❌ Eleven Labs API key not configured")
+        # A handle stopped while it was still preparing (see speak_async) never starts
+        if handle is not None and self._handle_stopped(handle):
             return False
         
+        # Stop any current speech
+        if self.is_speaking:
+            self._halt()
+        
+        with self.utterance_lock:
+            self.utterance += 1
+            utterance = self.utterance
+        if handle is not None:
+            handle.utterance = utterance
+            if self._handle_stopped(handle):
+                return False
+        is_cancelled = lambda: self.utterance != utterance
+        
         try:
-            # Stop any current speech
-            if self.is_speaking:
-                self.stop()
-            
             self.is_speaking = True
+            self.speak_started = time.perf_counter()
+            profile = self._cached_profile(text)
+            if profile is not None:
+                self.current_tier = f"cached:{profile}"
+            else:
+                profile = self.choose_profile(budget)
+                self.current_tier = profile
+            self.current_key = self.profile_key(text, profile)
+            self.played = 0.0
+            self.segment_started = None
+            
+            if self._route_local(self.current_key):
+                return self._speak_local(text, is_cancelled)
             
-            print(f"🎤 Generating speech for: '{text[:50]}{'...' if len(text) > 50 else ''}'")
-            
-            # Prepare the request
-            url = f"{self.base_url}/text-to-speech/{self.voice_id}"
-            headers = {
-                'xi-api-key': self.api_key,
-                'Content-Type': 'application/json'
-            }
-            data = {
-                'text': text,
-                'model_id': 'eleven_monolingual_v1',
-                'voice_settings': {
-                    'stability': 0.5,
-                    'similarity_boost': 0.75,
-                    'style': 0.0,
-                    'use_speaker_boost': True
-                }
-            }
-            
-            # Make the API request
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
+            try:
+                if self.streaming:
+                    return self.speak_stream(text, is_cancelled, profile)
+                audio_data = self.synthesize(text, self.profile_format(profile), is_cancelled, self._budget(),
+                                             model_id=self.profile_model(profile))
+            except RemoteUnavailable as e:
+                if self.local is None:
+                    raise
+                self._remote_missed(e)
+                return self._speak_local(text, is_cancelled)
+            if audio_data is None or is_cancelled():
+                return False
             
             # Play audio directly
             if PYGAME_AVAILABLE:
-                self._play_audio_pygame(response.content)
-            else:
-                self._play_audio_system(response.content)
-            
+                return self._play_audio_pygame(audio_data, is_cancelled, self.current_key)
+            self._play_audio_system(audio_data)
             return True
             
         except Exception as e:
             print(f"❌ Error in TTS speak: {e}")
-            self.is_speaking = False
             return False
+        finally:
+            if not is_cancelled():
+                self.is_speaking = False
+                if handle is not None:
+                    handle.tier = self.current_tier
+    
+    def speak_async(self, text: str, prepare=None, budget: float = None) -> SpeechHandle:
+        """
+        Speak text on a background thread
+        
+        Args:
+            text (str): Text to speak
+            prepare (callable): Called with text on the speaking thread first
+                                (e.g. to wait for an in-flight prefetch)
+            budget (float): Seconds of downtime left (see speak)
+        
+        Returns:
+            SpeechHandle: done() / wait() / cancel(); result is True once the whole clip played
+        """
+        handle = SpeechHandle(text, self)
+        
+        def run():
+            result = False
+            try:
+                if prepare is not None:
+                    prepare(text)
+                result = self.speak(text, handle, budget)
+            finally:
+                handle._finish(result, interrupted=handle.utterance is not None and handle.utterance != self.utterance)
+        
+        threading.Thread(target=run, daemon=True, name="tts-speak").start()
+        return handle
+    
+    def _handle_stopped(self, handle: SpeechHandle) -> bool:
+        """Whether a handle was cancelled, or created before the last stop()"""
+        if handle.stops != self.stops:
+            handle.cancelled = True
+        return handle.cancelled
+    
+    def cancel(self, handle: SpeechHandle):
+        """Stop the handle's utterance if it is the one playing (a newer one is left alone)"""
+        if handle.utterance is not None and handle.utterance == self.utterance:
+            self._halt()
+    
+    def cache_key(self, text: str, output_format: str = None, model_id: str = None) -> str:
+        """Cache key for text with the current voice, model (or model_id), settings and output format"""
+        model_id = model_id or self.model_id
+        if output_format is None:
+            return cache_key(text, self.voice_id, model_id, self.voice_settings)
+        return cache_key(text, self.voice_id, model_id, self.voice_settings, output_format=output_format)
+    
+    def profile_model(self, profile: str) -> str:
+        """Model a synthesis profile uses"""
+        return SYNTHESIS_PROFILES[profile]["model_id"] or self.model_id
     
-    def _play_audio_pygame(self, audio_data: bytes):
-        """Play audio directly using pygame"""
+    def profile_format(self, profile: str):
+        """Output format a synthesis profile plays (streamed PCM, or MP3 where None is the default)"""
+        if self.streaming:
+            return SYNTHESIS_PROFILES[profile]["stream_format"] or self.stream_format
+        return SYNTHESIS_PROFILES[profile]["output_format"]
+    
+    def profile_key(self, text: str, profile: str) -> str:
+        """Cache key of the clip a synthesis profile makes for text"""
+        return self.cache_key(text, self.profile_format(profile), self.profile_model(profile))
+    
+    def _cached_profile(self, text: str):
+        """Best profile whose clip for text is available without a request, or None"""
+        for profile in SYNTHESIS_PROFILES:
+            if self._has_audio(self.profile_key(text, profile)):
+                return profile
+        return None
+    
+    def choose_profile(self, budget: float = None) -> str:
+        """
+        Synthesis profile for an uncached clip
+        
+        Args:
+            budget (float): Seconds of downtime left (None: nobody is waiting, e.g. prefetching)
+        
+        Returns:
+            str: The best profile whose expected wait is at most MAX_WAIT_SHARE of the budget,
+                 else the fastest
+        """
+        profiles = list(SYNTHESIS_PROFILES)
+        if budget is None:
+            return profiles[0]
+        for profile in profiles:
+            expected = self.tier_stats.median(profile)
+            if expected is None:
+                expected = SYNTHESIS_PROFILES[profile]["expected_latency"]
+            if expected <= MAX_WAIT_SHARE * budget:
+                return profile
+        return profiles[-1]
+    
+    @property
+    def playback_format(self):
+        """Output format speak() plays: streamed PCM, or the default MP3 (None)"""
+        return self.stream_format if self.streaming else None
+    
+    def _lookup(self, key: str):
+        # Preloaded clips first, then the lesson pack, then the disk cache
+        with self.preload_lock:
+            audio_data = self.preloaded.get(key)
+            if audio_data is not None:
+                self.preloaded.move_to_end(key)
+                return audio_data
+        pack = self.pack
+        if pack is not None and key in pack:
+            audio_data = pack.get(key)
+        else:
+            audio_data = self.cache.get(key)
+        if audio_data is not None:
+            self._remember_duration(key, audio_data)
+        return audio_data
+    
+    def _remember_duration(self, key: str, audio_data: bytes):
+        if key in self.durations:
+            return
+        if audio_data[:4] == b"RIFF" or not PYGAME_AVAILABLE:
+            duration = audio_duration(audio_data)  # from the WAV header, no decoding
+        else:
+            # Compressed clips are measured by decoding them once, into the cache playback uses
+            sound = self.sounds.decode(key, audio_data)
+            duration = sound.get_length() if sound is not None else None
+        if duration is not None:
+            self.durations[key] = duration
+    
+    def clip_duration(self, text: str):
+        """
+        Measured length of the clip speak(text) would play
+        
+        Returns:
+            float: Seconds, or None if it hasn't been synthesized yet
+        """
+        pack = self.pack
+        for profile in SYNTHESIS_PROFILES:
+            key = self.profile_key(text, profile)
+            duration = self.durations.get(key)
+            if duration is None and pack is not None:
+                duration = pack.durations.get(key)
+            if duration is not None:
+                return duration
+        return None
+    
+    def _has_audio(self, key: str) -> bool:
+        """Whether the whole clip is available without a request"""
+        pack = self.pack
+        return key in self.preloaded or (pack is not None and key in pack) or key in self.cache
+    
+    def set_pack(self, pack):
+        """Serve clips from a compiled lesson pack (None to drop it)"""
+        old, self.pack = self.pack, pack
+        if pack is not None:
+            # The pack is checked first, so the cache's copies would only take up space
+            self.cache.discard(list(pack.index))
+        if old is not None and old is not pack:
+            old.close()  # deferred until lookups already reading from it are done
+    
+    def preload(self, text: str, audio_data: bytes, output_format: str = None):
+        """Keep a synthesized clip in memory so speak() can play it immediately"""
+        key = self.cache_key(text, output_format)
+        self._remember_duration(key, audio_data)
+        with self.preload_lock:
+            self.preloaded[key] = audio_data
+            while len(self.preloaded) > PRELOAD_LIMIT:
+                self.preloaded.popitem(last=False)
+        if PYGAME_AVAILABLE and output_format == self.playback_format:
+            # Decode now, on the prefetch thread, so playback starts without decoding
+            # (an MP3 was already decoded above, this is a cache hit)
+            self.sounds.decode(key, audio_data)
+    
+    def clear_preloaded(self):
+        """Drop all preloaded clips (e.g. when the lesson changes)"""
+        with self.preload_lock:
+            self.preloaded.clear()
+    
+    def speak_stream(self, text: str, is_cancelled=lambda: False, profile: str = "quality") -> bool:
+        """
+        Speak text, starting playback as soon as the first audio arrives
+        
+        Args:
+            text (str): Text to speak
+            is_cancelled (callable): Abandons the download and playback when it returns True
+            profile (str): Synthesis profile (see SYNTHESIS_PROFILES)
+        
+        Returns:
+            bool: True if the whole clip was played
+        """
+        stream_format = self.profile_format(profile)
+        key = self.profile_key(text, profile)
+        audio_data = self._lookup(key)
+        if audio_data is not None:
+            print(f"💾 Cached speech for: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+            return self._play_audio_pygame(audio_data, is_cancelled, key)
+        
+        if not self.api_key:
+            print("❌ Eleven Labs API key not configured")
+            return False
+        
+        print(f"🎤 Streaming speech for: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+        
+        player = None
+        complete = False
         try:
+            budget = self._budget()
+            start = time.perf_counter()
+            with self.remote.open(text, stream_format, stream=True, latency_budget=budget,
+                                  model_id=self.profile_model(profile)) as response:
+                self._record_remote(time.perf_counter() - start, budget)
+                player = PcmStreamPlayer(pcm_rate(stream_format), events=self.events)
+                self.stream_player = player
+                if self.paused:
+                    player.pause()
+                
+                for chunk in response.iter_content(chunk_size=CHUNK_BYTES):
+                    if is_cancelled():
+                        break  # stopped: abandon the download
+                    started = player.started_at is not None
+                    player.feed(chunk)
+                    if not started and player.started_at is not None:
+                        self._playback_started(player.started_at)
+                else:
+                    complete = True
+            
+            # A clip shorter than the start buffer only starts here
+            started = player.started_at is not None
+            player.finish(is_cancelled)
+            if not started:
+                self._playback_started(player.started_at)
+            
+            if complete:
+                audio_data = player.wav()
+                self._remember_duration(key, audio_data)
+                self.cache.put(key, audio_data)
+            if player.underruns:
+                print(f"⚠️ Streaming playback ran dry {player.underruns} time(s)")
+            if is_cancelled():
+                return False
+            print("✅ Audio playback completed")
+            return player.started_at is not None
+        
+        except Exception as e:
+            if player is None or player.started_at is None:
+                # Nothing heard yet: let speak() switch to the local engine
+                if player is None:
+                    self.backend_stats.record(self.remote.name, failed=True)
+                if self.local is not None and not is_cancelled():
+                    if isinstance(e, RemoteUnavailable):
+                        raise
+                    raise RemoteUnavailable(str(e)) from e
+            print(f"❌ Error in streaming TTS: {e}")
+            return False
+        finally:
+            if self.stream_player is player:
+                self.stream_player = None
+    
+    def _playback_started(self, started_at: float = None):
+        if started_at is not None:
+            self.segment_started = started_at
+        self._record_first_sound(started_at)
+    
+    def _record_first_sound(self, started_at: float = None):
+        if self.speak_started is None or started_at is None:
+            return
+        elapsed_ms = (started_at - self.speak_started) * 1000
+        self.first_sound_ms.append(elapsed_ms)
+        self.speak_started = None
+        if self.current_tier is not None:
+            self.tier_stats.record(self.current_tier, elapsed_ms / 1000)
+        print(f"⚡ First sound after {elapsed_ms:.0f} ms ({self.current_tier})")
+    
+    def synthesize(self, text: str, output_format: str = None, is_cancelled=None, latency_budget: float = None,
+                   model_id: str = None):
+        """
+        Get the audio for text, from the cache or from Eleven Labs
+        
+        Args:
+            text (str): Text to synthesize
+            output_format (str): Eleven Labs output format (default: MP3);
+                                 pcm_* formats are returned as WAV
+            is_cancelled (callable): Abandons the download when it returns True
+            latency_budget (float): Give up without retrying if the response takes longer to start
+            model_id (str): Synthesis model (default: the service's)
+        
+        Returns:
+            bytes: Audio, or None if synthesis is not possible or was cancelled
+        
+        Raises:
+            RemoteUnavailable: If the request failed
+        """
+        key = self.cache_key(text, output_format, model_id)
+        audio_data = self._lookup(key)
+        if audio_data is not None:
+            print(f"💾 Cached speech for: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+            return audio_data
+        
+        if not self.api_key:
+            print("❌ Eleven Labs API key not configured")
+            return None
+        
+        print(f"🎤 Generating speech for: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+        
+        start = time.perf_counter()
+        try:
+            audio_data = self.remote.synthesize(text, output_format, is_cancelled, latency_budget, model_id)
+        except RemoteUnavailable:
+            self.backend_stats.record(self.remote.name, failed=True)
+            raise
+        if audio_data is None:
+            return None
+        self._record_remote(time.perf_counter() - start, latency_budget)
+        
+        self._remember_duration(key, audio_data)
+        self.cache.put(key, audio_data)
+        return audio_data
+    
+    def _route_local(self, key: str) -> bool:
+        """Whether an utterance should be synthesized by the local engine"""
+        if self.local is None or self._has_audio(key):
+            return False  # cached remote clips keep the remote voice
+        return LOCAL_WHEN_UNCACHED or not self.api_key or time.monotonic() < self.remote_down_until
+    
+    def _budget(self):
+        # Only worth giving up on the remote early if there is something to fall back to
+        return self.latency_budget if self.local is not None else None
+    
+    def _record_remote(self, seconds: float, budget: float = None):
+        self.backend_stats.record(self.remote.name, seconds)
+        if budget is not None and seconds > budget:
+            self._remote_missed(f"{seconds:.2f}s > {budget:.2f}s budget")
+    
+    def _remote_missed(self, reason):
+        self.remote_down_until = time.monotonic() + REMOTE_COOLDOWN
+        print(f"⚠️ {self.remote.name} unavailable ({reason}), using {self.local.name} for {REMOTE_COOLDOWN:.0f}s")
+    
+    def _speak_local(self, text: str, is_cancelled=lambda: False) -> bool:
+        """
+        Speak text with the local engine (not cached: the remote voice replaces it once available)
+        
+        Returns:
+            bool: True if the whole clip was played
+        """
+        self.current_tier = self.local.name
+        print(f"🗣️ Local speech ({self.local.name}) for: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+        start = time.perf_counter()
+        try:
+            audio_data = self.local.synthesize(text, is_cancelled=is_cancelled)
+        except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+            self.backend_stats.record(self.local.name, failed=True)
+            print(f"❌ Local TTS failed: {e}")
+            return False
+        if audio_data is None or is_cancelled():
+            return False
+        self.backend_stats.record(self.local.name, time.perf_counter() - start)
+        
+        if PYGAME_AVAILABLE:
+            return self._play_audio_pygame(audio_data, is_cancelled)
+        self._play_audio_system(audio_data)
+        return True
+    
+    def _play_audio_pygame(self, audio_data: bytes, is_cancelled=lambda: False, key: str = None) -> bool:
+        """
+        Play audio directly using pygame, blocking until the end-of-track event
+        
+        Args:
+            audio_data (bytes): Encoded clip
+            is_cancelled (callable): Stops waiting when it returns True
+            key (str): Cache key; the clip is decoded once and replayed from the sound cache
+        
+        Returns:
+            bool: True if the clip played to the end
+        """
+        try:
+            sound = None
+            if key is not None:
+                sound = self.sounds.get(key) or self.sounds.decode(key, audio_data)
+            
+            # Paused while synthesizing: start once resumed
+            while not self.resumed.wait(0.1):
+                if is_cancelled():
+                    return False
+            
+            if sound is not None:
+                return self._play_sound(sound, is_cancelled)
+            
             # Create a file-like object from the audio data
             audio_stream = io.BytesIO(audio_data)
             
             # Load and play the audio
             pygame.mixer.music.load(audio_stream)
             pygame.mixer.music.play()
+            self._playback_started(time.perf_counter())
             
             print("🔊 Playing audio with pygame...")
             
-            # Wait for audio to finish
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
+            # Wait for audio to finish (a paused clip isn't finished)
+            self.events.wait_music(lambda: self.paused or pygame.mixer.music.get_busy(), is_cancelled)
+            if is_cancelled():
+                return False
             
-            self.is_speaking = False
             print("✅ Audio playback completed")
+            return True
             
         except Exception as e:
             print(f"❌ Error playing audio with pygame: {e}")
-            self.is_speaking = False
+            return False
+    
+    def _play_sound(self, sound, is_cancelled=lambda: False) -> bool:
+        """Play a decoded clip on a free channel, blocking until its end event"""
+        channel = pygame.mixer.find_channel(True)
+        if self.events.available:
+            channel.set_endevent(CHANNEL_END)
+        self.sound_channel = channel
+        try:
+            channel.play(sound)
+            self._playback_started(time.perf_counter())
+            
+            # Wait for the sound to finish (a paused clip isn't finished)
+            self.events.wait_channel(lambda: self.paused or channel.get_busy(), is_cancelled)
+            if is_cancelled():
+                return False
+            
+            print("✅ Audio playback completed")
+            return True
+        finally:
+            if self.sound_channel is channel:
+                self.sound_channel = None
     
     def _play_audio_system(self, audio_data: bytes):
         """Play audio using system player (fallback)"""
@@ -203,14 +704,82 @@ class TTSService:
         except Exception as e:
             print(f"❌ Error playing audio: {e}")
     
+    def pause(self) -> bool:
+        """
+        Pause the current utterance, keeping its audio and playback position
+        
+        Returns:
+            bool: False if nothing is being spoken (or it is already paused)
+        """
+        if not self.is_speaking or self.paused:
+            return False
+        self.paused = True
+        self.resumed.clear()
+        if PYGAME_AVAILABLE:
+            pygame.mixer.music.pause()
+            if self.stream_player is not None:
+                self.stream_player.pause()
+            if self.sound_channel is not None:
+                self.sound_channel.pause()
+        self.pause_was_playing = self.segment_started is not None
+        if self.pause_was_playing:
+            self.played += time.perf_counter() - self.segment_started
+            self.segment_started = None
+        # Restarting instead would need a new request unless the whole clip is cached
+        self.pause_needs_request = self.current_key is not None and not self._has_audio(self.current_key)
+        self.resume_stats["pauses"] += 1
+        print(f"⏸️ Paused speech after {self.played:.1f}s")
+        return True
+    
+    def resume(self) -> bool:
+        """
+        Continue a paused utterance from where it stopped
+        
+        Returns:
+            bool: False if nothing was paused
+        """
+        if not self.paused:
+            return False
+        self.paused = False
+        if PYGAME_AVAILABLE:
+            pygame.mixer.music.unpause()
+            if self.stream_player is not None:
+                self.stream_player.resume()
+            if self.sound_channel is not None:
+                self.sound_channel.unpause()
+        if self.pause_was_playing:
+            self.segment_started = time.perf_counter()
+        self.resumed.set()
+        
+        self.resume_stats["resumes"] += 1
+        self.resume_stats["audio_seconds_saved"] += self.played
+        self.resume_stats["api_calls_saved"] += int(self.pause_needs_request)
+        print(f"▶️ Resumed speech at {self.played:.1f}s")
+        return True
+    
     def stop(self) -> bool:
-        """Stop current TTS"""
+        """Stop current TTS, including utterances from speak_async that haven't started yet"""
+        with self.utterance_lock:
+            self.stops += 1
+        return self._halt()
+    
+    def _halt(self) -> bool:
+        """Stop whatever is playing (a newer speak() preempting it, or stop())"""
         try:
             self.is_speaking = False
+            self.paused = False
+            self.resumed.set()
+            with self.utterance_lock:
+                self.utterance += 1
             
             # Stop pygame if playing
             if PYGAME_AVAILABLE:
                 pygame.mixer.music.stop()
+                if self.stream_player is not None:
+                    self.stream_player.stop()
+                if self.sound_channel is not None:
+                    self.sound_channel.stop()
+                self.events.notify()
             
             # Clean up current audio file
             if self.current_audio_file and self.current_audio_file.exists():
@@ -230,6 +799,59 @@ class TTSService:
     def get_speaking_status(self) -> bool:
         """Check if currently speaking"""
         return self.is_speaking
+    
+    def get_cache_stats(self) -> dict:
+        """Audio cache hit/miss counters and size"""
+        return self.cache.get_stats()
+    
+    def get_sound_stats(self) -> dict:
+        """Decoded clip cache hit/miss counters, size and decode time"""
+        return self.sounds.get_stats()
+    
+    def get_pack_stats(self) -> dict:
+        """Compiled lesson pack size and clips served from it"""
+        pack = self.pack
+        return pack.get_stats() if pack is not None else {"clips": 0}
+    
+    def get_transport_stats(self) -> dict:
+        """HTTP request counts, retries and latency"""
+        return self.transport.get_stats()
+    
+    def get_backend_stats(self) -> dict:
+        """Requests, failures and latency until audio could start, per synthesis backend"""
+        return self.backend_stats.get_stats()
+    
+    def get_tier_stats(self) -> dict:
+        """Utterances and time to first sound per synthesis profile that served them"""
+        return self.tier_stats.get_stats()
+    
+    def get_resume_stats(self) -> dict:
+        """Pauses, resumes, and the replayed audio / synthesis requests they avoided"""
+        stats = dict(self.resume_stats)
+        stats["audio_seconds_saved"] = round(stats["audio_seconds_saved"], 1)
+        return stats
+    
+    def get_latency_stats(self) -> dict:
+        """Time from speak() to the first audible sound, in ms"""
+        samples = sorted(self.first_sound_ms)
+        if not samples:
+            return {"count": 0}
+        return {
+            "count": len(samples),
+            "last_ms": round(self.first_sound_ms[-1], 1),
+            "p50_ms": round(samples[len(samples) // 2], 1),
+            "max_ms": round(samples[-1], 1)
+        }
+
+# Global instance, created on first use: importing this module doesn't touch the mixer
+_tts = None
+_tts_lock = threading.Lock()
 
-# Create global instance
-tts = TTSService() 
\ No newline at end of file
+def get_tts() -> TTSService:
+    """The shared TTSService (initializes pygame's mixer the first time)"""
+    global _tts
+    with _tts_lock:
+        if _tts is None:
+            report_env()
+            _tts = TTSService()
+    return _tts 
@@ -0,0 +1,119 @@
+"""
+Decoded clips kept in memory for instant playback.
+
+pygame.mixer.music.load decodes the MP3/WAV bytes again every time a clip
+is played, so replaying a bullet (or playing a prefetched one) pays the
+decode on the teaching thread. SoundCache keeps pygame.mixer.Sound objects
+(PCM already converted to the mixer's format) by cache key and evicts the
+least recently played ones once their total size exceeds the byte limit.
+A cached Sound starts on a free mixer channel in a few milliseconds, and
+channels can overlap without touching the music stream.
+"""
+
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+SOUND_CACHE_BYTES = int(float(os.getenv("TTS_SOUND_CACHE_MB", "64")) * 1024 * 1024)  # decoded PCM kept
+
+
+def sound_bytes(sound) -> int:
+    """Memory a decoded Sound takes in the mixer's format"""
+    rate, size, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * rate) * channels * (abs(size) // 8)
+
+
+class SoundCache:
+    def __init__(self, limit_bytes: int = SOUND_CACHE_BYTES):
+        """
+        Args:
+            limit_bytes (int): Total decoded size kept before the least recently played clips are dropped
+        """
+        self.limit_bytes = limit_bytes
+        self.lock = threading.Lock()
+        self.sounds = OrderedDict()  # key -> (Sound, bytes)
+        self.total_bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.decode_ms = 0.0
+
+    def __contains__(self, key: str) -> bool:
+        with self.lock:
+            return key in self.sounds
+
+    def get(self, key: str):
+        """
+        The decoded clip for key
+
+        Returns:
+            pygame.mixer.Sound: Or None if it isn't cached
+        """
+        with self.lock:
+            entry = self.sounds.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.sounds.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def decode(self, key: str, audio_data: bytes):
+        """
+        Decode a clip into the cache (or return the cached one)
+
+        Returns:
+            pygame.mixer.Sound: Or None if the mixer can't decode it or it exceeds the limit
+        """
+        with self.lock:
+            entry = self.sounds.get(key)
+            if entry is not None:
+                self.sounds.move_to_end(key)
+                return entry[0]
+
+        start = time.perf_counter()
+        try:
+            sound = pygame.mixer.Sound(file=io.BytesIO(audio_data))
+        except pygame.error as e:
+            print(f"⚠️ Could not decode clip into a Sound: {e}")
+            return None
+        size = sound_bytes(sound)
+
+        with self.lock:
+            self.decode_ms += (time.perf_counter() - start) * 1000
+            if size > self.limit_bytes:
+                return sound  # playable, but never cached
+            if key not in self.sounds:
+                self.sounds[key] = (sound, size)
+                self.total_bytes += size
+            while self.total_bytes > self.limit_bytes:
+                _, (_, evicted) = self.sounds.popitem(last=False)
+                self.total_bytes -= evicted
+                self.evictions += 1
+            return sound
+
+    def clear(self):
+        with self.lock:
+            self.sounds.clear()
+            self.total_bytes = 0
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters, evictions, decoded size and time spent decoding"""
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "clips": len(self.sounds),
+                "size_mb": round(self.total_bytes / (1024 * 1024), 2),
+                "decode_ms": round(self.decode_ms, 1)
+            }
@@ -0,0 +1,171 @@
+"""
+Play TTS audio while it is still downloading.
+
+pygame.mixer.music can't start an MP3 that is still arriving, so streaming
+synthesis asks Eleven Labs for raw 16-bit mono PCM (output_format=pcm_*)
+and PcmStreamPlayer turns the chunks into pygame Sounds queued back to
+back on one mixer channel. Playback starts once STREAM_START_MS of audio
+is buffered; the rest is queued as it arrives. The complete clip is
+returned as a WAV so it can be cached and replayed with the normal path.
+"""
+
+import io
+import time
+import wave
+
+import numpy as np
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+from tts_playback import CHANNEL_END
+
+STREAM_FORMAT = "pcm_22050"
+STREAM_START_MS = 250  # audio buffered before playback starts
+STREAM_QUEUE_MS = 100  # smallest chunk queued behind the playing one
+CHUNK_BYTES = 4096     # HTTP read size
+
+
+def pcm_rate(output_format: str) -> int:
+    """Sample rate of an Eleven Labs pcm_<rate> output format"""
+    return int(output_format.split("_")[1])
+
+
+def pcm_to_wav(pcm: bytes, rate: int) -> bytes:
+    """Wrap 16-bit mono PCM in a WAV container (a trailing odd byte is dropped)"""
+    pcm = pcm[:len(pcm) - len(pcm) % 2]
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def audio_duration(audio_data: bytes):
+    """
+    Length of a clip in seconds
+
+    Returns:
+        float: Duration, or None if it can't be determined (MP3 without a mixer)
+    """
+    if audio_data[:4] == b"RIFF":
+        with wave.open(io.BytesIO(audio_data)) as wav:
+            return wav.getnframes() / wav.getframerate()
+    if pygame is None or not pygame.mixer.get_init():
+        return None
+    try:
+        return pygame.mixer.Sound(file=io.BytesIO(audio_data)).get_length()
+    except pygame.error:
+        return None
+
+
+class PcmStreamPlayer:
+    def __init__(self, rate: int, channel=None, start_ms: int = STREAM_START_MS, queue_ms: int = STREAM_QUEUE_MS,
+                 events=None):
+        """
+        Args:
+            rate (int): Sample rate of the incoming 16-bit mono PCM
+            channel (pygame.mixer.Channel): Channel to play on (default: a free one)
+            start_ms (int): Audio to buffer before starting playback
+            queue_ms (int): Smallest chunk to queue behind the playing one
+            events (PlaybackEvents): End-of-sound events to wait on instead of polling
+        """
+        mixer_rate, size, channels = pygame.mixer.get_init()
+        if size != -16:
+            raise RuntimeError(f"❌ Streaming playback needs a 16-bit mixer (got {size})")
+
+        self.rate = rate
+        self.mixer_rate = mixer_rate
+        self.mixer_channels = channels
+        self.channel = channel or pygame.mixer.find_channel(True)
+        self.start_bytes = int(rate * start_ms / 1000) * 2
+        self.queue_bytes = int(rate * queue_ms / 1000) * 2
+        self.events = events
+        if events is not None and events.available:
+            self.channel.set_endevent(CHANNEL_END)
+
+        self.pcm = bytearray()  # everything received, for the cache
+        self.pending = bytearray()  # received but not yet handed to the mixer
+        self.started_at = None
+        self.underruns = 0
+        self.paused = False
+
+    def _to_sound(self, pcm: bytes):
+        samples = np.frombuffer(pcm, dtype="<i2")
+        if self.mixer_rate != self.rate:
+            # Linear resample to the mixer rate
+            count = int(len(samples) * self.mixer_rate / self.rate)
+            positions = np.arange(count) * (self.rate / self.mixer_rate)
+            samples = np.interp(positions, np.arange(len(samples)), samples).astype(np.int16)
+        if self.mixer_channels > 1:
+            samples = np.repeat(samples[:, None], self.mixer_channels, axis=1)
+        return pygame.mixer.Sound(buffer=np.ascontiguousarray(samples).tobytes())
+
+    def _flush(self, final: bool = False) -> bool:
+        # Keep whole samples only; an odd trailing byte waits for the next chunk
+        usable = len(self.pending) - len(self.pending) % 2
+        if usable == 0 or self.paused:
+            return False
+
+        if self.started_at is None:
+            if usable < self.start_bytes and not final:
+                return False
+            self.channel.play(self._to_sound(bytes(self.pending[:usable])))
+            self.started_at = time.perf_counter()
+        elif not self.channel.get_busy():
+            # The network fell behind playback: restart with what we have
+            self.underruns += 1
+            self.channel.play(self._to_sound(bytes(self.pending[:usable])))
+        elif self.channel.get_queue() is None and (usable >= self.queue_bytes or final):
+            self.channel.queue(self._to_sound(bytes(self.pending[:usable])))
+        else:
+            return False
+
+        del self.pending[:usable]
+        return True
+
+    def feed(self, chunk: bytes):
+        """Add a downloaded chunk; starts or extends playback when enough is buffered"""
+        self.pcm.extend(chunk)
+        self.pending.extend(chunk)
+        self._flush()
+
+    def _busy(self) -> bool:
+        return self.paused or self.channel.get_busy() or self.channel.get_queue() is not None
+
+    def finish(self, is_cancelled=lambda: False, poll_interval: float = 0.01):
+        """Queue the remaining audio and wait until playback ends (or is cancelled)"""
+        while self.pending and not is_cancelled():
+            if not self._flush(final=True):
+                # The queue slot frees when the playing sound ends
+                if self.events is not None:
+                    self.events.wait_channel(self._busy, is_cancelled, timeout=poll_interval * 10)
+                else:
+                    time.sleep(poll_interval)
+        if self.events is not None:
+            self.events.wait_channel(self._busy, is_cancelled)
+        else:
+            while self._busy() and not is_cancelled():
+                time.sleep(poll_interval)
+
+    def pause(self):
+        """Hold playback where it is; downloaded audio keeps buffering"""
+        self.paused = True
+        self.channel.pause()
+
+    def resume(self):
+        self.paused = False
+        self.channel.unpause()
+        self._flush()
+
+    def stop(self):
+        self.paused = False
+        self.channel.stop()
+
+    def wav(self) -> bytes:
+        """Everything received, as a WAV clip"""
+        return pcm_to_wav(bytes(self.pcm), self.rate)
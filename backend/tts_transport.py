@@ -0,0 +1,125 @@
+"""
+HTTP transport for TTS requests.
+
+The module-level requests.post opens a new TCP+TLS connection for every
+utterance, has no timeout (a hung request blocks the teaching thread
+forever) and no retry. TTSTransport keeps one requests.Session with a
+keep-alive connection pool, applies connect/read timeouts, retries
+connection errors, timeouts, 429 and 5xx responses a bounded number of
+times with jittered exponential backoff, and records per-request latency
+(time until the response headers arrive).
+"""
+
+import random
+import threading
+import time
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CONNECT_TIMEOUT = 3.05  # seconds to establish the connection
+READ_TIMEOUT = 20.0     # seconds between bytes of the response
+MAX_RETRIES = 2         # attempts after the first one
+BACKOFF = 0.25          # base delay; doubles per retry, with full jitter
+POOL_SIZE = 4           # kept-alive connections per host (prefetch workers + playback)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+STATS_WINDOW = 200      # latency samples kept
+
+
+class TTSTransport:
+    def __init__(self, connect_timeout: float = CONNECT_TIMEOUT, read_timeout: float = READ_TIMEOUT,
+                 max_retries: int = MAX_RETRIES, backoff: float = BACKOFF, pool_size: int = POOL_SIZE):
+        """
+        Args:
+            connect_timeout (float): Seconds allowed to connect
+            read_timeout (float): Seconds allowed between received bytes
+            max_retries (int): Retries after the first attempt
+            backoff (float): Base retry delay in seconds
+            pool_size (int): Keep-alive connections per host
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        self.session = requests.Session()
+        # Retries are done here (with jitter and stats), not by urllib3
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Stats
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=STATS_WINDOW)
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+
+    def _delay(self, attempt: int) -> float:
+        # Full jitter: uniform in [0, backoff * 2^attempt]
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    def post(self, url: str, max_retries: int = None, **kwargs) -> requests.Response:
+        """
+        POST with pooling, timeouts and retries
+
+        Args:
+            url (str): Request URL
+            max_retries (int): Retries for this request (default: the transport's)
+            **kwargs: Passed to requests.Session.post (json, headers, params, stream, ...)
+
+        Returns:
+            requests.Response: A successful (2xx) response
+
+        Raises:
+            requests.RequestException: When every attempt failed
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if max_retries is None:
+            max_retries = self.max_retries
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = self.session.post(url, **kwargs)
+                if response.status_code >= 400:
+                    # Release the pooled connection (a streamed body is never read) before raising;
+                    # retryable statuses are retried below
+                    response.close()
+                    response.raise_for_status()
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                retryable = not isinstance(e, requests.HTTPError) or (
+                    e.response is not None and e.response.status_code in RETRY_STATUSES)
+                if not retryable or attempt >= max_retries:
+                    with self.lock:
+                        self.requests += 1
+                        self.failures += 1
+                    raise
+                delay = self._delay(attempt)
+                print(f"⚠️ TTS request failed ({e}), retrying in {delay:.2f}s")
+                with self.lock:
+                    self.retries += 1
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            with self.lock:
+                self.requests += 1
+                self.latencies.append(time.perf_counter() - start)
+            return response
+
+    def close(self):
+        self.session.close()
+
+    def get_stats(self) -> dict:
+        """Request counts and latency until response headers, in ms"""
+        with self.lock:
+            latencies = sorted(self.latencies)
+            stats = {"requests": self.requests, "retries": self.retries, "failures": self.failures}
+        if latencies:
+            stats.update({
+                "latency_ms_p50": round(1000 * latencies[len(latencies) // 2], 1),
+                "latency_ms_p95": round(1000 * latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1),
+                "latency_ms_max": round(1000 * latencies[-1], 1)
+            })
+        return stats